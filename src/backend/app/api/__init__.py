@@ -13,6 +13,7 @@ from flask import Blueprint  # version: 2.0+
 
 # Internal imports
 from .v1 import api_v1_bp
+from ..utils.constants import SECURITY_HEADERS_ITEMS
 
 # Create main API Blueprint
 # Requirement: API Layer - RESTful endpoints handling HTTP requests and responses
@@ -46,12 +47,8 @@ def init_app(app):
     @api_bp.after_request
     def add_security_headers(response):
         # Set security headers as defined in technical specification section 10.3.2
-        response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        response.headers['Content-Security-Policy'] = "default-src 'self'"
-        response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
+        for header, value in SECURITY_HEADERS_ITEMS:
+            response.headers[header] = value
         return response
     
     # Configure API error handling
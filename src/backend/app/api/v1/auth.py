@@ -12,14 +12,17 @@ Human Tasks:
 # External imports
 from flask import Blueprint, request, jsonify  # version: 2.0+
 from marshmallow import ValidationError  # version: 3.0+
+from pydantic import ValidationError as PydanticValidationError  # version: 2.0+
 from typing import Tuple, Dict, Any  # version: 3.9+
 from http import HTTPStatus
 
 # Internal imports
-from ...schemas.auth import LoginRequestSchema, LoginResponseSchema, TokenRefreshSchema
+from ...schemas.auth import LoginRequestModel, TokenRefreshSchema, login_response_schema
 from ...services.auth_service import AuthenticationService, AuthenticationError
 from ...cache.redis import RedisCache
 from ...middleware.request_validator import validate_schema
+from ...utils.exceptions import ValidationError as APIValidationError
+from ...utils.helpers import pydantic_validation_error
 
 # Create authentication blueprint
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/v1/auth')
@@ -28,7 +31,6 @@ auth_bp = Blueprint('auth', __name__, url_prefix='/api/v1/auth')
 auth_service = AuthenticationService(RedisCache())
 
 @auth_bp.route('/login', methods=['POST'])
-@validate_schema(LoginRequestSchema)
 def login() -> Tuple[Dict[str, Any], int]:
     """
     Handle Google OAuth login requests.
@@ -44,14 +46,17 @@ def login() -> Tuple[Dict[str, Any], int]:
         AuthenticationError: If Google token validation fails
     """
     try:
-        # Get validated Google token from request
-        google_token = request.get_json()['google_token']
+        # Validate request body and extract the stripped Google token
+        try:
+            google_token = LoginRequestModel.model_validate(request.get_json()).google_token
+        except PydanticValidationError as e:
+            raise pydantic_validation_error('AUTH003', e) from e
         
         # Authenticate with Google and get tokens
         auth_result = auth_service.authenticate_google_token(google_token)
         
         # Serialize response
-        response = LoginResponseSchema().dump({
+        response = login_response_schema.dump({
             'access_token': auth_result['access_token'],
             'refresh_token': auth_result['refresh_token'],
             'expires_in': 3600,  # 1 hour
@@ -60,6 +65,9 @@ def login() -> Tuple[Dict[str, Any], int]:
         
         return response, HTTPStatus.OK
         
+    except APIValidationError:
+        raise
+        
     except AuthenticationError as e:
         return {
             'error': 'Authentication failed',
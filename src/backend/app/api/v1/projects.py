@@ -17,7 +17,7 @@ from uuid import UUID  # version: 3.9+
 # Internal imports
 from ...services.project_service import ProjectService
 from ...middleware.auth import require_auth, get_current_user
-from ...schemas.project import ProjectSchema, ProjectCreateSchema, ProjectUpdateSchema
+from ...schemas.project import project_update_schema
 from ...utils.exceptions import (
     ResourceNotFoundError,
     AuthorizationError,
@@ -27,11 +27,6 @@ from ...utils.exceptions import (
 # Create Blueprint for project routes
 projects_blueprint = Blueprint('projects', __name__)
 
-# Initialize schemas
-project_schema = ProjectSchema()
-project_create_schema = ProjectCreateSchema()
-project_update_schema = ProjectUpdateSchema()
-
 @projects_blueprint.route('/projects', methods=['POST'])
 @require_auth
 def create_project() -> Tuple[Dict, int]:
@@ -52,11 +47,8 @@ def create_project() -> Tuple[Dict, int]:
         # Get current authenticated user
         current_user = get_current_user()
         
-        # Extract and validate project data from request
+        # Extract project data from request; the service validates it
         project_data = request.get_json()
-        errors = project_create_schema.validate(project_data)
-        if errors:
-            raise ValidationError('PRJ001', errors)
         
         # Create project using service
         project_service: ProjectService = request.app.project_service
@@ -10,26 +10,35 @@ Human Tasks:
 """
 
 # Internal imports
-from .redis import RedisCache
+from .redis import RedisCache, JsonSerializer, MsgpackSerializer, create_connection_pool
 from .keys import (
     make_key,
     make_project_key,
+    make_project_owner_key,
     make_spec_key,
+    make_project_specs_key,
     make_bullet_key,
     make_rate_limit_key,
     make_session_key,
+    make_user_email_key,
     DEFAULT_TTL
 )
 
 # Expose all required components for application-wide caching needs
 __all__ = [
     'RedisCache',          # Redis cache implementation
+    'JsonSerializer',     # JSON cache value serializer
+    'MsgpackSerializer',  # msgpack cache value serializer with JSON fallback
+    'create_connection_pool', # Shared Redis connection pool factory
     'make_key',           # Generic cache key generator
     'make_project_key',   # Project cache key generator
+    'make_project_owner_key', # Project owner cache key generator
     'make_spec_key',      # Specification cache key generator
+    'make_project_specs_key', # Project specification list cache key generator
     'make_bullet_key',    # Bullet item cache key generator
     'make_rate_limit_key', # Rate limit cache key generator
     'make_session_key',   # Session cache key generator
+    'make_user_email_key', # User-by-email lookup cache key generator
     'DEFAULT_TTL'         # Default cache TTL value
 ]
 
@@ -13,6 +13,7 @@ Human Tasks:
 """
 
 # External imports
+import hashlib  # version: 3.9+
 from typing import Union, List  # version: 3.9+
 
 # Internal imports
@@ -28,6 +29,16 @@ SPEC_PREFIX = 'spec'
 BULLET_PREFIX = 'bullet'
 RATE_LIMIT_PREFIX = 'rate'
 SESSION_PREFIX = 'session'
+USER_EMAIL_PREFIX = 'user_by_email'
+LAST_LOGIN_PREFIX = 'last_login'
+
+# Prefixes with their separator, so single-ID keys are built with one format
+# call instead of a list, per-component str() and a join
+_PROJECT_KEY_PREFIX = PROJECT_PREFIX + KEY_SEPARATOR
+_SPEC_KEY_PREFIX = SPEC_PREFIX + KEY_SEPARATOR
+_BULLET_KEY_PREFIX = BULLET_PREFIX + KEY_SEPARATOR
+_OWNER_KEY_SUFFIX = KEY_SEPARATOR + 'owner'
+_SPECS_KEY_SUFFIX = KEY_SEPARATOR + 'specs'
 
 def make_key(prefix: str, components: Union[str, int, List[Union[str, int]]]) -> str:
     """
@@ -66,7 +77,9 @@ def make_project_key(project_id: Union[str, int]) -> str:
     Returns:
         str: Cache key for project
     """
-    return make_key(PROJECT_PREFIX, project_id)
+    # The braces form a Redis Cluster hash tag shared by all keys of the
+    # project, so its payload, owner and specification list map to one slot
+    return f'{_PROJECT_KEY_PREFIX}{{{project_id}}}'
 
 def make_spec_key(spec_id: Union[str, int]) -> str:
     """
@@ -81,7 +94,40 @@ def make_spec_key(spec_id: Union[str, int]) -> str:
     Returns:
         str: Cache key for specification
     """
-    return make_key(SPEC_PREFIX, spec_id)
+    return f'{_SPEC_KEY_PREFIX}{spec_id}'
+
+def make_project_owner_key(project_id: Union[str, int]) -> str:
+    """
+    Generate cache key holding the owner ID of a project.
+    
+    Requirement: Performance Optimization - Cache key generation for performance
+    optimization using Redis
+    
+    Args:
+        project_id: Unique identifier of the project
+    
+    Returns:
+        str: Cache key for the project owner
+    """
+    return f'{_PROJECT_KEY_PREFIX}{{{project_id}}}{_OWNER_KEY_SUFFIX}'
+
+def make_project_specs_key(project_id: Union[str, int]) -> str:
+    """
+    Generate cache key for the specification list of a project.
+    
+    Shares the project's hash tag so it can be invalidated together with the
+    project keys on Redis Cluster.
+    
+    Requirement: Performance Optimization - Cache key generation for performance
+    optimization using Redis
+    
+    Args:
+        project_id: Unique identifier of the project
+    
+    Returns:
+        str: Cache key for the project's specification list
+    """
+    return f'{_PROJECT_KEY_PREFIX}{{{project_id}}}{_SPECS_KEY_SUFFIX}'
 
 def make_bullet_key(bullet_id: Union[str, int]) -> str:
     """
@@ -96,7 +142,7 @@ def make_bullet_key(bullet_id: Union[str, int]) -> str:
     Returns:
         str: Cache key for bullet item
     """
-    return make_key(BULLET_PREFIX, bullet_id)
+    return f'{_BULLET_KEY_PREFIX}{bullet_id}'
 
 def make_rate_limit_key(user_id: str, endpoint: str) -> str:
     """
@@ -125,4 +171,22 @@ def make_session_key(session_id: str) -> str:
     Returns:
         str: Cache key for session data
     """
-    return make_key(SESSION_PREFIX, session_id)
\ No newline at end of file
+    return make_key(SESSION_PREFIX, session_id)
+
+def make_user_email_key(email: str) -> str:
+    """
+    Generate cache key mapping an email address to a user ID.
+    
+    The normalized address is hashed so plaintext emails, which are encrypted
+    at rest, never appear in Redis key names.
+    
+    Requirement: Cache Management - Redis 6+ used as caching layer for session storage
+    
+    Args:
+        email: User email address
+    
+    Returns:
+        str: Cache key for the user lookup
+    """
+    digest = hashlib.sha256(email.lower().strip().encode('utf-8')).hexdigest()
+    return make_key(USER_EMAIL_PREFIX, digest)
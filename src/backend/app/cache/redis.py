@@ -11,14 +11,146 @@ Human Tasks:
 """
 
 # External imports
-from redis import Redis  # version: 6.0+
-from typing import Any, Optional  # version: 3.9+
+from contextlib import contextmanager  # version: 3.9+
+from redis import ConnectionPool, Redis, RedisError  # version: 6.0+
+from redis.client import Pipeline  # version: 6.0+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union  # version: 3.9+
 import json  # version: 3.9+
+import threading  # version: 3.9+
+import msgspec  # version: 0.18+
+import zstandard  # version: 0.15+
 
 # Internal imports
 from .keys import make_key, DEFAULT_TTL
 from ..utils.exceptions import DatabaseError
 
+# Leading bytes marking msgpack-encoded values, raw or zstd-compressed; JSON
+# text never starts with either
+MSGPACK_MARKER = b'\x01'
+ZSTD_MSGPACK_MARKER = b'\x02'
+
+# Value stored under keys recently found absent from the database; no
+# serializer output starts with a NUL byte
+MISS_SENTINEL = b'\x00'
+
+# Encoded payloads larger than this many bytes are compressed before storage
+COMPRESSION_THRESHOLD = 1024
+
+# Fast zstd level; larger values cost CPU for little extra ratio on JSON-like data
+COMPRESSION_LEVEL = 3
+
+# Increments a counter and starts its expiry only when the counter is created,
+# so a fixed window is not extended by later requests
+INCREMENT_SCRIPT = """
+local value = redis.call('INCR', KEYS[1])
+if value == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return value
+"""
+
+# Upper bound on sockets held by a shared connection pool
+DEFAULT_MAX_CONNECTIONS = 64
+
+def create_connection_pool(
+    host: str,
+    port: int,
+    password: Optional[str] = None,
+    db: Optional[int] = 0,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+) -> ConnectionPool:
+    """
+    Create a connection pool to be shared by every RedisCache in the process.
+    
+    Requirement: Cache Management - Redis 6+ used as caching layer
+    
+    Args:
+        host: Redis server hostname
+        port: Redis server port
+        password: Optional Redis password
+        db: Optional Redis database number
+        max_connections: Maximum number of pooled connections
+        
+    Returns:
+        ConnectionPool: Pool of keep-alive connections
+    """
+    return ConnectionPool(
+        host=host,
+        port=port,
+        password=password,
+        db=db,
+        max_connections=max_connections,
+        # Values may be binary msgpack, so responses stay as bytes
+        decode_responses=False,
+        socket_timeout=5.0,
+        socket_connect_timeout=5.0,
+        socket_keepalive=True,
+        retry_on_timeout=True
+    )
+
+class JsonSerializer:
+    """
+    Serializes cache values as JSON text.
+    
+    Requirement: Cache Management - Cache value serialization
+    """
+    
+    __slots__ = ()
+    
+    def dumps(self, value: Any) -> Union[str, bytes]:
+        """Encode a value for storage."""
+        return json.dumps(value)
+    
+    def loads(self, raw: Union[str, bytes]) -> Any:
+        """Decode a stored value."""
+        return json.loads(raw)
+
+class MsgpackSerializer:
+    """
+    Serializes cache values as marker-prefixed msgpack, zstd-compressing payloads
+    above COMPRESSION_THRESHOLD and reading legacy JSON values.
+    
+    Requirement: Performance Optimization - Cache implementation for performance
+    optimization using Redis
+    """
+    
+    __slots__ = ('_encoder', '_decoder', '_zstd')
+    
+    def __init__(self) -> None:
+        """Create the reusable msgspec encoder and decoder."""
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder()
+        
+        # zstd contexts must not be shared between threads, so each thread
+        # lazily creates its own compressor/decompressor pair
+        self._zstd = threading.local()
+    
+    def _contexts(self) -> Tuple[zstandard.ZstdCompressor, zstandard.ZstdDecompressor]:
+        """Return this thread's zstd compressor and decompressor."""
+        contexts = getattr(self._zstd, 'contexts', None)
+        if contexts is None:
+            contexts = self._zstd.contexts = (
+                zstandard.ZstdCompressor(level=COMPRESSION_LEVEL),
+                zstandard.ZstdDecompressor()
+            )
+        return contexts
+    
+    def dumps(self, value: Any) -> Union[str, bytes]:
+        """Encode a value as msgpack behind the format marker, compressing large payloads."""
+        payload = self._encoder.encode(value)
+        if len(payload) > COMPRESSION_THRESHOLD:
+            return ZSTD_MSGPACK_MARKER + self._contexts()[0].compress(payload)
+        return MSGPACK_MARKER + payload
+    
+    def loads(self, raw: Union[str, bytes]) -> Any:
+        """Decode a msgpack value, falling back to JSON for values written before the switch."""
+        marker = raw[:1]
+        if marker == MSGPACK_MARKER:
+            return self._decoder.decode(memoryview(raw)[1:])
+        if marker == ZSTD_MSGPACK_MARKER:
+            return self._decoder.decode(self._contexts()[1].decompress(memoryview(raw)[1:]))
+        return json.loads(raw)
+
 class RedisCache:
     """
     Redis cache implementation providing caching functionality with Redis backend.
@@ -33,7 +165,8 @@ class RedisCache:
         port: int,
         password: Optional[str] = None,
         db: Optional[int] = 0,
-        default_ttl: Optional[int] = None
+        default_ttl: Optional[int] = None,
+        serializer: Optional[Union[JsonSerializer, MsgpackSerializer]] = None
     ) -> None:
         """
         Initialize Redis cache with connection parameters.
@@ -44,31 +177,90 @@ class RedisCache:
             password: Optional Redis password
             db: Optional Redis database number
             default_ttl: Optional default TTL for cache entries
+            serializer: Value serializer, defaults to MsgpackSerializer
+        
+        Raises:
+            DatabaseError: If Redis connection fails
+        """
+        self._setup(
+            create_connection_pool(host, port, password, db),
+            default_ttl,
+            serializer
+        )
+
+    @classmethod
+    def from_pool(
+        cls,
+        pool: ConnectionPool,
+        default_ttl: Optional[int] = None,
+        serializer: Optional[Union[JsonSerializer, MsgpackSerializer]] = None
+    ) -> 'RedisCache':
+        """
+        Create a cache backed by an existing shared connection pool.
+        
+        Args:
+            pool: Connection pool created by create_connection_pool
+            default_ttl: Optional default TTL for cache entries
+            serializer: Value serializer, defaults to MsgpackSerializer
+            
+        Returns:
+            RedisCache: Cache reusing the pool's connections
+            
+        Raises:
+            DatabaseError: If Redis connection fails
+        """
+        cache = cls.__new__(cls)
+        cache._setup(pool, default_ttl, serializer)
+        return cache
+
+    def _setup(
+        self,
+        pool: ConnectionPool,
+        default_ttl: Optional[int],
+        serializer: Optional[Union[JsonSerializer, MsgpackSerializer]]
+    ) -> None:
+        """
+        Bind the client to a connection pool and verify connectivity.
         
         Raises:
             DatabaseError: If Redis connection fails
         """
         try:
-            self._client = Redis(
-                host=host,
-                port=port,
-                password=password,
-                db=db,
-                decode_responses=True,
-                socket_timeout=5.0,
-                socket_connect_timeout=5.0,
-                retry_on_timeout=True
-            )
+            self._client = Redis(connection_pool=pool)
             # Test connection
             self._client.ping()
             
             # Set default TTL
             self._default_ttl = default_ttl or DEFAULT_TTL
+            self._serializer = serializer or MsgpackSerializer()
+            
+            # Registered once; redis-py invokes it via EVALSHA
+            self._increment_script = self._client.register_script(INCREMENT_SCRIPT)
             
         except Exception as e:
             raise DatabaseError() from e
 
-    def get(self, key: str) -> Optional[Any]:
+    @property
+    def client(self) -> Redis:
+        """
+        Underlying Redis client, e.g. for health checks.
+        
+        Returns:
+            Redis: Configured Redis client instance
+        """
+        return self._client
+
+    @property
+    def serializer(self) -> Union[JsonSerializer, MsgpackSerializer]:
+        """
+        Value serializer with its reusable encoder, for values queued on pipelines.
+        
+        Returns:
+            Union[JsonSerializer, MsgpackSerializer]: Serializer used by this cache
+        """
+        return self._serializer
+
+    def get(self, key: str, negative: Any = None) -> Optional[Any]:
         """
         Retrieve value from cache by key.
         
@@ -77,6 +269,8 @@ class RedisCache:
         
         Args:
             key: Cache key to retrieve
+            negative: Value returned, without decoding, when the key holds
+                MISS_SENTINEL
             
         Returns:
             Optional[Any]: Cached value if exists, None otherwise
@@ -86,9 +280,89 @@ class RedisCache:
         """
         try:
             value = self._client.get(key)
-            if value is not None:
-                return json.loads(value)
-            return None
+            if value is None:
+                return None
+            if value == MISS_SENTINEL:
+                return negative
+            return self._serializer.loads(value)
+        except Exception as e:
+            raise DatabaseError() from e
+
+    def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve a value stored without serialization.
+        
+        Args:
+            key: Cache key to retrieve
+            
+        Returns:
+            Optional[bytes]: Stored bytes if the key exists, None otherwise
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        try:
+            return self._client.get(key)
+        except Exception as e:
+            raise DatabaseError() from e
+
+    def get_with_raw(
+        self,
+        key: str,
+        raw_key: str,
+        negative: Any = None
+    ) -> Tuple[Optional[Any], Optional[bytes]]:
+        """
+        Retrieve a serialized value and an unserialized one in a single MGET.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            key: Cache key of the serialized value
+            raw_key: Cache key of the value stored without serialization
+            negative: Value returned for key, without decoding, when it holds
+                MISS_SENTINEL
+            
+        Returns:
+            Tuple[Optional[Any], Optional[bytes]]: Decoded value and raw bytes,
+                None for missing keys
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        try:
+            value, raw = self._client.mget((key, raw_key))
+            if value is None:
+                return None, raw
+            if value == MISS_SENTINEL:
+                return negative, raw
+            return self._serializer.loads(value), raw
+        except Exception as e:
+            raise DatabaseError() from e
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """
+        Retrieve several values in a single MGET round-trip.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            keys: Cache keys to retrieve
+            
+        Returns:
+            List[Optional[Any]]: Cached values in key order, None for missing keys
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        try:
+            loads = self._serializer.loads
+            return [
+                None if value is None or value == MISS_SENTINEL else loads(value)
+                for value in self._client.mget(keys)
+            ]
         except Exception as e:
             raise DatabaseError() from e
 
@@ -111,7 +385,7 @@ class RedisCache:
             DatabaseError: If Redis operation fails
         """
         try:
-            serialized = json.dumps(value)
+            serialized = self._serializer.dumps(value)
             return self._client.set(
                 name=key,
                 value=serialized,
@@ -120,6 +394,138 @@ class RedisCache:
         except Exception as e:
             raise DatabaseError() from e
 
+    def set_miss(self, key: str, ttl: int) -> bool:
+        """
+        Record that a key's entity is absent so repeated lookups skip the database.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            key: Cache key of the missing entity
+            ttl: TTL in seconds, kept short so new data is picked up quickly
+            
+        Returns:
+            bool: True if successful, False otherwise
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        try:
+            return bool(self._client.set(name=key, value=MISS_SENTINEL, ex=ttl))
+        except Exception as e:
+            raise DatabaseError() from e
+
+    def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        raw: Optional[Dict[str, Union[str, bytes]]] = None,
+        delete: Optional[Sequence[str]] = None
+    ) -> bool:
+        """
+        Store several values with one pipelined round-trip.
+        
+        Requirement: Cache Management - Redis 6+ used as caching layer for query caching
+        
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Optional TTL in seconds, defaults to instance default_ttl
+            raw: Optional mapping of cache keys to plain strings or bytes stored
+                without serialization
+            delete: Optional cache keys removed in the same round-trip
+            
+        Returns:
+            bool: True if every value was stored
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        if not items and not raw and not delete:
+            return True
+        try:
+            ex = ttl or self._default_ttl
+            dumps = self._serializer.dumps
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(name=key, value=dumps(value), ex=ex)
+            if raw:
+                for key, value in raw.items():
+                    pipe.set(name=key, value=value, ex=ex)
+            if delete:
+                pipe.delete(*delete)
+            results = pipe.execute()
+            # The DEL reply is a count, not a SET acknowledgement
+            return all(results[:-1] if delete else results)
+        except Exception as e:
+            raise DatabaseError() from e
+
+    def write_batch(
+        self,
+        writes: Sequence[Tuple[
+            Dict[str, Any],
+            Optional[int],
+            Optional[Dict[str, Union[str, bytes]]],
+            Optional[Sequence[str]]
+        ]]
+    ) -> None:
+        """
+        Apply several set_many() calls in order with one pipelined round-trip.
+        
+        Requirement: Cache Management - Redis 6+ used as caching layer for query caching
+        
+        Args:
+            writes: Sequence of (items, ttl, raw, delete) tuples with the same
+                meaning as the set_many() arguments
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        if not writes:
+            return
+        try:
+            dumps = self._serializer.dumps
+            pipe = self._client.pipeline(transaction=False)
+            for items, ttl, raw, delete in writes:
+                ex = ttl or self._default_ttl
+                for key, value in items.items():
+                    pipe.set(name=key, value=dumps(value), ex=ex)
+                if raw:
+                    for key, value in raw.items():
+                        pipe.set(name=key, value=value, ex=ex)
+                if delete:
+                    pipe.delete(*delete)
+            pipe.execute()
+        except Exception as e:
+            raise DatabaseError() from e
+
+    def set_if_absent(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Store value only if the key does not exist, atomically via SET NX.
+        
+        Requirement: Cache Management - Redis 6+ used as caching layer for session storage
+        
+        Args:
+            key: Cache key to store
+            value: Value to cache
+            ttl: Optional TTL in seconds, defaults to instance default_ttl
+            
+        Returns:
+            bool: True if the value was stored, False if the key already existed
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        try:
+            return bool(self._client.set(
+                name=key,
+                value=self._serializer.dumps(value),
+                ex=ttl or self._default_ttl,
+                nx=True
+            ))
+        except Exception as e:
+            raise DatabaseError() from e
+
     def delete(self, key: str) -> bool:
         """
         Remove value from cache by key.
@@ -140,6 +546,28 @@ class RedisCache:
         except Exception as e:
             raise DatabaseError() from e
 
+    def delete_many(self, keys: Sequence[str]) -> int:
+        """
+        Remove several values with a single multi-key DEL.
+        
+        Requirement: Cache Management - Cache entry removal functionality
+        
+        Args:
+            keys: Cache keys to delete
+            
+        Returns:
+            int: Number of keys that existed and were deleted
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        if not keys:
+            return 0
+        try:
+            return int(self._client.delete(*keys))
+        except Exception as e:
+            raise DatabaseError() from e
+
     def increment(self, key: str, ttl: Optional[int] = None) -> int:
         """
         Increment counter value for rate limiting.
@@ -157,12 +585,10 @@ class RedisCache:
             DatabaseError: If Redis operation fails
         """
         try:
-            pipe = self._client.pipeline()
-            pipe.incr(key)
             if ttl:
-                pipe.expire(key, ttl)
-            results = pipe.execute()
-            return int(results[0])
+                # INCR and first-use EXPIRE run atomically server-side
+                return int(self._increment_script(keys=[key], args=[ttl]))
+            return int(self._client.incr(key))
         except Exception as e:
             raise DatabaseError() from e
 
@@ -181,4 +607,26 @@ class RedisCache:
         try:
             return self._client.flushdb()
         except Exception as e:
-            raise DatabaseError() from e
\ No newline at end of file
+            raise DatabaseError() from e
+
+    @contextmanager
+    def pipeline(self) -> Iterator[Pipeline]:
+        """
+        Provide a MULTI/EXEC pipeline for batching commands into one round-trip.
+        
+        Commands queued on the pipeline run atomically when the caller invokes
+        execute(); values must be serialized by the caller.
+        
+        Requirement: Cache Management - Redis 6+ used as caching layer for session storage
+        
+        Yields:
+            Pipeline: Transactional redis-py pipeline
+            
+        Raises:
+            DatabaseError: If Redis operation fails
+        """
+        try:
+            with self._client.pipeline(transaction=True) as pipe:
+                yield pipe
+        except RedisError as e:
+            raise DatabaseError() from e
@@ -0,0 +1,50 @@
+"""Database-enforced cap of 10 active bullet items per specification.
+
+Human Tasks:
+1. Confirm the migration role is allowed to create PL/pgSQL functions and triggers
+2. Verify no specification exceeds 10 active bullet items before upgrading
+"""
+
+# External imports - versions specified as per requirements
+from alembic import op  # version: 1.7+
+
+# Revision identifiers
+revision = 'bullet_item_limit'
+down_revision = 'uuid_server_default'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Creates the trigger rejecting inserts beyond 10 active items per specification.
+
+    The parent specification row is locked so concurrent inserts for the same
+    specification are counted one after another. Violations are raised with
+    SQLSTATE check_violation so drivers surface them as integrity errors.
+
+    Requirement: 1.2 Scope/3. Specification Management - Support for up to 10 ordered bullet items
+    """
+    op.execute("""
+        CREATE OR REPLACE FUNCTION enforce_bullet_item_limit() RETURNS trigger AS $$
+        BEGIN
+            PERFORM 1 FROM specifications WHERE spec_id = NEW.spec_id FOR UPDATE;
+            IF (SELECT count(*) FROM bullet_items
+                WHERE spec_id = NEW.spec_id AND is_deleted = false) >= 10 THEN
+                RAISE EXCEPTION 'ITEM001' USING ERRCODE = 'check_violation';
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_bullet_items_limit
+        BEFORE INSERT ON bullet_items
+        FOR EACH ROW EXECUTE PROCEDURE enforce_bullet_item_limit()
+    """)
+
+def downgrade():
+    """Drops the bullet item limit trigger and its function.
+
+    Requirement: 1.2 Scope/4. Data Management - Database schema rollback
+    """
+    op.execute('DROP TRIGGER IF EXISTS trg_bullet_items_limit ON bullet_items')
+    op.execute('DROP FUNCTION IF EXISTS enforce_bullet_item_limit()')
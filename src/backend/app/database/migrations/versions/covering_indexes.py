@@ -0,0 +1,41 @@
+"""Partial composite indexes for the hot foreign-key lookup paths.
+
+Human Tasks:
+1. Schedule migration during a low-traffic period
+2. Verify index build times on production-sized tables in staging first
+3. Confirm query plans use index-only scans after ANALYZE
+"""
+
+# External imports - versions specified as per requirements
+from alembic import op  # version: 1.7+
+import sqlalchemy as sa  # version: 1.4+
+
+# Revision identifiers
+revision = 'covering_indexes'
+down_revision = 'initial_schema'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Creates partial composite indexes matching the active-row query shapes.
+
+    Requirement: 1.2 Scope/4. Data Management - Query performance for CRUD listing operations
+    """
+    # Active projects for a user ordered by creation time
+    op.create_index('ix_project_user_active', 'projects', ['user_id', 'created_at'],
+                    postgresql_where=sa.text('NOT is_deleted'))
+
+    # Active specifications for a project ordered by creation time
+    op.create_index('ix_spec_project_active', 'specifications', ['project_id', 'created_at'],
+                    postgresql_where=sa.text('NOT is_deleted'))
+
+    # Active bullet items in display order are already served by
+    # idx_bullet_items_order from the initial schema
+
+def downgrade():
+    """Drops the partial composite indexes.
+
+    Requirement: 1.2 Scope/4. Data Management - Database schema rollback
+    """
+    op.drop_index('ix_spec_project_active', table_name='specifications')
+    op.drop_index('ix_project_user_active', table_name='projects')
@@ -0,0 +1,33 @@
+"""Server-side UUID generation for primary keys.
+
+Human Tasks:
+1. Confirm the migration role is allowed to create the pgcrypto extension
+2. Verify gen_random_uuid() is available on the target PostgreSQL version
+"""
+
+# External imports - versions specified as per requirements
+from alembic import op  # version: 1.7+
+import sqlalchemy as sa  # version: 1.4+
+
+# Revision identifiers
+revision = 'uuid_server_default'
+down_revision = 'covering_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Enables pgcrypto and lets PostgreSQL generate UUID primary keys.
+
+    Requirement: 1.2 Scope/4. Data Management - Bulk insert performance
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+
+    op.alter_column('users', 'user_id',
+                    server_default=sa.text('gen_random_uuid()'))
+
+def downgrade():
+    """Removes the server-side UUID default.
+
+    Requirement: 1.2 Scope/4. Data Management - Database schema rollback
+    """
+    op.alter_column('users', 'user_id', server_default=None)
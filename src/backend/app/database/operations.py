@@ -9,8 +9,8 @@ Human Tasks:
 """
 
 # External imports - versions specified as per requirements
-from typing import Dict, List, Optional, Type, TypeVar, Any  # version: 3.9+
-from uuid import UUID  # version: 3.9+
+from typing import Dict, List, Optional, Sequence, Type, TypeVar, Any  # version: 3.9+
+from uuid import UUID, uuid4  # version: 3.9+
 from sqlalchemy import and_  # version: 1.4+
 from sqlalchemy.orm import Query  # version: 1.4+
 
@@ -51,6 +51,38 @@ def create_record(model_class: Type[T], data: Dict[str, Any]) -> T:
     except Exception as e:
         raise DatabaseError() from e
 
+def create_records(model_class: Type[T], records: List[Dict[str, Any]]) -> List[T]:
+    """
+    Create several records with a single batched INSERT.
+    
+    IDs are assigned client-side rather than left to the gen_random_uuid()
+    server default: the batch then needs no RETURNING, and each instance
+    knows its own ID without relying on the order of returned rows.
+    
+    Args:
+        model_class: SQLAlchemy model class
+        records: Dictionaries containing model attributes
+        
+    Returns:
+        List[T]: Created model instances
+        
+    Raises:
+        DatabaseError: If database operation fails
+        
+    Requirement: 1.2 Scope/4. Data Management - CRUD operations for projects, specifications, and bullet items
+    """
+    if not records:
+        return []
+    try:
+        with session_scope() as session:
+            instances = [model_class(**data) for data in records]
+            for instance in instances:
+                instance.id = uuid4()
+            session.bulk_save_objects(instances)
+            return instances
+    except Exception as e:
+        raise DatabaseError() from e
+
 def get_record(model_class: Type[T], record_id: UUID) -> Optional[T]:
     """
     Retrieve a record by ID.
@@ -69,12 +101,10 @@ def get_record(model_class: Type[T], record_id: UUID) -> Optional[T]:
     """
     try:
         with session_scope() as session:
-            # Query for record with given ID that isn't soft deleted
+            # Query for record with given ID; soft deleted rows are excluded by
+            # the session-wide loader criteria
             return session.query(model_class).filter(
-                and_(
-                    model_class.id == record_id,
-                    model_class.is_deleted.is_(False)
-                )
+                model_class.id == record_id
             ).first()
     except Exception as e:
         raise DatabaseError() from e
@@ -124,25 +154,29 @@ def delete_record(record: T) -> None:
     """
     try:
         with session_scope() as session:
-            # Perform soft delete
-            record.soft_delete()
-            session.add(record)
+            # Perform soft delete within this transaction
+            record.soft_delete(session=session)
     except Exception as e:
         raise DatabaseError() from e
 
 def list_records(
     model_class: Type[T],
-    filters: Optional[Dict[str, Any]] = None
-) -> List[T]:
+    filters: Optional[Dict[str, Any]] = None,
+    order_by: Optional[Sequence[str]] = None,
+    columns: Optional[Sequence[str]] = None
+) -> List[Any]:
     """
-    List all records of a model class with optional filtering.
+    List all records of a model class with optional filtering and ordering.
     
     Args:
         model_class: SQLAlchemy model class
         filters: Optional dictionary of filter conditions
+        order_by: Optional attribute names to sort by in ascending order
+        columns: Optional attribute names to select instead of full entities
         
     Returns:
-        List[T]: List of model instances
+        List[Any]: Model instances, or rows of the requested columns when
+        columns is given
         
     Raises:
         DatabaseError: If database operation fails
@@ -151,10 +185,11 @@ def list_records(
     """
     try:
         with session_scope() as session:
-            # Start with base query excluding soft deleted records
-            query: Query = session.query(model_class).filter(
-                model_class.is_deleted.is_(False)
-            )
+            # Select only the requested columns to skip entity hydration
+            if columns:
+                query: Query = session.query(*(getattr(model_class, key) for key in columns))
+            else:
+                query = session.query(model_class)
             
             # Apply additional filters if provided
             if filters:
@@ -166,6 +201,10 @@ def list_records(
                 if filter_conditions:
                     query = query.filter(and_(*filter_conditions))
             
+            # Let the database return rows pre-sorted
+            if order_by:
+                query = query.order_by(*(getattr(model_class, key) for key in order_by))
+            
             # Execute query and return results
             return query.all()
     except Exception as e:
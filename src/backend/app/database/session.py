@@ -13,7 +13,7 @@ from contextlib import contextmanager  # version: 3.9+
 from typing import Generator  # version: 3.9+
 import logging
 from sqlalchemy import create_engine  # version: 1.4+
-from sqlalchemy.orm import sessionmaker, Session  # version: 1.4+
+from sqlalchemy.orm import sessionmaker, Session, configure_mappers  # version: 1.4+
 from sqlalchemy.exc import SQLAlchemyError
 
 # Internal imports
@@ -115,6 +115,10 @@ def init_db() -> None:
         from ..models import specification  # noqa: F401
         from ..models import bullet_item  # noqa: F401
         
+        # Resolve all mapper relationships once at startup instead of lazily on
+        # the first query or instantiation inside a request
+        configure_mappers()
+        
         # Create all tables
         base.Base.metadata.create_all(bind=engine)
         logger.info("Database initialized successfully")
@@ -10,11 +10,13 @@ Human Tasks:
 """
 
 # External imports
+import atexit  # version: 3.9+
 from typing import Optional  # version: 3.9+
+from redis import ConnectionPool  # version: 6.0+
 from flask import Flask  # version: 2.0+
 
 # Internal imports
-from .cache.redis import RedisCache
+from .cache.redis import RedisCache, create_connection_pool
 from .database.session import DatabaseSession, init_db
 from .monitoring.metrics import MetricsCollector, get_metrics_collector
 
@@ -23,6 +25,7 @@ from .monitoring.metrics import MetricsCollector, get_metrics_collector
 db: DatabaseSession = DatabaseSession()
 
 # Requirement: Cache Management - Redis 6+ used as caching layer
+redis_pool: Optional[ConnectionPool] = None
 cache: Optional[RedisCache] = None
 
 # Requirement: System Monitoring - Core monitoring system component
@@ -39,19 +42,27 @@ def init_extensions(app: Flask) -> None:
     Requirement: Cache Management - Initialize Redis cache
     Requirement: System Monitoring - Initialize metrics collection
     """
-    global cache, metrics
+    global redis_pool, cache, metrics
     
     try:
         # Initialize database
         init_db()
         app.logger.info("Database initialized successfully")
         
+        # Initialize one Redis connection pool shared by every cache client
+        if redis_pool is None:
+            redis_pool = create_connection_pool(
+                host=app.config['REDIS_HOST'],
+                port=app.config['REDIS_PORT'],
+                password=app.config.get('REDIS_PASSWORD'),
+                db=app.config.get('REDIS_DB', 0),
+                max_connections=app.config.get('REDIS_MAX_CONNECTIONS', 64)
+            )
+            atexit.register(redis_pool.disconnect)
+        
         # Initialize Redis cache
-        cache = RedisCache(
-            host=app.config['REDIS_HOST'],
-            port=app.config['REDIS_PORT'],
-            password=app.config.get('REDIS_PASSWORD'),
-            db=app.config.get('REDIS_DB', 0),
+        cache = RedisCache.from_pool(
+            redis_pool,
             default_ttl=app.config.get('REDIS_DEFAULT_TTL', 3600)
         )
         app.logger.info("Redis cache initialized successfully")
@@ -62,6 +73,7 @@ def init_extensions(app: Flask) -> None:
         
         # Register extensions with application context
         app.extensions['db_session'] = db
+        app.extensions['redis_pool'] = redis_pool
         app.extensions['redis_cache'] = cache
         app.extensions['metrics'] = metrics
         
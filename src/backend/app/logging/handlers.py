@@ -1,6 +1,7 @@
 # Python standard library imports (version 3.9+)
 import logging
 import json
+import sys
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -157,6 +158,5 @@ class CloudLoggingHandler(logging.Handler):
             
         except Exception as e:
             # Fallback to sys.stderr in case of errors
-            import sys
             print(f'Error sending log to Google Cloud Logging: {str(e)}',
                   file=sys.stderr)
\ No newline at end of file
@@ -8,12 +8,14 @@ Human Tasks:
 """
 
 # External imports - versions specified as per technical requirements
-from flask import Flask  # version: 2.0+
+from flask import Flask, Response  # version: 2.0+
 from werkzeug.exceptions import HTTPException  # version: 2.0+
 import logging  # version: 3.9+
+import orjson  # version: 3.6+
 from typing import Tuple, Dict, Any  # version: 3.9+
 
 # Internal imports
+from ..utils.constants import ERROR_CODES
 from ..utils.exceptions import (
     BaseAPIException,
     AuthenticationError,
@@ -24,6 +26,21 @@ from ..utils.exceptions import (
     DatabaseError
 )
 
+# Encoded error envelope per error code, built once at import
+_API_ERROR_BODIES: Dict[str, bytes] = {
+    code: orjson.dumps({"error": {"code": code, "message": message}})
+    for code, message in ERROR_CODES.items()
+}
+
+# The same envelopes without the closing braces, for appending details
+_API_ERROR_PREFIX: Dict[str, bytes] = {
+    code: body[:-2] for code, body in _API_ERROR_BODIES.items()
+}
+
+def _json_response(body: bytes, status_code: int) -> Response:
+    """Wrap pre-encoded JSON bytes in a response without re-serializing."""
+    return Response(body, status=status_code, mimetype='application/json')
+
 class ErrorHandler:
     """
     Middleware class for handling various types of application errors and converting them to JSON responses.
@@ -60,7 +77,7 @@ class ErrorHandler:
         # Register handler for generic exceptions
         self._app.register_error_handler(Exception, self.handle_generic_error)
     
-    def handle_api_exception(self, error: BaseAPIException) -> Tuple[Dict[str, Any], int]:
+    def handle_api_exception(self, error: BaseAPIException) -> Response:
         """
         Handle custom API exceptions and return formatted JSON response.
         
@@ -68,7 +85,7 @@ class ErrorHandler:
             error: Instance of BaseAPIException or its subclasses
             
         Returns:
-            Tuple containing error response dictionary and HTTP status code
+            JSON response with the precomputed error body and HTTP status code
             
         Requirement: A.4 Error Codes and Messages - Standardized error response formatting
         """
@@ -78,14 +95,12 @@ class ErrorHandler:
         else:
             self._logger.warning(f"API Error: {error.code} - {error.message}")
         
-        response = {
-            "error": {
-                "code": error.code,
-                "message": error.message
-            }
-        }
+        # Serve the static body when the message is the standard one for the code
+        body = _API_ERROR_BODIES.get(error.code)
+        if body is None or ERROR_CODES[error.code] != error.message:
+            body = orjson.dumps({"error": {"code": error.code, "message": error.message}})
         
-        return response, error.status_code
+        return _json_response(body, error.status_code)
     
     def handle_http_exception(self, error: HTTPException) -> Tuple[Dict[str, Any], int]:
         """
@@ -110,7 +125,7 @@ class ErrorHandler:
         
         return response, error.code
     
-    def handle_validation_error(self, error: ValidationError) -> Tuple[Dict[str, Any], int]:
+    def handle_validation_error(self, error: ValidationError) -> Response:
         """
         Handle validation errors with detailed field errors.
         
@@ -118,21 +133,26 @@ class ErrorHandler:
             error: Instance of ValidationError containing field-specific errors
             
         Returns:
-            Tuple containing error response dictionary and HTTP status code
+            JSON response with the error details and HTTP status code
             
         Requirement: A.4 Error Codes and Messages - Validation error handling with field details
         """
         self._logger.warning(f"Validation Error: {error.code} - {error.message}", extra={"validation_errors": error.errors})
         
-        response = {
-            "error": {
-                "code": error.code,
-                "message": error.message,
-                "details": error.errors
-            }
-        }
+        # Only the field errors are encoded per request
+        prefix = _API_ERROR_PREFIX.get(error.code)
+        if prefix is None or ERROR_CODES[error.code] != error.message:
+            body = orjson.dumps({
+                "error": {
+                    "code": error.code,
+                    "message": error.message,
+                    "details": error.errors
+                }
+            })
+        else:
+            body = prefix + b',"details":' + orjson.dumps(error.errors) + b'}}'
         
-        return response, error.status_code
+        return _json_response(body, error.status_code)
     
     def handle_generic_error(self, error: Exception) -> Tuple[Dict[str, Any], int]:
         """
@@ -12,7 +12,13 @@ from flask import Flask, Response  # version: 2.0+
 from typing import Callable  # version: 3.9+
 
 # Internal imports
-from ..utils.constants import SECURITY_HEADERS
+from ..utils.constants import SECURITY_HEADERS_ITEMS
+
+# Header pairs with their lowercased names, matching werkzeug's
+# case-insensitive header lookup
+_SECURITY_HEADERS_LOWER = tuple(
+    (header.lower(), header, value) for header, value in SECURITY_HEADERS_ITEMS
+)
 
 class SecurityHeadersMiddleware:
     """
@@ -51,9 +57,14 @@ class SecurityHeadersMiddleware:
         - Security Headers Implementation (10.3.2)
         - Application Security Layer controls (7.6)
         """
-        # Iterate through security headers and add them if not present
-        for header, value in SECURITY_HEADERS.items():
-            if header not in response.headers:
-                response.headers[header] = value
+        # Collect present header names in one pass instead of one scan per header
+        present = {name.lower() for name in response.headers.keys()}
+        missing = [
+            (header, value)
+            for lowered, header, value in _SECURITY_HEADERS_LOWER
+            if lowered not in present
+        ]
+        if missing:
+            response.headers.extend(missing)
         
         return response
\ No newline at end of file
@@ -13,7 +13,7 @@ from typing import List  # version: 3.9+
 from sqlalchemy.orm import relationship  # version: 1.4+
 
 # Internal imports - importing models in dependency order
-from .base import Base
+from .base import Base, SoftDeleteMixin
 from .user import User
 from .project import Project
 from .specification import Specification
@@ -23,7 +23,8 @@ from .bullet_item import BulletItem
 User.projects = relationship(
     "Project",
     back_populates="user",
-    cascade="all, delete-orphan",
+    cascade="save-update, merge",
+    passive_deletes=True,
     doc="List of projects owned by this user"
 )
 
@@ -31,7 +32,8 @@ User.projects = relationship(
 Project.specifications = relationship(
     "Specification",
     back_populates="project",
-    cascade="all, delete-orphan",
+    cascade="save-update, merge",
+    passive_deletes=True,
     doc="List of specifications in this project"
 )
 
@@ -39,7 +41,8 @@ Project.specifications = relationship(
 Specification.bullet_items = relationship(
     "BulletItem",
     back_populates="specification",
-    cascade="all, delete-orphan",
+    cascade="save-update, merge",
+    passive_deletes=True,
     order_by="BulletItem.order",
     doc="Ordered list of bullet items in this specification"
 )
@@ -47,6 +50,7 @@ Specification.bullet_items = relationship(
 # Export all models
 __all__ = [
     'Base',      # Export base model class for inheritance
+    'SoftDeleteMixin',  # Export soft delete mixin for default query filtering
     'User',      # Export user model for authentication and user management
     'Project',   # Export project model for project management
     'Specification',  # Export specification model for specification management
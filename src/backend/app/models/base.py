@@ -9,11 +9,13 @@ Human Tasks:
 """
 
 # External imports - versions specified as per requirements
+from contextlib import nullcontext  # version: 3.9+
 from datetime import datetime  # version: 3.9+
-from typing import Dict, Any  # version: 3.9+
-from uuid import uuid4  # version: 3.9+
+from typing import Dict, Any, Iterable, Optional  # version: 3.9+
+from uuid import UUID as PyUUID  # version: 3.9+
 from sqlalchemy.ext.declarative import declarative_base  # version: 1.4+
-from sqlalchemy import Column, DateTime, Boolean  # version: 1.4+
+from sqlalchemy import Column, DateTime, Boolean, event, func, text, update as sql_update  # version: 1.4+
+from sqlalchemy.orm import Session, ORMExecuteState, with_loader_criteria  # version: 1.4+
 from sqlalchemy.dialects.postgresql import UUID  # version: 1.4+
 
 # Internal imports
@@ -22,7 +24,48 @@ from ..database.session import DatabaseSession, session_scope
 # Create declarative base class
 Base = declarative_base()
 
-class Base(Base):
+class SoftDeleteMixin:
+    """
+    Declarative mixin providing the soft delete flag.
+    
+    Rows flagged as deleted are excluded from every ORM SELECT, including
+    relationship loads, by the session-wide loader criteria registered below.
+    Pass execution_options(include_deleted=True) to a query to bypass it.
+    
+    Requirement: 10.2.3 Database Security - Secure deletion with audit trail
+    """
+    
+    is_deleted = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        doc="Soft delete flag for the record"
+    )
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """
+    Apply the soft delete filter to ORM SELECT statements in SQL.
+    
+    Args:
+        execute_state: ORM execution state for the statement being run
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                # Rendered as is_deleted = false, which PostgreSQL matches to the
+                # partial indexes declared WHERE NOT is_deleted
+                lambda cls: cls.is_deleted == False,  # noqa: E712
+                include_aliases=True
+            )
+        )
+
+class Base(SoftDeleteMixin, Base):
     """
     SQLAlchemy declarative base class that all models inherit from.
     
@@ -37,7 +80,9 @@ class Base(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        # Generated by PostgreSQL (pgcrypto) for rows inserted without an id,
+        # such as raw SQL and migrations; ORM batch inserts assign it client-side
+        server_default=text("gen_random_uuid()"),
         nullable=False,
         unique=True,
         doc="Unique identifier for the record"
@@ -58,13 +103,6 @@ class Base(Base):
         doc="Timestamp when the record was last updated"
     )
     
-    is_deleted = Column(
-        Boolean,
-        nullable=False,
-        default=False,
-        doc="Soft delete flag for the record"
-    )
-    
     def __init__(self, **kwargs: Any) -> None:
         """
         Initialize base model with common fields.
@@ -72,8 +110,6 @@ class Base(Base):
         Args:
             **kwargs: Keyword arguments for model attributes
         """
-        if 'id' not in kwargs:
-            kwargs['id'] = uuid4()
         if 'created_at' not in kwargs:
             kwargs['created_at'] = datetime.utcnow()
         if 'updated_at' not in kwargs:
@@ -99,37 +135,76 @@ class Base(Base):
                 value = value.isoformat()
             
             # Convert UUID objects to string
-            elif isinstance(value, uuid4.__class__):
+            elif isinstance(value, PyUUID):
                 value = str(value)
                 
             result[column.name] = value
             
         return result
     
-    def soft_delete(self) -> None:
+    def soft_delete(self, session: Optional[Session] = None) -> None:
         """
         Mark record as deleted without removing from database.
         
+        Args:
+            session: Optional active session; when provided the change joins the
+                caller's transaction instead of committing on its own
+        
         Requirement: 10.2.3 Database Security - Audit logging for data changes
         """
-        with session_scope() as session:
+        with nullcontext(session) if session is not None else session_scope() as active_session:
             self.is_deleted = True
             self.updated_at = datetime.utcnow()
-            session.add(self)
+            active_session.add(self)
     
-    def update(self, attributes: Dict[str, Any]) -> None:
+    def update(self, attributes: Dict[str, Any], session: Optional[Session] = None) -> None:
         """
         Update model with provided attributes.
         
         Args:
             attributes: Dictionary of attributes to update
+            session: Optional active session; when provided the change joins the
+                caller's transaction instead of committing on its own
             
         Requirement: 1.2 Scope/4. Data Management - Data validation for updates
         """
-        with session_scope() as session:
-            for key, value in attributes.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
+        # Skip unchanged values so no-op updates do not mark the row dirty
+        changes = {
+            key: value for key, value in attributes.items()
+            if hasattr(self, key) and getattr(self, key) != value
+        }
+        if not changes:
+            return
+        
+        with nullcontext(session) if session is not None else session_scope() as active_session:
+            for key, value in changes.items():
+                setattr(self, key, value)
             
             self.updated_at = datetime.utcnow()
-            session.add(self)
\ No newline at end of file
+            active_session.add(self)
+    
+    @classmethod
+    def bulk_soft_delete(cls, session: Session, ids: Iterable[Any]) -> int:
+        """
+        Soft delete many records with a single UPDATE statement.
+        
+        Args:
+            session: Active database session owning the transaction
+            ids: Identifiers of the records to mark as deleted
+            
+        Returns:
+            int: Number of rows affected
+            
+        Requirement: 10.2.3 Database Security - Audit logging for data changes
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        
+        result = session.execute(
+            sql_update(cls)
+            .where(cls.id.in_(ids))
+            .values(is_deleted=True, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
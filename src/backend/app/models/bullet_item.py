@@ -11,7 +11,7 @@ Human Tasks:
 # External imports - versions specified as per requirements
 from datetime import datetime  # version: 3.9+
 from typing import Dict, Any  # version: 3.9+
-from sqlalchemy import Column, String, ForeignKey, Integer, Text  # version: 1.4+
+from sqlalchemy import DDL, Column, String, ForeignKey, Integer, Text, Index, event, text  # version: 1.4+
 from sqlalchemy.orm import relationship  # version: 1.4+
 from sqlalchemy.dialects.postgresql import UUID  # version: 1.4+
 
@@ -19,6 +19,39 @@ from sqlalchemy.dialects.postgresql import UUID  # version: 1.4+
 from .base import Base
 from .specification import Specification
 
+# Requirement: 1.2 Scope/3. Specification Management - Support for up to 10 ordered bullet items
+# Precomputed set of valid order positions (0-9)
+_VALID_ORDERS = frozenset(range(10))
+
+# Requirement: 1.2 Scope/3. Specification Management - Support for up to 10 ordered bullet items
+# Trigger rejecting inserts beyond 10 active items per specification, written
+# against the model schema so tables built by metadata.create_all enforce the
+# cap too. The parent specification row is locked so concurrent inserts are
+# counted one after another; violations use SQLSTATE check_violation.
+_ITEM_LIMIT_FUNCTION_DDL = DDL("""
+    CREATE OR REPLACE FUNCTION enforce_bullet_item_limit() RETURNS trigger AS $$
+    BEGIN
+        PERFORM 1 FROM specifications WHERE id = NEW.spec_id FOR UPDATE;
+        IF (SELECT count(*) FROM bullet_items
+            WHERE spec_id = NEW.spec_id AND is_deleted = false) >= 10 THEN
+            RAISE EXCEPTION 'ITEM001' USING ERRCODE = 'check_violation';
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+""").execute_if(dialect='postgresql')
+
+_ITEM_LIMIT_TRIGGER_DDL = DDL("""
+    CREATE TRIGGER trg_bullet_items_limit
+    BEFORE INSERT ON bullet_items
+    FOR EACH ROW EXECUTE PROCEDURE enforce_bullet_item_limit()
+""").execute_if(dialect='postgresql')
+
+# The trigger is dropped with its table; the function is dropped afterwards
+_ITEM_LIMIT_DROP_DDL = DDL(
+    'DROP FUNCTION IF EXISTS enforce_bullet_item_limit()'
+).execute_if(dialect='postgresql')
+
 class BulletItem(Base):
     """
     SQLAlchemy model representing an ordered bullet item within a specification.
@@ -29,6 +62,18 @@ class BulletItem(Base):
     
     __tablename__ = 'bullet_items'
     
+    # Requirement: 1.2 Scope/3. Specification Management - Partial composite index serving
+    # ordered bullet item lookups per specification; declared under the name the
+    # initial schema migration creates it with
+    __table_args__ = (
+        Index(
+            'idx_bullet_items_order',
+            'spec_id',
+            'order',
+            postgresql_where=text('NOT is_deleted')
+        ),
+    )
+    
     # Foreign key to specification table
     spec_id = Column(
         UUID(as_uuid=True),
@@ -79,14 +124,15 @@ class BulletItem(Base):
             raise ValueError("Bullet item content cannot be empty")
             
         # Validate order is within allowed range
-        if not self.validate_order(order):
+        if not BulletItem.validate_order(order):
             raise ValueError("Bullet item order must be between 0 and 9")
         
         self.spec_id = spec_id
         self.content = content.strip()
         self.order = order
     
-    def validate_order(self, order: int) -> bool:
+    @staticmethod
+    def validate_order(order: int) -> bool:
         """
         Validate if the order value is within allowed range.
         
@@ -96,13 +142,9 @@ class BulletItem(Base):
             order: Order value to validate
             
         Returns:
-            bool: True if order is valid (0-9), False otherwise
+            bool: True if order is an integer between 0 and 9, False otherwise
         """
-        try:
-            order_int = int(order)
-            return 0 <= order_int <= 9
-        except (TypeError, ValueError):
-            return False
+        return isinstance(order, int) and order in _VALID_ORDERS
     
     def validate_spec_access(self, spec_id: UUID) -> bool:
         """
@@ -130,7 +172,7 @@ class BulletItem(Base):
         Raises:
             ValueError: If new order is invalid
         """
-        if not self.validate_order(new_order):
+        if not BulletItem.validate_order(new_order):
             raise ValueError("New order must be between 0 and 9")
             
         self.order = new_order
@@ -156,4 +198,9 @@ class BulletItem(Base):
         }
         
         # Combine base and bullet item specific dictionaries
-        return {**base_dict, **bullet_dict}
\ No newline at end of file
+        return {**base_dict, **bullet_dict}
+
+# Attach the item limit trigger to the table's create/drop lifecycle
+event.listen(BulletItem.__table__, 'after_create', _ITEM_LIMIT_FUNCTION_DDL)
+event.listen(BulletItem.__table__, 'after_create', _ITEM_LIMIT_TRIGGER_DDL)
+event.listen(BulletItem.__table__, 'after_drop', _ITEM_LIMIT_DROP_DDL)
@@ -11,7 +11,7 @@ Human Tasks:
 # External imports - versions specified as per requirements
 from datetime import datetime  # version: 3.9+
 from typing import Dict, Any, List  # version: 3.9+
-from sqlalchemy import Column, String, ForeignKey, Boolean  # version: 1.4+
+from sqlalchemy import Column, String, ForeignKey, Boolean, Index, text  # version: 1.4+
 from sqlalchemy.orm import relationship  # version: 1.4+
 from sqlalchemy.dialects.postgresql import UUID  # version: 1.4+
 
@@ -29,6 +29,17 @@ class Project(Base):
     
     __tablename__ = 'projects'
     
+    # Requirement: 1.2 Scope/2. Project Organization - Partial composite index matching
+    # the "active projects for a user ordered by creation" query shape
+    __table_args__ = (
+        Index(
+            'ix_project_user_active',
+            'user_id',
+            'created_at',
+            postgresql_where=text('NOT is_deleted')
+        ),
+    )
+    
     # Project title with length constraint
     title = Column(
         String(100),
@@ -54,7 +65,8 @@ class Project(Base):
     specifications = relationship(
         "Specification",
         back_populates="project",
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes=True,
         doc="List of specifications in this project"
     )
     
@@ -79,7 +91,6 @@ class Project(Base):
         
         self.title = title.strip()
         self.user_id = user_id
-        self.specifications = []
     
     def validate_ownership(self, user_id: UUID) -> bool:
         """
@@ -104,10 +115,7 @@ class Project(Base):
         Returns:
             List[Specification]: List of active specifications in this project
         """
-        return [
-            spec for spec in self.specifications 
-            if not spec.is_deleted
-        ]
+        return self.specifications
     
     def to_dict(self) -> Dict[str, Any]:
         """
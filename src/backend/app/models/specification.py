@@ -11,7 +11,7 @@ Human Tasks:
 # External imports - versions specified as per requirements
 from datetime import datetime  # version: 3.9+
 from typing import Dict, Any, List  # version: 3.9+
-from sqlalchemy import Column, String, ForeignKey, Boolean, Text  # version: 1.4+
+from sqlalchemy import Column, String, ForeignKey, Boolean, Text, Index, text  # version: 1.4+
 from sqlalchemy.orm import relationship  # version: 1.4+
 from sqlalchemy.dialects.postgresql import UUID  # version: 1.4+
 
@@ -29,6 +29,17 @@ class Specification(Base):
     
     __tablename__ = 'specifications'
     
+    # Requirement: 1.2 Scope/3. Specification Management - Partial composite index matching
+    # the "active specifications for a project ordered by creation" query shape
+    __table_args__ = (
+        Index(
+            'ix_spec_project_active',
+            'project_id',
+            'created_at',
+            postgresql_where=text('NOT is_deleted')
+        ),
+    )
+    
     # Foreign key to project table
     project_id = Column(
         UUID(as_uuid=True),
@@ -54,7 +65,8 @@ class Specification(Base):
     bullet_items = relationship(
         "BulletItem",
         back_populates="specification",
-        cascade="all, delete-orphan",
+        cascade="save-update, merge",
+        passive_deletes=True,
         order_by="BulletItem.order",
         doc="Ordered list of bullet items in this specification"
     )
@@ -80,7 +92,6 @@ class Specification(Base):
         
         self.project_id = project_id
         self.content = content.strip()
-        self.bullet_items = []
     
     def validate_project_access(self, project_id: UUID) -> bool:
         """
@@ -105,10 +116,7 @@ class Specification(Base):
         Returns:
             List[BulletItem]: Ordered list of specification's active bullet items
         """
-        return [
-            item for item in self.bullet_items 
-            if not item.is_deleted
-        ]
+        return self.bullet_items
     
     def validate_bullet_item_limit(self) -> bool:
         """
@@ -10,13 +10,20 @@ Human Tasks:
 
 # External imports - versions specified as per requirements
 from datetime import datetime  # version: 3.9+
-from typing import Dict, Any  # version: 3.9+
-from sqlalchemy import Column, String, DateTime, Boolean  # version: 1.4+
+from typing import Dict, Any, Iterable  # version: 3.9+
+from sqlalchemy import Column, String, DateTime, Boolean, insert  # version: 1.4+
+from sqlalchemy.orm import Session  # version: 1.4+
 
 # Internal imports
 from .base import Base
-from ..utils.security import encrypt_sensitive_data, decrypt_sensitive_data
-from ..utils.validators import validate_email
+from ..utils.constants import EMAIL_COLUMN_LENGTH
+from ..utils.exceptions import ValidationError
+from ..utils.security import (
+    encrypt_sensitive_data,
+    encrypt_sensitive_data_batch,
+    decrypt_sensitive_data
+)
+from ..utils.validators import validate_email, EMAIL_REGEX, MAX_EMAIL_LENGTH
 
 class User(Base):
     """
@@ -30,7 +37,7 @@ class User(Base):
     
     # Email is stored encrypted for security
     email = Column(
-        String(255),
+        String(EMAIL_COLUMN_LENGTH),
         nullable=False,
         unique=True,
         doc="Encrypted email address of the user"
@@ -76,6 +83,59 @@ class User(Base):
         self.last_login = None
         self.is_deleted = False
     
+    @classmethod
+    def bulk_create(cls, session: Session, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert many users with a single executemany INSERT.
+        
+        Requirement: 1.2 Scope/1. User Management - User data validation
+        Requirement: 10.2.2 Encryption Standards - Secure data encryption
+        
+        Args:
+            session: Active database session owning the transaction
+            records: Dictionaries with 'email' and 'name' keys
+            
+        Returns:
+            int: Number of users inserted
+            
+        Raises:
+            ValidationError: If any email format or name is invalid
+        """
+        name_length = cls.__table__.c.name.type.length
+        emails = []
+        names = []
+        for record in records:
+            email = record.get('email')
+            email = email.lower().strip() if isinstance(email, str) else ''
+            # Same bound as validate_email, checked before the pattern runs
+            if len(email) > MAX_EMAIL_LENGTH or not EMAIL_REGEX.match(email):
+                raise ValidationError('AUTH003', {'email': ['Invalid email format']})
+            name = record.get('name')
+            name = name.strip() if isinstance(name, str) else ''
+            if not name or len(name) > name_length:
+                raise ValidationError('AUTH003', {'name': ['Invalid name']})
+            emails.append(email)
+            names.append(name)
+        
+        if not emails:
+            return 0
+        
+        # IDs are generated by PostgreSQL, so they are omitted from the parameters
+        now = datetime.utcnow()
+        params = [
+            {
+                'email': encrypted_email,
+                'name': name,
+                'created_at': now,
+                'updated_at': now,
+                'last_login': None,
+                'is_deleted': False
+            }
+            for encrypted_email, name in zip(encrypt_sensitive_data_batch(emails), names)
+        ]
+        session.execute(insert(cls.__table__), params)
+        return len(params)
+    
     def get_email(self) -> str:
         """
         Get decrypted email address.
@@ -12,29 +12,72 @@ Human Tasks:
 8. Ensure metric retention policies align with compliance requirements
 """
 
-# Internal imports
-from .health import (  # type: ignore
-    HealthStatus,
-    HealthCheck,
-    get_system_health
-)
-from .metrics import (  # type: ignore
-    MetricsCollector,
-    get_metrics_collector,
-    export_metrics
-)
+# External imports - versions specified as per requirements
+from importlib import import_module  # version: 3.9+
+from typing import Any  # version: 3.9+
 
 # Requirement: 7.1 High-Level Architecture/Core Components - Core monitoring system component
 # Export all required monitoring components
 __all__ = [
     'HealthStatus',
     'HealthCheck',
+    'SystemHealth',
     'get_system_health',
+    'configure_health_checks',
     'MetricsCollector',
     'get_metrics_collector',
-    'export_metrics'
+    'export_metrics',
+    'configure_metrics',
+    'mark_worker_dead'
 ]
 
-# Requirement: 11.5.2 Pipeline Stages - Performance metrics and health monitoring
-# Initialize metrics collector singleton on module import
-metrics_collector = get_metrics_collector()
\ No newline at end of file
+# Submodule providing each exported name; submodules are imported on first
+# attribute access so CLI and migration contexts avoid database, Redis and
+# Prometheus setup they never use
+_LAZY_EXPORTS = {
+    'HealthStatus': '.health',
+    'HealthCheck': '.health',
+    'SystemHealth': '.health',
+    'get_system_health': '.health',
+    'configure_health_checks': '.health',
+    'MetricsCollector': '.metrics',
+    'get_metrics_collector': '.metrics',
+    'export_metrics': '.metrics',
+    'configure_metrics': '.metrics',
+    'mark_worker_dead': '.metrics'
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve package exports lazily (PEP 562).
+    
+    Args:
+        name: Attribute name being accessed
+        
+    Returns:
+        Any: The requested export
+        
+    Raises:
+        AttributeError: If the name is not a monitoring export
+    """
+    # Requirement: 11.5.2 Pipeline Stages - Performance metrics and health monitoring
+    # Metrics collector singleton is created on first access rather than on import
+    if name == 'metrics_collector':
+        value = __getattr__('get_metrics_collector')()
+    elif name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Cache on the module so subsequent lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    """
+    List module attributes including lazily resolved exports.
+    
+    Returns:
+        list: Sorted attribute names
+    """
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | {'metrics_collector'})
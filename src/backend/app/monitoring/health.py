@@ -10,13 +10,20 @@ Human Tasks:
 """
 
 # External imports
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError  # version: 3.9+
+import math  # version: 3.9+
+import threading  # version: 3.9+
+import time  # version: 3.9+
 from enum import Enum  # version: 3.9+
+import orjson  # version: 3.6+
+from flask import Flask, Response, request  # version: 2.0+
 from dataclasses import dataclass  # version: 3.9+
-from typing import Dict, Any  # version: 3.9+
+from redis import Redis, ConnectionPool  # version: 4.0+
+from sqlalchemy import create_engine, text  # version: 1.4+
+from typing import Callable, Dict, Any, Optional, Tuple  # version: 3.9+
 
 # Internal imports
-from ..database.session import session_scope
-from ..cache.redis import RedisClient
+from ..database.session import engine
 
 # Requirement: 7.1 High-Level Architecture/Core Components - Health monitoring status types
 class HealthStatus(Enum):
@@ -25,6 +32,63 @@ class HealthStatus(Enum):
     UNHEALTHY = "unhealthy"
     DEGRADED = "degraded"
 
+# Enum member to string value, resolved once instead of per probe
+_STATUS_VALUE: Dict[HealthStatus, str] = {status: status.value for status in HealthStatus}
+
+# Maximum time in seconds a single component check may take before it is
+# reported as unhealthy
+CHECK_TIMEOUT_SECONDS = 2.0
+
+# Window in seconds during which a component check result is reused
+CHECK_CACHE_TTL_SECONDS = 1.0
+
+# Socket connect/read timeout in seconds for the dedicated Redis health client
+REDIS_PING_TIMEOUT_SECONDS = 0.2
+
+# Connect and statement timeouts for the dedicated database health engine;
+# libpq accepts whole seconds for connect_timeout
+DB_PROBE_CONNECT_TIMEOUT_SECONDS = max(1, math.ceil(CHECK_TIMEOUT_SECONDS / 2))
+DB_PROBE_STATEMENT_TIMEOUT_MS = int(CHECK_TIMEOUT_SECONDS * 1000)
+
+# Connectivity probe statement compiled once at import
+_PING_STMT = text("SELECT 1")
+
+# Last formatted health timestamp as (epoch second, ISO 8601 string)
+_last_timestamp: Tuple[int, str] = (0, "")
+
+# One worker per component so a slow probe can never delay another component
+_check_executors: Dict[str, ThreadPoolExecutor] = {
+    component: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"health-check-{component}")
+    for component in ("database", "cache")
+}
+
+@dataclass(frozen=True)
+class SystemHealth:
+    """
+    Immutable snapshot of overall system health.
+    
+    Requirement: 11.5.2 Pipeline Stages - Health checks for deployment validation
+    """
+    # Declared explicitly because dataclass(slots=True) requires Python 3.10
+    __slots__ = ('overall_status', 'components', 'timestamp')
+    
+    overall_status: HealthStatus
+    components: Dict[str, str]
+    timestamp: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the snapshot to a JSON-serializable dictionary.
+        
+        Returns:
+            Dict[str, Any]: Health status with the overall status as its string value
+        """
+        return {
+            "overall_status": self.overall_status.value,
+            "components": self.components,
+            "timestamp": self.timestamp
+        }
+
 class HealthCheck:
     """
     Health check manager for system components.
@@ -32,7 +96,12 @@ class HealthCheck:
     Requirement: 7.1 High-Level Architecture/Core Components - Health monitoring for core system components
     """
     
-    def __init__(self, redis_client: RedisClient) -> None:
+    __slots__ = (
+        '_redis_client', '_health_redis', '_health_engine', '_ttl', '_cache',
+        '_locks', '_inflight', '_inflight_lock'
+    )
+    
+    def __init__(self, redis_client: Redis) -> None:
         """
         Initialize health check manager.
         
@@ -40,56 +109,208 @@ class HealthCheck:
             redis_client: Redis client instance for cache health checks
         """
         self._redis_client = redis_client
+        
+        # Dedicated client with short socket timeouts so a hung Redis cannot
+        # stall the health endpoint on TCP retransmits
+        source_pool = redis_client.connection_pool
+        connection_kwargs = dict(source_pool.connection_kwargs)
+        connection_kwargs.update(
+            socket_connect_timeout=REDIS_PING_TIMEOUT_SECONDS,
+            socket_timeout=REDIS_PING_TIMEOUT_SECONDS
+        )
+        self._health_redis = Redis(connection_pool=ConnectionPool(
+            connection_class=source_pool.connection_class,
+            max_connections=2,
+            **connection_kwargs
+        ))
+        
+        # Dedicated single-connection engine with bounded connect, checkout and
+        # statement timeouts so a slow database cannot hold a probe for the
+        # application pool's full timeout
+        self._health_engine = create_engine(
+            engine.url,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=CHECK_TIMEOUT_SECONDS,
+            connect_args={
+                "connect_timeout": DB_PROBE_CONNECT_TIMEOUT_SECONDS,
+                "options": f"-c statement_timeout={DB_PROBE_STATEMENT_TIMEOUT_MS}"
+            }
+        )
+        self._ttl = CHECK_CACHE_TTL_SECONDS
+        self._cache: Dict[str, Tuple[float, HealthStatus]] = {}
+        self._locks = {"database": threading.Lock(), "cache": threading.Lock()}
+        
+        # Probe still running per component; reused instead of queueing more
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _cached(self, key: str, probe: Callable[[], HealthStatus], force: bool) -> HealthStatus:
+        """
+        Return a recent result for a component or run its probe.
+        
+        Args:
+            key: Component name used as cache key
+            probe: Function performing the real check
+            force: Bypass the cached result when True
+            
+        Returns:
+            HealthStatus: Component status
+        """
+        if not force:
+            cached: Optional[Tuple[float, HealthStatus]] = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self._ttl:
+                return cached[1]
+        
+        # Only one thread refreshes a component; others return the last known
+        # result instead of waiting behind a slow probe
+        lock = self._locks[key]
+        if not lock.acquire(blocking=False):
+            stale = self._cache.get(key)
+            if stale is not None:
+                return stale[1]
+            lock.acquire()
+        try:
+            if not force:
+                cached = self._cache.get(key)
+                if cached is not None and time.monotonic() - cached[0] < self._ttl:
+                    return cached[1]
+            status = probe()
+            self._cache[key] = (time.monotonic(), status)
+            return status
+        finally:
+            lock.release()
 
-    def check_database(self) -> HealthStatus:
+    def check_database(self, force: bool = False) -> HealthStatus:
         """
         Check database connection health.
         
         Requirement: 7.1 High-Level Architecture/Core Components - Database health monitoring
         
+        Args:
+            force: Bypass the short-lived result cache
+        
+        Returns:
+            HealthStatus: Database connection status
+        """
+        return self._cached("database", self._probe_database, force)
+
+    def _probe_database(self) -> HealthStatus:
+        """
+        Run the database connectivity query.
+        
         Returns:
             HealthStatus: Database connection status
         """
         try:
-            # Attempt to create database session and execute simple query
-            with session_scope() as session:
-                # Simple query to test database connection
-                session.execute("SELECT 1")
+            # Check out the health engine's connection directly; no ORM session
+            # or transaction bookkeeping is needed for a no-op query
+            with self._health_engine.connect() as connection:
+                connection.scalar(_PING_STMT)
             return HealthStatus.HEALTHY
         except Exception:
             return HealthStatus.UNHEALTHY
 
-    def check_redis(self) -> HealthStatus:
+    def check_redis(self, force: bool = False) -> HealthStatus:
         """
         Check Redis cache connection health.
         
         Requirement: 7.1 High-Level Architecture/Core Components - Cache health monitoring
         
+        Args:
+            force: Bypass the short-lived result cache
+        
+        Returns:
+            HealthStatus: Redis connection status
+        """
+        return self._cached("cache", self._probe_redis, force)
+
+    def _probe_redis(self) -> HealthStatus:
+        """
+        Ping the Redis server.
+        
         Returns:
             HealthStatus: Redis connection status
         """
         try:
-            # Attempt to ping Redis server
-            self._redis_client.ping()
+            # Attempt to ping Redis server with bounded socket timeouts
+            self._health_redis.ping()
             return HealthStatus.HEALTHY
         except Exception:
             return HealthStatus.UNHEALTHY
 
-    def check_all(self) -> Dict[str, HealthStatus]:
+    def check_all(self, force: bool = False) -> Dict[str, HealthStatus]:
         """
         Check health of all system components.
         
         Requirement: 7.1 High-Level Architecture/Core Components - Comprehensive system health monitoring
         
+        Args:
+            force: Bypass the short-lived result cache
+        
         Returns:
             Dict[str, HealthStatus]: Health status of all components
         """
-        return {
-            "database": self.check_database(),
-            "cache": self.check_redis()
+        # Dispatch I/O-bound checks concurrently so latency is the slowest check
+        futures = {
+            "database": self._submit("database", self.check_database, force),
+            "cache": self._submit("cache", self.check_redis, force)
         }
+        
+        results = {}
+        for component, future in futures.items():
+            try:
+                results[component] = future.result(timeout=CHECK_TIMEOUT_SECONDS)
+            except FutureTimeoutError:
+                results[component] = HealthStatus.UNHEALTHY
+        return results
+
+    def _submit(self, component: str, check: Callable[[bool], HealthStatus], force: bool) -> Future:
+        """
+        Run a component check on its own worker, joining a probe still in flight.
+        
+        Reusing the pending future keeps timed-out probes from piling up in the
+        component's executor queue.
+        
+        Args:
+            component: Component name selecting the executor
+            check: Check method to run
+            force: Bypass the short-lived result cache
+            
+        Returns:
+            Future: Future resolving to the component status
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(component)
+            if future is None or future.done():
+                future = _check_executors[component].submit(check, force)
+                self._inflight[component] = future
+            return future
+
+def _current_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with second precision.
+    
+    The formatted value is memoized for the current second, so repeated probes
+    within the same second reuse one string.
+    
+    Returns:
+        str: Timestamp such as 2024-01-01T12:00:00+00:00
+    """
+    global _last_timestamp
+    second = int(time.time())
+    cached = _last_timestamp
+    if cached[0] == second:
+        return cached[1]
+    
+    t = time.gmtime(second)
+    formatted = "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % (
+        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec
+    )
+    _last_timestamp = (second, formatted)
+    return formatted
 
-def get_system_health(health_checker: HealthCheck) -> Dict[str, Any]:
+def get_system_health(health_checker: HealthCheck, force: bool = False) -> SystemHealth:
     """
     Get overall system health status.
     
@@ -97,31 +318,75 @@ def get_system_health(health_checker: HealthCheck) -> Dict[str, Any]:
     
     Args:
         health_checker: HealthCheck instance to perform health checks
+        force: Bypass cached component results, e.g. for deployment gates
         
     Returns:
-        Dict[str, Any]: System health status and details containing:
+        SystemHealth: System health status and details containing:
             - overall_status: HealthStatus
             - components: Dict of component statuses
             - timestamp: ISO 8601 timestamp
     """
-    from datetime import datetime, timezone
-    
     # Get status of all components
-    component_status = health_checker.check_all()
+    component_status = health_checker.check_all(force)
+    
+    # Determine overall system health in a single pass over the components
+    healthy = unhealthy = 0
+    for status in component_status.values():
+        healthy += status is HealthStatus.HEALTHY
+        unhealthy += status is HealthStatus.UNHEALTHY
     
-    # Determine overall system health
-    if all(status == HealthStatus.HEALTHY for status in component_status.values()):
+    total = len(component_status)
+    if healthy == total:
         overall_status = HealthStatus.HEALTHY
-    elif all(status == HealthStatus.UNHEALTHY for status in component_status.values()):
+    elif unhealthy == total:
         overall_status = HealthStatus.UNHEALTHY
     else:
         overall_status = HealthStatus.DEGRADED
     
-    return {
-        "overall_status": overall_status,
-        "components": {
-            component: status.value
-            for component, status in component_status.items()
+    return SystemHealth(
+        overall_status=overall_status,
+        components={
+            "database": _STATUS_VALUE[component_status["database"]],
+            "cache": _STATUS_VALUE[component_status["cache"]]
         },
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
\ No newline at end of file
+        timestamp=_current_timestamp()
+    )
+
+def configure_health_checks(app: Flask) -> HealthCheck:
+    """
+    Register the /health endpoint on the application.
+    
+    The response body is encoded with orjson, which serializes the
+    SystemHealth dataclass and HealthStatus enum natively.
+    
+    Requirement: 11.5.2 Pipeline Stages - Health checks for deployment validation
+    
+    Args:
+        app: Flask application with the Redis cache extension initialized
+        
+    Returns:
+        HealthCheck: Health checker bound to the application
+    """
+    health_checker = HealthCheck(app.extensions['redis_cache'].client)
+    app.extensions['health_check'] = health_checker
+    
+    @app.route('/health', methods=['GET'])
+    def health() -> Response:
+        """
+        Report system health; pass ?force=true to bypass cached results.
+        
+        Returns:
+            Response: JSON health status, 503 when all components are unhealthy
+        """
+        system_health = get_system_health(
+            health_checker,
+            force=request.args.get('force') == 'true'
+        )
+        status_code = 503 if system_health.overall_status is HealthStatus.UNHEALTHY else 200
+        return Response(
+            orjson.dumps(system_health),
+            status=status_code,
+            mimetype='application/json'
+        )
+    
+    return health_checker
@@ -9,15 +9,31 @@ Human Tasks:
 """
 
 # External imports
-from prometheus_client import Counter, Histogram, Gauge, generate_latest  # version: 0.14+
-from typing import Optional  # version: 3.9+
-from flask import Response  # version: 2.0+
+import os  # version: 3.9+
+import threading  # version: 3.9+
+import time  # version: 3.9+
+from collections import Counter as TallyCounter  # version: 3.9+
+from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest  # version: 0.14+
+from prometheus_client import multiprocess  # version: 0.14+
+from typing import Any, Dict, Optional, Tuple  # version: 3.9+
+from flask import Flask, Response, g, request  # version: 2.0+
 
 # Internal imports
 from ..utils.constants import SYS001, SYS002
 
 # Singleton instance
 _metrics_collector: Optional['MetricsCollector'] = None
+_metrics_lock = threading.Lock()
+
+# Seconds a rendered /metrics payload is reused across concurrent scrapers
+METRICS_CACHE_TTL_SECONDS = 0.5
+
+# Last rendered payload as (monotonic timestamp, body)
+_metrics_cache: Tuple[float, bytes] = (0.0, b'')
+_metrics_cache_lock = threading.Lock()
+
+# Prometheus text exposition content type, built once
+_PROM_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
 
 class MetricsCollector:
     """
@@ -51,7 +67,8 @@ class MetricsCollector:
         # Active users metric
         self.active_users = Gauge(
             'active_users',
-            'Number of currently active users'
+            'Number of currently active users',
+            multiprocess_mode='livesum'
         )
         
         # Error count metric
@@ -64,14 +81,33 @@ class MetricsCollector:
         # Database connections metric
         self.database_connections = Gauge(
             'database_connections',
-            'Number of active database connections'
+            'Number of active database connections',
+            multiprocess_mode='livesum'
         )
         
         # Cache hit ratio metric
         self.cache_hit_ratio = Gauge(
             'cache_hit_ratio',
-            'Cache hit ratio percentage'
+            'Cache hit ratio percentage',
+            multiprocess_mode='liveall'
         )
+        
+        # Label-bound child metrics cached per label values so hot paths skip
+        # the .labels() lookup and its registry lock
+        self._request_count_children: Dict[Tuple[str, str], Any] = {}
+        self._request_latency_children: Dict[str, Any] = {}
+        self._error_count_children: Dict[str, Any] = {}
+        
+        # In multiprocess mode each worker must write its own samples to
+        # PROMETHEUS_MULTIPROC_DIR, but only the worker serving a scrape would
+        # flush; counters are therefore incremented directly there
+        self._batch_counters = not os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+        
+        # Counter increments accumulated in memory and applied to Prometheus
+        # once per label set by flush_pending()
+        self._pending_lock = threading.Lock()
+        self._pending_requests: TallyCounter = TallyCounter()
+        self._pending_errors: TallyCounter = TallyCounter()
 
     def increment_request_count(self, endpoint: str, method: str) -> None:
         """
@@ -83,10 +119,11 @@ class MetricsCollector:
             
         Requirement: 7.1 High-Level Architecture/Core Components/LOG - System-wide metrics collection
         """
-        try:
-            self.request_count_total.labels(endpoint=endpoint, method=method).inc()
-        except Exception:
-            self.increment_error_count(SYS001)
+        if not self._batch_counters:
+            self._request_count_child(endpoint, method).inc()
+            return
+        with self._pending_lock:
+            self._pending_requests[(endpoint, method)] += 1
 
     def observe_request_latency(self, endpoint: str, duration: float) -> None:
         """
@@ -99,7 +136,12 @@ class MetricsCollector:
         Requirement: 11.5.2 Pipeline Stages - Performance metrics collection
         """
         try:
-            self.request_latency_seconds.labels(endpoint=endpoint).observe(duration)
+            child = self._request_latency_children.get(endpoint)
+            if child is None:
+                child = self._request_latency_children.setdefault(
+                    endpoint, self.request_latency_seconds.labels(endpoint=endpoint)
+                )
+            child.observe(duration)
         except Exception:
             self.increment_error_count(SYS001)
 
@@ -126,11 +168,52 @@ class MetricsCollector:
             
         Requirement: 7.1 High-Level Architecture/Core Components/LOG - Error tracking
         """
-        try:
-            self.error_count_total.labels(error_code=error_code).inc()
-        except Exception:
-            # Last resort error handling to avoid recursion
-            pass
+        if not self._batch_counters:
+            self._error_count_child(error_code).inc()
+            return
+        with self._pending_lock:
+            self._pending_errors[error_code] += 1
+
+    def _request_count_child(self, endpoint: str, method: str) -> Any:
+        """Returns the cached request counter child for the label values."""
+        key = (endpoint, method)
+        child = self._request_count_children.get(key)
+        if child is None:
+            child = self._request_count_children.setdefault(
+                key, self.request_count_total.labels(endpoint=endpoint, method=method)
+            )
+        return child
+
+    def _error_count_child(self, error_code: str) -> Any:
+        """Returns the cached error counter child for the error code."""
+        child = self._error_count_children.get(error_code)
+        if child is None:
+            child = self._error_count_children.setdefault(
+                error_code, self.error_count_total.labels(error_code=error_code)
+            )
+        return child
+
+    def flush_pending(self) -> None:
+        """
+        Applies accumulated counter increments to the Prometheus metrics.
+        
+        Each label set receives a single inc(n) regardless of how many events
+        were recorded since the previous flush. Nothing is pending in
+        multiprocess mode, where counters are incremented directly.
+        
+        Requirement: 11.5.2 Pipeline Stages - Performance metrics collection
+        """
+        with self._pending_lock:
+            pending_requests = self._pending_requests
+            pending_errors = self._pending_errors
+            self._pending_requests = TallyCounter()
+            self._pending_errors = TallyCounter()
+        
+        for (endpoint, method), count in pending_requests.items():
+            self._request_count_child(endpoint, method).inc(count)
+        
+        for error_code, count in pending_errors.items():
+            self._error_count_child(error_code).inc(count)
 
 def get_metrics_collector() -> MetricsCollector:
     """
@@ -142,14 +225,48 @@ def get_metrics_collector() -> MetricsCollector:
     Requirement: 7.1 High-Level Architecture/Core Components - Metrics collection
     """
     global _metrics_collector
-    if _metrics_collector is None:
-        try:
-            _metrics_collector = MetricsCollector()
-        except Exception:
-            # Handle initialization error
-            if _metrics_collector is None:
-                raise RuntimeError("Failed to initialize metrics collector")
-    return _metrics_collector
+    collector = _metrics_collector
+    if collector is not None:
+        return collector
+    
+    # Double-checked locking so concurrent first calls cannot register the
+    # Prometheus metrics twice
+    with _metrics_lock:
+        if _metrics_collector is None:
+            try:
+                _metrics_collector = MetricsCollector()
+            except Exception as e:
+                raise RuntimeError("Failed to initialize metrics collector") from e
+        return _metrics_collector
+
+def _render_metrics() -> bytes:
+    """
+    Renders metrics in Prometheus text format.
+    
+    When PROMETHEUS_MULTIPROC_DIR is set, samples written by every Gunicorn
+    worker are aggregated from the shared directory; otherwise only this
+    process's default registry is rendered.
+    
+    Returns:
+        bytes: Prometheus exposition payload
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+def mark_worker_dead(pid: int) -> None:
+    """
+    Removes live gauge files of an exited worker in multiprocess mode.
+    
+    Intended for Gunicorn's child_exit server hook.
+    
+    Args:
+        pid: Process ID of the exited worker
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(pid)
 
 def export_metrics() -> Response:
     """
@@ -160,10 +277,49 @@ def export_metrics() -> Response:
         
     Requirement: 11.5.2 Pipeline Stages - Metrics collection with health checks
     """
+    global _metrics_cache
     try:
-        metrics_data = generate_latest()
-        return Response(metrics_data, mimetype='text/plain; version=0.0.4')
+        timestamp, metrics_data = _metrics_cache
+        if time.monotonic() - timestamp >= METRICS_CACHE_TTL_SECONDS:
+            # Only one thread renders; concurrent scrapers reuse its output
+            with _metrics_cache_lock:
+                timestamp, metrics_data = _metrics_cache
+                if time.monotonic() - timestamp >= METRICS_CACHE_TTL_SECONDS:
+                    # Apply batched counter increments before rendering
+                    get_metrics_collector().flush_pending()
+                    metrics_data = _render_metrics()
+                    _metrics_cache = (time.monotonic(), metrics_data)
+        # Body is already bytes, so Response sets Content-Length from it
+        return Response(metrics_data, content_type=_PROM_MIMETYPE)
     except Exception:
         # Log metric export failure
         get_metrics_collector().increment_error_count(SYS002)
-        return Response("Metric export failed", status=500)
\ No newline at end of file
+        return Response("Metric export failed", status=500)
+
+def configure_metrics(app: Flask) -> None:
+    """
+    Register request instrumentation and the /metrics endpoint.
+    
+    Requirement: 11.5.2 Pipeline Stages - Performance metrics collection and monitoring
+    
+    Args:
+        app: Flask application instance
+    """
+    collector = get_metrics_collector()
+    
+    @app.before_request
+    def _start_request_timer() -> None:
+        """Record the request start time."""
+        g.metrics_start_time = time.perf_counter()
+    
+    @app.after_request
+    def _record_request_metrics(response: Response) -> Response:
+        """Record request count and latency for the matched endpoint."""
+        endpoint = request.endpoint or 'unmatched'
+        collector.increment_request_count(endpoint, request.method)
+        start_time = g.get('metrics_start_time')
+        if start_time is not None:
+            collector.observe_request_latency(endpoint, time.perf_counter() - start_time)
+        return response
+    
+    app.add_url_rule('/metrics', 'metrics', export_metrics, methods=['GET'])
@@ -16,35 +16,63 @@ from .auth import (
     LoginRequestSchema,
     LoginResponseSchema,
     TokenRefreshSchema,
-    UserSchema as AuthUserSchema
+    UserSchema as AuthUserSchema,
+    LoginRequestModel,
+    login_request_schema,
+    login_response_schema,
+    token_refresh_schema,
+    auth_user_schema
 )
 
 # User schemas
 from .user import (
     UserSchema,
     UserCreateSchema,
-    UserUpdateSchema
+    UserUpdateSchema,
+    user_schema,
+    user_create_schema,
+    user_update_schema
 )
 
 # Project schemas
 from .project import (
     ProjectSchema,
     ProjectCreateSchema,
-    ProjectUpdateSchema
+    ProjectUpdateSchema,
+    ProjectCreateModel,
+    ProjectOut,
+    dump_project,
+    dump_projects,
+    project_schema,
+    project_create_schema,
+    project_update_schema
 )
 
 # Specification schemas
 from .specification import (
     SpecificationSchema,
     SpecificationCreateSchema,
-    SpecificationUpdateSchema
+    SpecificationUpdateSchema,
+    SpecificationCreateModel,
+    SpecificationUpdateModel,
+    SpecificationOut,
+    dump_specification,
+    dump_specifications,
+    specification_schema,
+    specification_create_schema,
+    specification_update_schema
 )
 
 # Bullet item schemas
 from .bullet_item import (
     BulletItemSchema,
     BulletItemCreateSchema,
-    BulletItemUpdateSchema
+    BulletItemUpdateSchema,
+    BulletItemCreateModel,
+    BulletItemOut,
+    bullet_item_schema,
+    bullet_item_create_schema,
+    bullet_item_update_schema
 )
 
 # Schema exports for authentication
@@ -111,6 +139,40 @@ __all__ = [
     'BulletItemCreateSchema',
     'BulletItemUpdateSchema',
     
+    # Pydantic request models
+    'LoginRequestModel',
+    'ProjectCreateModel',
+    'SpecificationCreateModel',
+    'SpecificationUpdateModel',
+    'BulletItemCreateModel',
+    
+    # msgspec output structs and serializers
+    'ProjectOut',
+    'SpecificationOut',
+    'BulletItemOut',
+    'dump_project',
+    'dump_projects',
+    'dump_specification',
+    'dump_specifications',
+    
+    # Shared schema instances
+    'login_request_schema',
+    'login_response_schema',
+    'token_refresh_schema',
+    'auth_user_schema',
+    'user_schema',
+    'user_create_schema',
+    'user_update_schema',
+    'project_schema',
+    'project_create_schema',
+    'project_update_schema',
+    'specification_schema',
+    'specification_create_schema',
+    'specification_update_schema',
+    'bullet_item_schema',
+    'bullet_item_create_schema',
+    'bullet_item_update_schema',
+    
     # Schema collections
     'auth_schemas',
     'user_schemas',
@@ -9,14 +9,20 @@ Human Tasks:
 
 # External imports
 from marshmallow import Schema, fields, validates, ValidationError  # version: 3.0+
+from pydantic import BaseModel, StringConstraints  # version: 2.0+
+from typing import Annotated  # version: 3.9+
 from typing import Any, Dict  # version: 3.9+
 from datetime import datetime
+import re
 import uuid
 
 # Internal imports
 from ..utils.validators import validate_email
 from ..utils.constants import ERROR_CODES, JWT_ACCESS_TOKEN_EXPIRES, JWT_REFRESH_TOKEN_EXPIRES
 
+# JWT compact serialization: three dot-separated base64url segments
+_JWT_RE = re.compile(r'^[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+$')
+
 class LoginRequestSchema(Schema):
     """
     Schema for validating Google OAuth login requests.
@@ -28,16 +34,9 @@ class LoginRequestSchema(Schema):
     @validates("google_token")
     def validate_token(self, value: str) -> str:
         """Validates the Google OAuth token format."""
-        if not value or not isinstance(value, str):
-            raise ValidationError(ERROR_CODES["AUTH003"])
-            
-        # Basic token format validation - should be a non-empty string
+        # fields.String guarantees a str; standard OAuth2 token length limits
         value = value.strip()
-        if len(value) == 0:
-            raise ValidationError(ERROR_CODES["AUTH003"])
-            
-        # Token should be a reasonable length
-        if len(value) < 20 or len(value) > 2048:  # Standard OAuth2 token length limits
+        if not 20 <= len(value) <= 2048:
             raise ValidationError(ERROR_CODES["AUTH003"])
             
         return value
@@ -64,16 +63,9 @@ class TokenRefreshSchema(Schema):
     @validates("refresh_token")
     def validate_refresh_token(self, value: str) -> str:
         """Validates the refresh token format."""
-        if not value or not isinstance(value, str):
-            raise ValidationError(ERROR_CODES["AUTH001"])
-            
-        value = value.strip()
-        if len(value) == 0:
-            raise ValidationError(ERROR_CODES["AUTH001"])
-            
         # JWT tokens should be three dot-separated base64 strings
-        parts = value.split('.')
-        if len(parts) != 3:
+        value = value.strip()
+        if not _JWT_RE.match(value):
             raise ValidationError(ERROR_CODES["AUTH001"])
             
         return value
@@ -97,4 +89,24 @@ class UserSchema(Schema):
             validate_email(value)
             return value
         except ValidationError as e:
-            raise ValidationError(str(e))
\ No newline at end of file
+            raise ValidationError(str(e))
+
+class LoginRequestModel(BaseModel):
+    """
+    Pydantic model validating Google OAuth login requests on the hot path.
+    
+    Mirrors LoginRequestSchema; validation runs in pydantic-core.
+    
+    Requirement: User Management - Secure authentication through Google Cloud User Store
+    """
+    # Standard OAuth2 token length limits, checked after stripping whitespace
+    google_token: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=20, max_length=2048)
+    ]
+
+# Auth schema instances shared across requests
+login_request_schema = LoginRequestSchema()
+login_response_schema = LoginResponseSchema()
+token_refresh_schema = TokenRefreshSchema()
+auth_user_schema = UserSchema()
@@ -11,33 +11,26 @@ Human Tasks:
 from marshmallow import Schema, fields, validates, ValidationError  # version: 3.0+
 from typing import Any  # version: 3.9+
 from uuid import UUID
+from pydantic import BaseModel, Field, StringConstraints  # version: 2.0+
+from typing import Annotated, Optional  # version: 3.9+
+from datetime import datetime  # version: 3.9+
+import msgspec  # version: 0.18+
 
 # Internal imports
 from ..models.bullet_item import BulletItem
-from ..utils.validators import validate_bullet_item
+from ..utils.validators import validate_bullet_item, MAX_CONTENT_LENGTH
+from ..utils.exceptions import ValidationError as APIValidationError
 
-class BulletItemSchema(Schema):
+# Valid bullet item order positions (0-9); fields.Integer guarantees an int
+_VALID_ORDERS = frozenset(range(10))
+
+class BulletItemValidationSchema(Schema):
     """
-    Marshmallow schema for validating and serializing bullet item data.
+    Base schema holding the field validators shared by the bullet item schemas.
     
     Requirement: Data Management - Data validation and constraint enforcement for bullet items
     """
     
-    # Primary fields
-    id = fields.UUID(dump_only=True)
-    spec_id = fields.UUID(required=True)
-    content = fields.String(required=True)
-    order = fields.Integer(required=True)
-    
-    # Timestamps
-    created_at = fields.DateTime(dump_only=True)
-    updated_at = fields.DateTime(dump_only=True)
-    
-    class Meta:
-        """Schema metadata configuration."""
-        model = BulletItem
-        ordered = True
-    
     @validates("content")
     def validate_content(self, content: str) -> bool:
         """
@@ -56,8 +49,8 @@ class BulletItemSchema(Schema):
         """
         try:
             return validate_bullet_item(content, 0)  # Order is validated separately
-        except ValidationError as e:
-            raise ValidationError(e.messages.get('content', ['Invalid content']))
+        except APIValidationError as e:
+            raise ValidationError(e.errors.get('content', ['Invalid content']))
     
     @validates("order")
     def validate_order(self, order: int) -> bool:
@@ -75,11 +68,32 @@ class BulletItemSchema(Schema):
         Raises:
             ValidationError: If order is invalid
         """
-        if not isinstance(order, int) or order < 0 or order > 9:
+        if order not in _VALID_ORDERS:
             raise ValidationError("Order must be between 0 and 9")
         return True
 
-class BulletItemCreateSchema(Schema):
+class BulletItemSchema(BulletItemValidationSchema):
+    """
+    Marshmallow schema for validating and serializing bullet item data.
+    
+    Requirement: Data Management - Data validation and constraint enforcement for bullet items
+    """
+    
+    # Primary fields
+    id = fields.UUID(dump_only=True)
+    spec_id = fields.UUID(required=True)
+    content = fields.String(required=True)
+    order = fields.Integer(required=True)
+    
+    # Timestamps
+    created_at = fields.DateTime(dump_only=True)
+    updated_at = fields.DateTime(dump_only=True)
+    
+    class Meta:
+        """Schema metadata configuration."""
+        model = BulletItem
+
+class BulletItemCreateSchema(BulletItemValidationSchema):
     """
     Schema for validating bullet item creation requests.
     
@@ -89,45 +103,8 @@ class BulletItemCreateSchema(Schema):
     content = fields.String(required=True)
     order = fields.Integer(required=True)
     spec_id = fields.UUID(required=True)
-    
-    @validates("content")
-    def validate_content(self, content: str) -> bool:
-        """
-        Validate content for bullet item creation.
-        
-        Args:
-            content: The bullet item content
-            
-        Returns:
-            bool: True if valid
-            
-        Raises:
-            ValidationError: If content is invalid
-        """
-        try:
-            return validate_bullet_item(content, 0)  # Order validated separately
-        except ValidationError as e:
-            raise ValidationError(e.messages.get('content', ['Invalid content']))
-    
-    @validates("order")
-    def validate_order(self, order: int) -> bool:
-        """
-        Validate order for bullet item creation.
-        
-        Args:
-            order: The order value
-            
-        Returns:
-            bool: True if valid
-            
-        Raises:
-            ValidationError: If order is invalid
-        """
-        if not isinstance(order, int) or order < 0 or order > 9:
-            raise ValidationError("Order must be between 0 and 9")
-        return True
 
-class BulletItemUpdateSchema(Schema):
+class BulletItemUpdateSchema(BulletItemValidationSchema):
     """
     Schema for validating bullet item update requests.
     
@@ -136,40 +113,58 @@ class BulletItemUpdateSchema(Schema):
     
     content = fields.String(required=False)
     order = fields.Integer(required=False)
+
+class BulletItemCreateModel(BaseModel):
+    """
+    Pydantic model validating bullet item creation requests on the hot path.
     
-    @validates("content")
-    def validate_content(self, content: str) -> bool:
-        """
-        Validate content for bullet item update.
-        
-        Args:
-            content: The bullet item content
-            
-        Returns:
-            bool: True if valid
-            
-        Raises:
-            ValidationError: If content is invalid
-        """
-        try:
-            return validate_bullet_item(content, 0)  # Order validated separately
-        except ValidationError as e:
-            raise ValidationError(e.messages.get('content', ['Invalid content']))
+    Mirrors BulletItemCreateSchema; validation runs in pydantic-core.
     
-    @validates("order")
-    def validate_order(self, order: int) -> bool:
+    Requirement: Data Management - Data validation for bullet item creation
+    """
+    content: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=MAX_CONTENT_LENGTH)
+    ]
+    order: Annotated[int, Field(ge=0, le=9)]
+    spec_id: UUID
+
+class BulletItemOut(msgspec.Struct, gc=False):
+    """
+    Output struct for bullet items; converted to builtins by msgspec in C.
+    
+    Field set matches BulletItemSchema dumps.
+    
+    Requirement: Data Management - Data serialization for bullet items
+    """
+    id: UUID
+    spec_id: UUID
+    content: str
+    order: int
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_model(cls, item: BulletItem) -> 'BulletItemOut':
         """
-        Validate order for bullet item update.
+        Build the output struct from a bullet item model.
         
         Args:
-            order: The order value
+            item: BulletItem instance
             
         Returns:
-            bool: True if valid
-            
-        Raises:
-            ValidationError: If order is invalid
+            BulletItemOut: Struct with the serialized fields
         """
-        if not isinstance(order, int) or order < 0 or order > 9:
-            raise ValidationError("Order must be between 0 and 9")
-        return True
\ No newline at end of file
+        return cls(
+            id=item.id,
+            spec_id=item.spec_id,
+            content=item.content,
+            order=item.order,
+            created_at=item.created_at,
+            updated_at=item.updated_at
+        )
+
+# Bullet item schema instances shared across requests
+bullet_item_schema = BulletItemSchema()
+bullet_item_create_schema = BulletItemCreateSchema()
+bullet_item_update_schema = BulletItemUpdateSchema()
@@ -10,25 +10,25 @@ Human Tasks:
 # External imports
 from marshmallow import Schema, fields, validates, ValidationError  # version: 3.0+
 from typing import Any  # version: 3.9+
+from uuid import UUID
 from datetime import datetime
+import msgspec  # version: 0.18+
+from pydantic import BaseModel, StringConstraints  # version: 2.0+
+from typing import Annotated, Dict, List, Optional  # version: 3.9+
 
 # Internal imports
-from ..utils.validators import validate_project_title
+from ..utils.validators import validate_project_title, MAX_TITLE_LENGTH, TITLE_PATTERN
 from ..utils.constants import ERROR_CODES
+from ..utils.exceptions import ValidationError as APIValidationError
+from ..models.project import Project
 
-class ProjectSchema(Schema):
+class ProjectValidationSchema(Schema):
     """
-    Marshmallow schema for project data validation and serialization.
+    Base schema holding the title validator shared by the project schemas.
     
-    Requirement: Project Organization - Creation and management of projects with single-user ownership model
+    Requirement: Data Management - Data validation and constraint enforcement for project operations
     """
-    id = fields.UUID(required=True, dump_only=True)
-    title = fields.String(required=True)
-    user_id = fields.UUID(required=True, dump_only=True)
-    created_at = fields.DateTime(dump_only=True)
-    updated_at = fields.DateTime(dump_only=True)
-    is_deleted = fields.Boolean(dump_only=True)
-
+    
     @validates('title')
     def validate_title(self, value: str) -> str:
         """
@@ -48,46 +48,34 @@ class ProjectSchema(Schema):
         try:
             validate_project_title(value)
             return value
-        except ValidationError as e:
+        except APIValidationError:
             raise ValidationError(
                 ERROR_CODES['PRJ001'],
                 field_name='title'
             )
 
-class ProjectCreateSchema(Schema):
+class ProjectSchema(ProjectValidationSchema):
     """
-    Schema for validating project creation requests.
+    Marshmallow schema for project data validation and serialization.
     
     Requirement: Project Organization - Creation and management of projects with single-user ownership model
     """
+    id = fields.UUID(required=True, dump_only=True)
     title = fields.String(required=True)
+    user_id = fields.UUID(required=True, dump_only=True)
+    created_at = fields.DateTime(dump_only=True)
+    updated_at = fields.DateTime(dump_only=True)
+    is_deleted = fields.Boolean(dump_only=True)
 
-    @validates('title')
-    def validate_title(self, value: str) -> str:
-        """
-        Custom validator for project title field during creation.
-        
-        Requirement: Data Management - Data validation and constraint enforcement for project operations
-        
-        Args:
-            value: The project title to validate
-            
-        Returns:
-            str: Validated title if valid
-            
-        Raises:
-            ValidationError: If validation fails with PRJ001 code
-        """
-        try:
-            validate_project_title(value)
-            return value
-        except ValidationError as e:
-            raise ValidationError(
-                ERROR_CODES['PRJ001'],
-                field_name='title'
-            )
+class ProjectCreateSchema(ProjectValidationSchema):
+    """
+    Schema for validating project creation requests.
+    
+    Requirement: Project Organization - Creation and management of projects with single-user ownership model
+    """
+    title = fields.String(required=True)
 
-class ProjectUpdateSchema(Schema):
+class ProjectUpdateSchema(ProjectValidationSchema):
     """
     Schema for validating project update requests.
     
@@ -95,27 +83,88 @@ class ProjectUpdateSchema(Schema):
     """
     title = fields.String(required=True)
 
-    @validates('title')
-    def validate_title(self, value: str) -> str:
+class ProjectCreateModel(BaseModel):
+    """
+    Pydantic model validating project creation requests on the hot path.
+    
+    Mirrors ProjectCreateSchema; validation runs in pydantic-core.
+    
+    Requirement: Project Organization - Creation and management of projects with single-user ownership model
+    """
+    title: Annotated[
+        str,
+        StringConstraints(
+            strip_whitespace=True,
+            min_length=1,
+            max_length=MAX_TITLE_LENGTH,
+            pattern=TITLE_PATTERN
+        )
+    ]
+
+class ProjectOut(msgspec.Struct, gc=False):
+    """
+    Output struct for projects, mirroring ProjectSchema.
+    
+    Every dumped dict reuses the struct's field name strings as keys, and
+    the structs are untracked by the cyclic GC, so large project lists
+    allocate only the row values.
+    
+    Requirement: Project Organization - Creation and management of projects with single-user ownership model
+    """
+    id: UUID
+    title: str
+    user_id: UUID
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    is_deleted: Optional[bool]
+
+    @classmethod
+    def from_model(cls, project: Project) -> 'ProjectOut':
         """
-        Custom validator for project title field during update.
-        
-        Requirement: Data Management - Data validation and constraint enforcement for project operations
+        Build the output struct from a project model.
         
         Args:
-            value: The project title to validate
+            project: Project instance
             
         Returns:
-            str: Validated title if valid
-            
-        Raises:
-            ValidationError: If validation fails with PRJ001 code
+            ProjectOut: Struct with the serialized fields
         """
-        try:
-            validate_project_title(value)
-            return value
-        except ValidationError as e:
-            raise ValidationError(
-                ERROR_CODES['PRJ001'],
-                field_name='title'
-            )
\ No newline at end of file
+        return cls(
+            id=project.id,
+            title=project.title,
+            user_id=project.user_id,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            is_deleted=project.is_deleted
+        )
+
+def dump_project(project: Project) -> Dict[str, Any]:
+    """
+    Serialize a project to JSON-compatible builtins.
+    
+    Requirement: Project Organization - Creation and management of projects with single-user ownership model
+    
+    Args:
+        project: Project instance
+        
+    Returns:
+        Dict[str, Any]: Project data with UUIDs and datetimes as strings
+    """
+    return msgspec.to_builtins(ProjectOut.from_model(project))
+
+def dump_projects(projects: List[Project]) -> List[Dict[str, Any]]:
+    """
+    Serialize several projects in a single msgspec call.
+    
+    Args:
+        projects: Project instances
+        
+    Returns:
+        List[Dict[str, Any]]: Serialized projects
+    """
+    return msgspec.to_builtins([ProjectOut.from_model(project) for project in projects])
+
+# Project schema instances shared across requests
+project_schema = ProjectSchema()
+project_create_schema = ProjectCreateSchema()
+project_update_schema = ProjectUpdateSchema()
@@ -8,13 +8,32 @@ Human Tasks:
 """
 
 # External imports
-from marshmallow import Schema, fields, validates, ValidationError  # version: 3.0+
+from marshmallow import Schema, fields, ValidationError  # version: 3.0+
 from typing import Any  # version: 3.9+
 from uuid import UUID
+from typing import Annotated, Dict, List, Optional  # version: 3.9+
+from datetime import datetime  # version: 3.9+
+import msgspec  # version: 0.18+
+from pydantic import BaseModel, StringConstraints  # version: 2.0+
 
 # Internal imports
 from ..models.specification import Specification
-from .bullet_item import BulletItemSchema
+from .bullet_item import BulletItemSchema, BulletItemOut
+
+def _nonblank(content: str) -> None:
+    """
+    Field validator rejecting empty or whitespace-only specification content.
+    
+    Requirement: Data Management - Data validation and constraint enforcement
+    
+    Args:
+        content: The specification content to validate
+        
+    Raises:
+        ValidationError: If content validation fails
+    """
+    if not content or not content.strip():
+        raise ValidationError("Specification content cannot be empty")
 
 class SpecificationSchema(Schema):
     """
@@ -26,7 +45,7 @@ class SpecificationSchema(Schema):
     # Primary fields
     spec_id = fields.UUID(dump_only=True)
     project_id = fields.UUID(required=True)
-    content = fields.String(required=True)
+    content = fields.String(required=True, validate=_nonblank)
     
     # Nested fields
     bullet_items = fields.Nested(
@@ -52,30 +71,6 @@ class SpecificationSchema(Schema):
         Requirement: Data Management - Schema configuration for validation
         """
         super().__init__(*args, **kwargs)
-    
-    @validates("content")
-    def validate_content(self, content: str) -> bool:
-        """
-        Validate specification content is not empty.
-        
-        Requirement: Data Management - Data validation and constraint enforcement
-        
-        Args:
-            content: The specification content to validate
-            
-        Returns:
-            bool: True if content is valid
-            
-        Raises:
-            ValidationError: If content validation fails
-        """
-        if not content or not content.strip():
-            raise ValidationError("Specification content cannot be empty")
-        
-        # Additional content validation could be added here
-        # e.g., length limits, format requirements, etc.
-        
-        return True
 
 class SpecificationCreateSchema(Schema):
     """
@@ -85,7 +80,7 @@ class SpecificationCreateSchema(Schema):
     """
     
     project_id = fields.UUID(required=True)
-    content = fields.String(required=True)
+    content = fields.String(required=True, validate=_nonblank)
     
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """
@@ -95,24 +90,6 @@ class SpecificationCreateSchema(Schema):
         """
         super().__init__(*args, **kwargs)
         self.unknown = fields.EXCLUDE
-    
-    @validates("content")
-    def validate_content(self, content: str) -> bool:
-        """
-        Validate content for specification creation.
-        
-        Args:
-            content: The specification content
-            
-        Returns:
-            bool: True if valid
-            
-        Raises:
-            ValidationError: If content is invalid
-        """
-        if not content or not content.strip():
-            raise ValidationError("Specification content cannot be empty")
-        return True
 
 class SpecificationUpdateSchema(Schema):
     """
@@ -121,7 +98,7 @@ class SpecificationUpdateSchema(Schema):
     Requirement: Data Management - Data validation for specification updates
     """
     
-    content = fields.String(required=True)
+    content = fields.String(required=True, validate=_nonblank)
     
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """
@@ -131,21 +108,81 @@ class SpecificationUpdateSchema(Schema):
         """
         super().__init__(*args, **kwargs)
         self.unknown = fields.EXCLUDE
+
+# Non-blank specification content, stripped by pydantic-core
+SpecificationContent = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+class SpecificationCreateModel(BaseModel):
+    """
+    Pydantic model validating specification creation requests on the hot path.
     
-    @validates("content")
-    def validate_content(self, content: str) -> bool:
-        """
-        Validate content for specification update.
+    Mirrors SpecificationCreateSchema; unknown keys are ignored like EXCLUDE.
+    
+    Requirement: Data Management - Data validation for specification creation
+    """
+    project_id: UUID
+    content: SpecificationContent
+
+class SpecificationUpdateModel(BaseModel):
+    """
+    Pydantic model validating specification update requests on the hot path.
+    
+    Mirrors SpecificationUpdateSchema; unknown keys are ignored like EXCLUDE.
+    
+    Requirement: Data Management - Data validation for specification updates
+    """
+    content: SpecificationContent
+
+class SpecificationOut(msgspec.Struct, gc=False):
+    """
+    Output struct for specifications with nested bullet items.
+    
+    msgspec walks the struct in C, replacing marshmallow's per-field dispatch
+    on the read path.
+    
+    Requirement: Data Management - Data serialization for specifications
+    """
+    spec_id: UUID
+    project_id: UUID
+    content: str
+    bullet_items: List[BulletItemOut]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+def dump_specification(specification: Specification) -> Dict[str, Any]:
+    """
+    Serialize a specification to JSON-compatible builtins.
+    
+    Requirement: Data Management - Data serialization for specifications
+    
+    Args:
+        specification: Specification instance with its bullet items loaded
         
-        Args:
-            content: The specification content
-            
-        Returns:
-            bool: True if valid
-            
-        Raises:
-            ValidationError: If content is invalid
-        """
-        if not content or not content.strip():
-            raise ValidationError("Specification content cannot be empty")
-        return True
\ No newline at end of file
+    Returns:
+        Dict[str, Any]: Specification data with UUIDs and datetimes as strings
+    """
+    return msgspec.to_builtins(SpecificationOut(
+        spec_id=specification.id,
+        project_id=specification.project_id,
+        content=specification.content,
+        bullet_items=[BulletItemOut.from_model(item) for item in specification.bullet_items],
+        created_at=specification.created_at,
+        updated_at=specification.updated_at
+    ))
+
+def dump_specifications(specifications: List[Specification]) -> List[Dict[str, Any]]:
+    """
+    Serialize several specifications to JSON-compatible builtins.
+    
+    Args:
+        specifications: Specification instances
+        
+    Returns:
+        List[Dict[str, Any]]: Serialized specifications
+    """
+    return [dump_specification(specification) for specification in specifications]
+
+# Specification schema instances shared across requests
+specification_schema = SpecificationSchema()
+specification_create_schema = SpecificationCreateSchema()
+specification_update_schema = SpecificationUpdateSchema()
@@ -8,12 +8,30 @@ Human Tasks:
 """
 
 # External imports - versions specified as per requirements
-from marshmallow import Schema, fields, validates, ValidationError  # version: 3.0+
+from marshmallow import Schema, fields, ValidationError  # version: 3.0+
 from typing import Any  # version: 3.9+
 
 # Internal imports
 from ..models.user import User
 from ..utils.validators import validate_email
+from ..utils.exceptions import ValidationError as APIValidationError
+
+def _validate_email_field(value: str) -> None:
+    """
+    Field validator applying the application's email validation rules.
+    
+    Requirement: 1.2 Scope/4. Data Management - Data validation
+    
+    Args:
+        value: Email address to validate
+        
+    Raises:
+        ValidationError: If email validation fails
+    """
+    try:
+        validate_email(value)
+    except APIValidationError as e:
+        raise ValidationError(e.errors['email'])
 
 class UserSchema(Schema):
     """
@@ -30,34 +48,12 @@ class UserSchema(Schema):
     last_login = fields.DateTime(dump_only=True)
     
     # Read-write fields
-    email = fields.Email(required=True)
+    email = fields.Email(required=True, validate=_validate_email_field)
     name = fields.String(required=True)
     
     class Meta:
         """Schema configuration."""
         ordered = True
-        
-    @validates('email')
-    def validate_email(self, value: str) -> str:
-        """
-        Custom email validator using application's email validation rules.
-        
-        Requirement: 1.2 Scope/4. Data Management - Data validation
-        
-        Args:
-            value: Email address to validate
-            
-        Returns:
-            str: Validated email address
-            
-        Raises:
-            ValidationError: If email validation fails
-        """
-        try:
-            validate_email(value)
-            return value
-        except ValidationError as e:
-            raise ValidationError(e.messages['email'])
 
 class UserCreateSchema(Schema):
     """
@@ -66,32 +62,12 @@ class UserCreateSchema(Schema):
     Requirement: 1.2 Scope/1. User Management - User data validation
     """
     
-    email = fields.Email(required=True)
+    email = fields.Email(required=True, validate=_validate_email_field)
     name = fields.String(required=True)
     
     class Meta:
         """Schema configuration."""
         ordered = True
-        
-    @validates('email')
-    def validate_email(self, value: str) -> str:
-        """
-        Validate email for user creation.
-        
-        Args:
-            value: Email address to validate
-            
-        Returns:
-            str: Validated email address
-            
-        Raises:
-            ValidationError: If email validation fails
-        """
-        try:
-            validate_email(value)
-            return value
-        except ValidationError as e:
-            raise ValidationError(e.messages['email'])
 
 class UserUpdateSchema(Schema):
     """
@@ -104,4 +80,9 @@ class UserUpdateSchema(Schema):
     
     class Meta:
         """Schema configuration."""
-        ordered = True
\ No newline at end of file
+        ordered = True
+
+# User schema instances shared across requests
+user_schema = UserSchema()
+user_create_schema = UserCreateSchema()
+user_update_schema = UserUpdateSchema()
@@ -11,6 +11,17 @@ Human Tasks:
 # External imports - versions specified as per requirements
 from typing import Dict, Any  # version: 3.9+
 
+# Optional JIT for marshmallow dump/load; patches marshmallow.Schema in place so
+# the shared schema instances pick up generated serializers on first use
+try:
+    from deepfriedmarshmallow import deep_fry_marshmallow  # version: 1.0+
+except ImportError:
+    deep_fry_marshmallow = None
+
+# Requirement: 1.2 Scope/4. Data Management - Serialization throughput for list endpoints
+if deep_fry_marshmallow is not None:
+    deep_fry_marshmallow()
+
 # Internal imports - Service classes
 from .auth_service import AuthenticationService
 from .project_service import ProjectService
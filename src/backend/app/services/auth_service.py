@@ -11,16 +11,62 @@ Human Tasks:
 """
 
 # External imports - versions specified as per requirements
+from concurrent.futures import ThreadPoolExecutor  # version: 3.9+
 from datetime import datetime  # version: 3.9+
-from typing import Dict, Any, Optional  # version: 3.9+
-from google.oauth2 import id_token  # version: 2.0+
-from google.auth.transport import requests  # version: 2.0+
+import json  # version: 3.9+
+import threading  # version: 3.9+
+import time  # version: 3.9+
+from types import ModuleType  # version: 3.9+
+from typing import Dict, Any, Optional, Tuple, Type  # version: 3.9+
+from uuid import UUID  # version: 3.9+
 
 # Internal imports
 from ..models.user import User
 from ..database.session import session_scope
 from ..utils.security import generate_jwt_token, validate_jwt_token
 from ..cache.redis import RedisCache
+from ..cache.keys import make_key, make_user_email_key, LAST_LOGIN_PREFIX
+from ..utils.exceptions import AuthenticationError
+
+# Google OAuth2 signing certificates and accepted ID token issuers
+GOOGLE_CERTS_URL = 'https://www.googleapis.com/oauth2/v1/certs'
+GOOGLE_ISSUERS = frozenset(('accounts.google.com', 'https://accounts.google.com'))
+
+# Shared Redis key and lifetime of the cached certificates
+GOOGLE_CERTS_CACHE_KEY = 'google:jwks'
+GOOGLE_CERTS_TTL_SECONDS = 21600  # 6 hours
+
+# Age in seconds after which cached certificates are refreshed in the background
+GOOGLE_CERTS_REFRESH_SECONDS = 3600
+
+# Lifetime in seconds of cached email to user ID lookups
+USER_LOOKUP_TTL_SECONDS = 300
+
+# Minimum interval in seconds between persisted last_login updates per user
+LAST_LOGIN_WRITE_INTERVAL_SECONDS = 300
+
+# Single worker so at most one certificate refresh runs per process
+_certs_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='google-certs')
+
+# google-auth modules as (jwt, transport.requests, GoogleAuthError), imported
+# on the first Google login rather than at worker startup
+_google_auth: Optional[Tuple[ModuleType, ModuleType, Type[Exception]]] = None
+
+def _import_google_auth() -> Tuple[ModuleType, ModuleType, Type[Exception]]:
+    """
+    Import the google-auth modules used for ID token verification once.
+    
+    Returns:
+        Tuple of the google.auth.jwt module, the google.auth.transport.requests
+        module and the GoogleAuthError base exception
+    """
+    global _google_auth
+    if _google_auth is None:
+        from google.auth import jwt as google_jwt  # version: 2.0+
+        from google.auth.exceptions import GoogleAuthError  # version: 2.0+
+        from google.auth.transport import requests  # version: 2.0+
+        _google_auth = (google_jwt, requests, GoogleAuthError)
+    return _google_auth
 
 class AuthenticationService:
     """
@@ -31,6 +77,8 @@ class AuthenticationService:
     Requirement: 10.1.3 Token Management - JWT-based session management
     """
     
+    __slots__ = ('_cache', '_http_request', '_google_certs', '_certs_lock', '_certs_refreshing')
+    
     def __init__(self, cache: RedisCache) -> None:
         """
         Initialize authentication service with Redis cache.
@@ -39,6 +87,78 @@ class AuthenticationService:
             cache: Redis cache instance for token management
         """
         self._cache = cache
+        self._http_request = None
+        
+        # Process-local copy of Google's certificates as (fetched_at, certs)
+        self._google_certs: Optional[Tuple[float, Dict[str, str]]] = None
+        self._certs_lock = threading.Lock()
+        self._certs_refreshing = False
+
+    def _fetch_google_certs(self) -> Tuple[float, Dict[str, str]]:
+        """
+        Download Google's signing certificates and share them through Redis.
+        
+        Returns:
+            Tuple[float, Dict[str, str]]: Fetch timestamp and certificates keyed by key ID
+            
+        Raises:
+            AuthenticationError: If the certificates cannot be retrieved
+        """
+        if self._http_request is None:
+            self._http_request = _import_google_auth()[1].Request()
+        response = self._http_request(url=GOOGLE_CERTS_URL, method='GET')
+        if response.status != 200:
+            raise AuthenticationError('AUTH003')
+        
+        entry = (time.time(), json.loads(response.data))
+        self._google_certs = entry
+        self._cache.set(
+            GOOGLE_CERTS_CACHE_KEY,
+            {'fetched_at': entry[0], 'certs': entry[1]},
+            ttl=GOOGLE_CERTS_TTL_SECONDS
+        )
+        return entry
+
+    def _refresh_google_certs(self) -> None:
+        """
+        Background refresh; on failure the stale certificates stay in use.
+        """
+        try:
+            self._fetch_google_certs()
+        except Exception:
+            pass
+        finally:
+            self._certs_refreshing = False
+
+    def _get_google_certs(self) -> Dict[str, str]:
+        """
+        Return Google's signing certificates using stale-while-revalidate caching.
+        
+        Certificates are served from process memory, then Redis; only the first
+        request without any cached copy blocks on the network fetch. Copies older
+        than GOOGLE_CERTS_REFRESH_SECONDS are returned immediately while a
+        background refresh runs.
+        
+        Requirement: 1.1 System Overview/Authentication Layer - Google Cloud User Store integration
+        
+        Returns:
+            Dict[str, str]: Certificates keyed by key ID
+        """
+        entry = self._google_certs
+        if entry is None:
+            cached = self._cache.get(GOOGLE_CERTS_CACHE_KEY)
+            if cached:
+                entry = self._google_certs = (cached['fetched_at'], cached['certs'])
+            else:
+                with self._certs_lock:
+                    entry = self._google_certs or self._fetch_google_certs()
+        
+        if time.time() - entry[0] >= GOOGLE_CERTS_REFRESH_SECONDS and not self._certs_refreshing:
+            with self._certs_lock:
+                if not self._certs_refreshing:
+                    self._certs_refreshing = True
+                    _certs_executor.submit(self._refresh_google_certs)
+        return entry[1]
 
     def authenticate_google_token(self, google_token: str) -> Dict[str, Any]:
         """
@@ -55,63 +175,105 @@ class AuthenticationService:
             
         Raises:
             AuthenticationError: If token validation fails
+            DatabaseError: If the database or cache is unavailable
         """
+        google_jwt, _, GoogleAuthError = _import_google_auth()
         try:
-            # Verify Google token
-            idinfo = id_token.verify_oauth2_token(
-                google_token,
-                requests.Request()
-            )
+            # Verify Google token against the cached signing certificates
+            idinfo = google_jwt.decode(google_token, certs=self._get_google_certs())
+        except (ValueError, GoogleAuthError) as e:
+            raise AuthenticationError('AUTH003') from e
+
+        if idinfo.get('iss') not in GOOGLE_ISSUERS or not idinfo.get('email'):
+            raise AuthenticationError('AUTH003')
+
+        # Extract user information
+        email = idinfo['email']
+        name = idinfo.get('name', email.split('@')[0])
 
-            # Extract user information
-            email = idinfo['email']
-            name = idinfo.get('name', email.split('@')[0])
+        # Get or create user in database, resolving known users by primary key
+        user_key = make_user_email_key(email)
+        cached_user_id = self._cache.get(user_key)
+        with session_scope() as session:
+            # Soft-deleted users are filtered by the session, so a stale entry
+            # falls through to the email query below
+            user = session.get(User, UUID(cached_user_id)) if cached_user_id else None
 
-            # Get or create user in database
-            with session_scope() as session:
+            if user is None:
                 user = session.query(User).filter(
                     User.email == email,
                     User.is_deleted.is_(False)
                 ).first()
 
-                if not user:
-                    user = User(email=email, name=name)
-                    session.add(user)
-
-                # Update last login
+            if not user:
+                user = User(email=email, name=name)
+                session.add(user)
                 user.update_last_login()
                 session.commit()
-
-                # Generate tokens
-                user_data = user.to_dict()
-                access_payload = {
-                    'user_id': user_data['id'],
-                    'email': user_data['email'],
-                    'type': 'access'
-                }
-                refresh_payload = {
-                    'user_id': user_data['id'],
-                    'type': 'refresh'
-                }
-
-                access_token = generate_jwt_token(access_payload)
-                refresh_token = generate_jwt_token(refresh_payload, is_refresh_token=True)
-
-                # Cache refresh token
                 self._cache.set(
-                    f"refresh_token:{refresh_token}",
-                    {'user_id': user_data['id']},
-                    ttl=86400  # 24 hours
+                    make_key(LAST_LOGIN_PREFIX, str(user.id)),
+                    user.last_login.isoformat(),
+                    ttl=LAST_LOGIN_WRITE_INTERVAL_SECONDS
                 )
+            elif self._cache.set_if_absent(
+                make_key(LAST_LOGIN_PREFIX, str(user.id)),
+                datetime.utcnow().isoformat(),
+                ttl=LAST_LOGIN_WRITE_INTERVAL_SECONDS
+            ):
+                # Persist last login at most once per interval; repeated logins
+                # within the window skip the UPDATE on the users row
+                user.update_last_login()
+                session.commit()
 
-                return {
-                    'access_token': access_token,
-                    'refresh_token': refresh_token,
-                    'user': user_data
-                }
+            if cached_user_id != str(user.id):
+                self._cache.set(user_key, str(user.id), ttl=USER_LOOKUP_TTL_SECONDS)
 
-        except Exception as e:
-            raise AuthenticationError('AUTH003') from e
+            # Generate tokens
+            user_data = user.to_dict()
+            access_payload = {
+                'user_id': user_data['id'],
+                'email': user_data['email'],
+                'type': 'access'
+            }
+            refresh_payload = {
+                'user_id': user_data['id'],
+                'type': 'refresh'
+            }
+
+            access_token = generate_jwt_token(access_payload)
+            refresh_token = generate_jwt_token(refresh_payload, is_refresh_token=True)
+
+            # Cache refresh token
+            self._cache.set(
+                f"refresh_token:{refresh_token}",
+                {'user_id': user_data['id']},
+                ttl=86400  # 24 hours
+            )
+
+            return {
+                'access_token': access_token,
+                'refresh_token': refresh_token,
+                'user': user_data
+            }
+
+    def _decode_token(self, token: str, token_type: str) -> Dict[str, Any]:
+        """
+        Validate a JWT and verify its type claim.
+        
+        Args:
+            token: JWT to validate
+            token_type: Expected value of the 'type' claim
+            
+        Returns:
+            Dict containing decoded token payload
+            
+        Raises:
+            AuthenticationError: If the token is invalid, expired or of another type
+        """
+        payload = validate_jwt_token(token)
+        if payload.get('type') != token_type:
+            raise AuthenticationError('AUTH001')
+        return payload
 
     def refresh_token(self, refresh_token: str) -> Dict[str, str]:
         """
@@ -127,34 +289,28 @@ class AuthenticationService:
             
         Raises:
             AuthenticationError: If refresh token is invalid or blacklisted
+            DatabaseError: If the cache is unavailable
         """
-        try:
-            # Validate refresh token
-            payload = validate_jwt_token(refresh_token)
-            if payload['type'] != 'refresh':
-                raise AuthenticationError('AUTH001')
+        # Validate refresh token
+        self._decode_token(refresh_token, 'refresh')
 
-            # Check if token is blacklisted
-            if self._cache.get(f"blacklist:{refresh_token}"):
-                raise AuthenticationError('AUTH001')
-
-            # Get cached token data
-            token_data = self._cache.get(f"refresh_token:{refresh_token}")
-            if not token_data:
-                raise AuthenticationError('AUTH001')
-
-            # Generate new access token
-            access_payload = {
-                'user_id': token_data['user_id'],
-                'type': 'access'
-            }
-            
-            return {
-                'access_token': generate_jwt_token(access_payload)
-            }
+        # Check blacklist and fetch cached token data in one round-trip
+        blacklisted, token_data = self._cache.get_many((
+            f"blacklist:{refresh_token}",
+            f"refresh_token:{refresh_token}"
+        ))
+        if blacklisted or not token_data:
+            raise AuthenticationError('AUTH001')
 
-        except Exception as e:
-            raise AuthenticationError('AUTH001') from e
+        # Generate new access token
+        access_payload = {
+            'user_id': token_data['user_id'],
+            'type': 'access'
+        }
+        
+        return {
+            'access_token': generate_jwt_token(access_payload)
+        }
 
     def logout(self, refresh_token: str) -> bool:
         """
@@ -170,28 +326,25 @@ class AuthenticationService:
             
         Raises:
             AuthenticationError: If refresh token is invalid
+            DatabaseError: If the cache is unavailable
         """
-        try:
-            # Validate refresh token
-            payload = validate_jwt_token(refresh_token)
-            if payload['type'] != 'refresh':
-                raise AuthenticationError('AUTH001')
+        # Validate refresh token
+        payload = self._decode_token(refresh_token, 'refresh')
 
-            # Add token to blacklist
-            expiration = int(payload['exp'] - datetime.utcnow().timestamp())
-            self._cache.set(
+        # Blacklist the token and remove it from active refresh tokens
+        # atomically in a single round-trip
+        now = datetime.utcnow()
+        expiration = max(int(payload['exp'] - now.timestamp()), 1)
+        with self._cache.pipeline() as pipe:
+            pipe.set(
                 f"blacklist:{refresh_token}",
-                {'invalidated_at': datetime.utcnow().isoformat()},
-                ttl=expiration
+                self._cache.serializer.dumps({'invalidated_at': now.isoformat()}),
+                ex=expiration
             )
+            pipe.delete(f"refresh_token:{refresh_token}")
+            pipe.execute()
 
-            # Remove from active refresh tokens
-            self._cache.delete(f"refresh_token:{refresh_token}")
-
-            return True
-
-        except Exception as e:
-            raise AuthenticationError('AUTH001') from e
+        return True
 
     def validate_token(self, token: str) -> Dict[str, Any]:
         """
@@ -208,15 +361,4 @@ class AuthenticationService:
         Raises:
             AuthenticationError: If token is invalid
         """
-        try:
-            # Validate JWT token
-            payload = validate_jwt_token(token)
-            
-            # Verify token type
-            if payload['type'] != 'access':
-                raise AuthenticationError('AUTH001')
-                
-            return payload
-
-        except Exception as e:
-            raise AuthenticationError('AUTH001') from e
\ No newline at end of file
+        return self._decode_token(token, 'access')
@@ -11,14 +11,18 @@ Human Tasks:
 # External imports - versions specified as per requirements
 from typing import Dict, Any, List  # version: 3.9+
 from uuid import UUID  # version: 3.9+
+from pydantic import ValidationError as PydanticValidationError  # version: 2.0+
+from sqlalchemy.exc import IntegrityError  # version: 1.4+
 
 # Internal imports
 from ..models.bullet_item import BulletItem
 from ..schemas.bullet_item import (
-    BulletItemSchema,
-    BulletItemCreateSchema,
-    BulletItemUpdateSchema
+    BulletItemCreateModel,
+    bullet_item_schema,
+    bullet_item_create_schema,
+    bullet_item_update_schema
 )
+from ..database.session import session_scope
 from ..database.operations import (
     create_record,
     get_record,
@@ -26,7 +30,25 @@ from ..database.operations import (
     delete_record,
     list_records
 )
-from ..utils.exceptions import ValidationError, ResourceNotFoundError
+from ..utils.exceptions import ValidationError, ResourceNotFoundError, DatabaseError
+from ..utils.helpers import pydantic_validation_error
+
+def _is_item_limit_violation(error: BaseException) -> bool:
+    """
+    Check whether an error was caused by the bullet item limit trigger.
+    
+    Args:
+        error: Exception raised by a database operation
+        
+    Returns:
+        bool: True if an IntegrityError raised by the ITEM001 trigger is in the chain
+    """
+    current = error
+    while current is not None:
+        if isinstance(current, IntegrityError) and 'ITEM001' in str(current.orig):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
 
 class BulletItemService:
     """
@@ -36,16 +58,14 @@ class BulletItemService:
     Requirement: 1.2 Scope/4. Data Management - CRUD operations with data validation
     """
     
-    def __init__(self) -> None:
-        """
-        Initialize bullet item service with schemas.
-        
-        Initializes schema instances for validation and serialization of bullet item data.
-        """
-        self.bullet_item_schema = BulletItemSchema()
-        self.create_schema = BulletItemCreateSchema()
-        self.update_schema = BulletItemUpdateSchema()
-        self.model = BulletItem
+    __slots__ = ()
+    
+    # Shared schema instances bound once at class level, so constructing the
+    # service allocates nothing
+    bullet_item_schema = bullet_item_schema
+    create_schema = bullet_item_create_schema
+    update_schema = bullet_item_update_schema
+    model = BulletItem
 
     def create_bullet_item(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -65,23 +85,24 @@ class BulletItemService:
             ResourceNotFoundError: If specification not found
         """
         # Validate input data
-        validated_data = self.create_schema.load(data)
+        try:
+            validated_data = BulletItemCreateModel.model_validate(data).model_dump()
+        except PydanticValidationError as e:
+            raise pydantic_validation_error('ITEM002', e) from e
         
-        # Check if specification exists and get current item count
-        existing_items = list_records(
-            self.model,
-            filters={'spec_id': validated_data['spec_id']}
-        )
-        
-        # Verify bullet item count is less than 10
-        if len(existing_items) >= 10:
-            raise ValidationError(
-                'ITEM001',
-                {'items': ['Maximum number of bullet items (10) reached']}
-            )
-        
-        # Create bullet item record
-        bullet_item = create_record(self.model, validated_data)
+        # Create bullet item record; the 10-item cap is enforced by a
+        # database trigger in the same INSERT round-trip. The trigger is
+        # attached to the model table, so schemas built by init_db() and by
+        # the bullet_item_limit migration both carry it
+        try:
+            bullet_item = create_record(self.model, validated_data)
+        except DatabaseError as e:
+            if _is_item_limit_violation(e):
+                raise ValidationError(
+                    'ITEM001',
+                    {'items': ['Maximum number of bullet items (10) reached']}
+                ) from e
+            raise
         
         # Return serialized data
         return self.bullet_item_schema.dump(bullet_item)
@@ -178,11 +199,8 @@ class BulletItemService:
         Returns:
             List[Dict[str, Any]]: List of bullet items
         """
-        # Get all bullet items for specification
-        items = list_records(self.model, filters={'spec_id': spec_id})
-        
-        # Sort items by order
-        items.sort(key=lambda x: x.order)
+        # Get all bullet items for specification, sorted by the database
+        items = list_records(self.model, filters={'spec_id': spec_id}, order_by=('order',))
         
         # Return serialized data
         return self.bullet_item_schema.dump(items, many=True)
@@ -213,12 +231,19 @@ class BulletItemService:
         
         # Get all items for specification
         existing_items = list_records(self.model, filters={'spec_id': spec_id})
-        existing_map = {str(item.id): item for item in existing_items}
+        existing_map = {item.id: item for item in existing_items}
         
-        # Validate all items exist and belong to specification
+        # Validate all items exist and belong to specification, resolving each
+        # item once so later passes skip the lookup
+        resolved = []
         for update in order_updates:
             item_id = update.get('id')
-            if not item_id or str(item_id) not in existing_map:
+            try:
+                key = item_id if isinstance(item_id, UUID) else UUID(item_id)
+            except (TypeError, ValueError):
+                raise ResourceNotFoundError('ITEM001')
+            item = existing_map.get(key)
+            if item is None:
                 raise ResourceNotFoundError('ITEM001')
             
             new_order = update.get('order')
@@ -227,13 +252,18 @@ class BulletItemService:
                     'ITEM002',
                     {'order': ['Order must be between 0 and 9']}
                 )
+            resolved.append((item, new_order))
         
-        # Update order of each item
+        # Apply all order changes in a single executemany UPDATE
+        mappings = [{'id': item.id, 'order': new_order} for item, new_order in resolved]
+        with session_scope() as session:
+            session.bulk_update_mappings(self.model, mappings)
+        
+        # Reflect the new orders on the already loaded items instead of re-fetching
         updated_items = []
-        for update in order_updates:
-            item = existing_map[str(update['id'])]
-            updated_item = update_record(item, {'order': update['order']})
-            updated_items.append(updated_item)
+        for item, new_order in resolved:
+            item.order = new_order
+            updated_items.append(item)
         
         # Return serialized updated items
         return self.bullet_item_schema.dump(updated_items, many=True)
\ No newline at end of file
@@ -11,20 +11,184 @@ Human Tasks:
 """
 
 # External imports - version requirements
-from typing import Dict, Optional, Union  # version: 3.9+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union  # version: 3.9+
+from redis import ConnectionPool  # version: 6.0+
+import atexit  # version: 3.9+
 import json  # version: 3.9+
+import logging  # version: 3.9+
+import os  # version: 3.9+
+import queue  # version: 3.9+
+import threading  # version: 3.9+
+import time  # version: 3.9+
 
 # Internal imports
-from ..cache.redis import RedisCache
+from ..cache.redis import RedisCache, MsgpackSerializer
 from ..cache.keys import (
     make_project_key,
+    make_project_owner_key,
     make_spec_key,
+    make_project_specs_key,
     make_bullet_key,
     make_rate_limit_key,
     make_session_key
 )
 from ..utils.exceptions import DatabaseError
 
+# Short lifetime for cached project specification lists, which change with
+# every specification write
+PROJECT_SPECS_TTL = 60
+
+# Lifetime in seconds of negative entries for projects missing from the database
+PROJECT_MISS_TTL = 5
+
+# Returned by get_project() for projects recently found missing in the database
+CACHED_MISS = object()
+
+# Maximum queued writes flushed together in one pipelined round-trip
+ASYNC_WRITE_BATCH_SIZE = 100
+
+# Queued writes beyond which submitters wait for the background writer
+ASYNC_WRITE_MAX_PENDING = 10000
+
+# Seconds a submitter waits on a full queue before writing synchronously
+ASYNC_WRITE_PUT_TIMEOUT = 0.05
+
+# Seconds flush() waits for queued writes before giving up on them at exit
+ASYNC_WRITE_FLUSH_TIMEOUT = 5.0
+
+logger = logging.getLogger(__name__)
+
+class AsyncCacheWriter:
+    """
+    Background writer draining queued cache writes in pipelined batches.
+    
+    Cache writes are not on the correctness path of write endpoints, so they
+    are queued and flushed by a daemon thread instead of blocking the response
+    on a Redis round-trip. Writes are applied in submission order.
+    
+    Requirement: Performance Optimization - Cache implementation for performance
+    optimization using Redis
+    """
+    
+    def __init__(
+        self,
+        cache: RedisCache,
+        batch_size: int = ASYNC_WRITE_BATCH_SIZE,
+        max_pending: int = ASYNC_WRITE_MAX_PENDING
+    ) -> None:
+        """
+        Initialize the writer; its background thread starts on first submit.
+        
+        The thread is started lazily, and again in any forked child, so a
+        writer built before gunicorn forks its workers still drains there.
+        
+        Args:
+            cache: Redis cache the queued writes are applied to
+            batch_size: Maximum writes flushed per round-trip
+            max_pending: Queue capacity before submitters are throttled
+        """
+        self._cache = cache
+        self._batch_size = batch_size
+        self._max_pending = max_pending
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        atexit.register(self.flush)
+
+    def _ensure_started(self) -> None:
+        """Start the background thread once per process."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # Forked child: the parent's thread is gone and its queue
+                # state may be inconsistent, so start from an empty queue
+                self._queue = queue.Queue(maxsize=self._max_pending)
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._queue,),
+                name='cache-writer',
+                daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def submit(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        raw: Optional[Dict[str, Union[str, bytes]]] = None,
+        delete: Optional[Sequence[str]] = None
+    ) -> None:
+        """
+        Queue a write with the same arguments as RedisCache.set_many().
+        
+        When the queue stays full past a short timeout the write is applied
+        synchronously, pushing back on the submitting request.
+        
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Optional TTL in seconds
+            raw: Optional mapping of cache keys to unserialized values
+            delete: Optional cache keys removed after the writes
+            
+        Raises:
+            DatabaseError: If the synchronous fallback write fails
+        """
+        self._ensure_started()
+        write = (items, ttl, raw, delete)
+        try:
+            self._queue.put(write, timeout=ASYNC_WRITE_PUT_TIMEOUT)
+        except queue.Full:
+            self._cache.write_batch([write])
+
+    def flush(self, timeout: float = ASYNC_WRITE_FLUSH_TIMEOUT) -> bool:
+        """
+        Wait up to timeout seconds for queued writes to be applied.
+        
+        Bounded so that an unreachable Redis cannot hang interpreter exit.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            bool: True if the queue drained, False if writes were abandoned
+        """
+        if self._pid != os.getpid():
+            # Nothing was queued in this process
+            return True
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    'Abandoned %d queued cache writes at flush',
+                    self._queue.unfinished_tasks
+                )
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _run(self, pending: queue.Queue) -> None:
+        """Drain the queue forever, flushing up to batch_size writes at a time."""
+        while True:
+            batch = [pending.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._cache.write_batch(batch)
+            except Exception:
+                # Cache writes are best effort; entries are rebuilt on read
+                logger.warning('Dropped %d queued cache writes', len(batch), exc_info=True)
+            finally:
+                for _ in batch:
+                    pending.task_done()
+
 class CacheService:
     """
     Service class providing high-level caching operations for application entities.
@@ -38,7 +202,8 @@ class CacheService:
         host: str,
         port: int,
         password: Optional[str] = None,
-        db: Optional[int] = None
+        db: Optional[int] = None,
+        pool: Optional[ConnectionPool] = None
     ) -> None:
         """
         Initialize cache service with Redis connection parameters.
@@ -48,21 +213,28 @@ class CacheService:
             port: Redis server port
             password: Optional Redis password
             db: Optional Redis database number
+            pool: Optional shared connection pool; when given, the connection
+                parameters are ignored and its connections are reused
             
         Raises:
             DatabaseError: If Redis connection fails
         """
         try:
-            self._cache = RedisCache(
-                host=host,
-                port=port,
-                password=password,
-                db=db
-            )
+            if pool is not None:
+                self._cache = RedisCache.from_pool(pool, serializer=MsgpackSerializer())
+            else:
+                self._cache = RedisCache(
+                    host=host,
+                    port=port,
+                    password=password,
+                    db=db,
+                    serializer=MsgpackSerializer()
+                )
+            self._writer = AsyncCacheWriter(self._cache)
         except Exception as e:
             raise DatabaseError() from e
 
-    def get_project(self, project_id: Union[str, int]) -> Optional[Dict]:
+    def get_project(self, project_id: Union[str, int]) -> Any:
         """
         Retrieve project data from cache.
         
@@ -73,13 +245,83 @@ class CacheService:
             project_id: Unique identifier of the project
             
         Returns:
-            Optional[Dict]: Project data if exists in cache, None otherwise
+            Any: Project data if exists in cache, CACHED_MISS if the project was
+                recently found missing, None otherwise
             
         Raises:
             DatabaseError: If cache operation fails
         """
         key = make_project_key(project_id)
-        return self._cache.get(key)
+        return self._cache.get(key, negative=CACHED_MISS)
+
+    def get_project_with_owner(self, project_id: Union[str, int]) -> Tuple[Optional[str], Any]:
+        """
+        Retrieve a project's cached owner ID and data in one round-trip.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            project_id: Unique identifier of the project
+            
+        Returns:
+            Tuple[Optional[str], Any]: Owner ID or None, and project data as
+                returned by get_project()
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        project, owner = self._cache.get_with_raw(
+            make_project_key(project_id),
+            make_project_owner_key(project_id),
+            negative=CACHED_MISS
+        )
+        return (owner.decode('utf-8') if owner is not None else None), project
+
+    def set_project_miss(self, project_id: Union[str, int], ttl: int = PROJECT_MISS_TTL) -> bool:
+        """
+        Cache the absence of a project; the entry is replaced by set_project()
+        and removed by delete_project().
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            project_id: Unique identifier of the missing project
+            ttl: TTL in seconds
+            
+        Returns:
+            bool: True if successful, False otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        return self._cache.set_miss(make_project_key(project_id), ttl)
+
+    def get_projects(
+        self,
+        ids: Iterable[Union[str, int]]
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve several projects from cache with a single MGET round-trip.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            ids: Unique identifiers of the projects
+            
+        Returns:
+            Dict[str, Optional[Dict]]: Cached data keyed by ID, None for misses
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        ids = [str(project_id) for project_id in ids]
+        if not ids:
+            return {}
+        values = self._cache.get_many([make_project_key(project_id) for project_id in ids])
+        return dict(zip(ids, values))
 
     def set_project(
         self,
@@ -103,8 +345,110 @@ class CacheService:
         Raises:
             DatabaseError: If cache operation fails
         """
-        key = make_project_key(project_id)
-        return self._cache.set(key, project_data, ttl)
+        # The owner ID is written alongside as plain bytes in the same round-trip
+        return self._cache.set_many(
+            {make_project_key(project_id): project_data},
+            ttl,
+            raw={make_project_owner_key(project_id): str(project_data['user_id'])}
+        )
+
+    def set_project_async(
+        self,
+        project_id: Union[str, int],
+        project_data: Dict,
+        ttl: Optional[int] = None
+    ) -> None:
+        """
+        Queue project data for caching without waiting on Redis.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            project_id: Unique identifier of the project
+            project_data: Project data to cache
+            ttl: Optional TTL in seconds
+        """
+        self._writer.submit(
+            {make_project_key(project_id): project_data},
+            ttl,
+            raw={make_project_owner_key(project_id): str(project_data['user_id'])}
+        )
+
+    def get_project_owner(self, project_id: Union[str, int]) -> Optional[str]:
+        """
+        Retrieve the cached owner ID of a project without loading its payload.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            project_id: Unique identifier of the project
+            
+        Returns:
+            Optional[str]: Owner user ID if cached, None otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        owner = self._cache.get_raw(make_project_owner_key(project_id))
+        return owner.decode('utf-8') if owner is not None else None
+
+    def delete_project(self, project_id: Union[str, int]) -> bool:
+        """
+        Remove a project, its owner entry and its specification list from cache.
+        
+        All three keys share the project's hash tag, so one DEL covers them
+        even on Redis Cluster.
+        
+        Requirement: Cache Management - Cache entry removal functionality
+        
+        Args:
+            project_id: Unique identifier of the project
+            
+        Returns:
+            bool: True if any entry existed and was deleted, False otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        keys = [
+            make_project_key(project_id),
+            make_project_owner_key(project_id),
+            make_project_specs_key(project_id)
+        ]
+        # Also queue the DEL so an earlier pending async write cannot restore the entry
+        self._writer.submit({}, delete=keys)
+        return self._cache.delete_many(keys) > 0
+
+    def set_projects_bulk(
+        self,
+        items: Dict[str, Dict],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Store several projects in cache with a single pipelined round-trip.
+        
+        Requirement: Cache Management - Redis 6+ used as caching layer for query caching
+        
+        Args:
+            items: Mapping of project IDs to project data
+            ttl: Optional TTL in seconds
+            
+        Returns:
+            bool: True if successful, False otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        return self._cache.set_many(
+            {make_project_key(project_id): data for project_id, data in items.items()},
+            ttl,
+            raw={
+                make_project_owner_key(project_id): str(data['user_id'])
+                for project_id, data in items.items()
+            }
+        )
 
     def get_specification(self, spec_id: Union[str, int]) -> Optional[Dict]:
         """
@@ -125,6 +469,31 @@ class CacheService:
         key = make_spec_key(spec_id)
         return self._cache.get(key)
 
+    def get_specifications(
+        self,
+        ids: Iterable[Union[str, int]]
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve several specifications from cache with a single MGET round-trip.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            ids: Unique identifiers of the specifications
+            
+        Returns:
+            Dict[str, Optional[Dict]]: Cached data keyed by ID, None for misses
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        ids = [str(spec_id) for spec_id in ids]
+        if not ids:
+            return {}
+        values = self._cache.get_many([make_spec_key(spec_id) for spec_id in ids])
+        return dict(zip(ids, values))
+
     def set_specification(
         self,
         spec_id: Union[str, int],
@@ -150,6 +519,50 @@ class CacheService:
         key = make_spec_key(spec_id)
         return self._cache.set(key, spec_data, ttl)
 
+    def set_specification_async(
+        self,
+        spec_id: Union[str, int],
+        spec_data: Dict,
+        ttl: Optional[int] = None
+    ) -> None:
+        """
+        Queue specification data for caching without waiting on Redis.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            spec_id: Unique identifier of the specification
+            spec_data: Specification data to cache
+            ttl: Optional TTL in seconds
+        """
+        self._writer.submit({make_spec_key(spec_id): spec_data}, ttl)
+
+    def set_specifications_bulk(
+        self,
+        items: Dict[str, Dict],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Store several specifications in cache with a single pipelined round-trip.
+        
+        Requirement: Cache Management - Redis 6+ used as caching layer for query caching
+        
+        Args:
+            items: Mapping of specification IDs to specification data
+            ttl: Optional TTL in seconds
+            
+        Returns:
+            bool: True if successful, False otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        return self._cache.set_many(
+            {make_spec_key(spec_id): data for spec_id, data in items.items()},
+            ttl
+        )
+
     def get_bullet_item(self, bullet_id: Union[str, int]) -> Optional[Dict]:
         """
         Retrieve bullet item data from cache.
@@ -169,6 +582,151 @@ class CacheService:
         key = make_bullet_key(bullet_id)
         return self._cache.get(key)
 
+    def delete_specification(
+        self,
+        spec_id: Union[str, int],
+        project_id: Optional[Union[str, int]] = None
+    ) -> bool:
+        """
+        Remove a single specification, and optionally its project's list, from cache.
+        
+        Requirement: Cache Management - Cache entry removal functionality
+        
+        Args:
+            spec_id: Unique identifier of the specification
+            project_id: Optional owning project whose specification list is dropped
+                in the same DEL
+            
+        Returns:
+            bool: True if any entry existed and was deleted, False otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        keys = [make_spec_key(spec_id)]
+        if project_id is not None:
+            keys.append(make_project_specs_key(project_id))
+        # Also queue the DEL so an earlier pending async write cannot restore the entry
+        self._writer.submit({}, delete=keys)
+        return self._cache.delete_many(keys) > 0
+
+    def get_project_specifications(self, project_id: Union[str, int]) -> Optional[List[Dict]]:
+        """
+        Retrieve a project's specification list from cache.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            project_id: Unique identifier of the project
+            
+        Returns:
+            Optional[List[Dict]]: Specification list if cached, None otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        return self._cache.get(make_project_specs_key(project_id))
+
+    def set_project_specifications(
+        self,
+        project_id: Union[str, int],
+        specifications: List[Dict],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Store a project's specification list in its own key namespace.
+        
+        Requirement: Cache Management - Redis 6+ used as caching layer for query caching
+        
+        Args:
+            project_id: Unique identifier of the project
+            specifications: Serialized specifications of the project
+            ttl: Optional TTL in seconds, defaults to PROJECT_SPECS_TTL
+            
+        Returns:
+            bool: True if successful, False otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        return self._cache.set(
+            make_project_specs_key(project_id),
+            specifications,
+            ttl or PROJECT_SPECS_TTL
+        )
+
+    def delete_project_specifications(self, project_id: Union[str, int]) -> bool:
+        """
+        Remove a project's cached specification list.
+        
+        Requirement: Cache Management - Cache entry removal functionality
+        
+        Args:
+            project_id: Unique identifier of the project
+            
+        Returns:
+            bool: True if the entry existed and was deleted, False otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        return self._cache.delete(make_project_specs_key(project_id))
+
+    def set_new_specifications(
+        self,
+        project_id: Union[str, int],
+        items: Dict[str, Dict],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Cache newly created specifications and drop the project's stale list
+        in a single pipelined round-trip.
+        
+        Requirement: Cache Management - Redis 6+ used as caching layer for query caching
+        
+        Args:
+            project_id: Unique identifier of the owning project
+            items: Mapping of specification IDs to specification data
+            ttl: Optional TTL in seconds
+            
+        Returns:
+            bool: True if successful, False otherwise
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        return self._cache.set_many(
+            {make_spec_key(spec_id): data for spec_id, data in items.items()},
+            ttl,
+            delete=[make_project_specs_key(project_id)]
+        )
+
+    def get_bullet_items(
+        self,
+        ids: Iterable[Union[str, int]]
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Retrieve several bullet items from cache with a single MGET round-trip.
+        
+        Requirement: Performance Optimization - Cache implementation for performance
+        optimization using Redis
+        
+        Args:
+            ids: Unique identifiers of the bullet items
+            
+        Returns:
+            Dict[str, Optional[Dict]]: Cached data keyed by ID, None for misses
+            
+        Raises:
+            DatabaseError: If cache operation fails
+        """
+        ids = [str(bullet_id) for bullet_id in ids]
+        if not ids:
+            return {}
+        values = self._cache.get_many([make_bullet_key(bullet_id) for bullet_id in ids])
+        return dict(zip(ids, values))
+
     def set_bullet_item(
         self,
         bullet_id: Union[str, int],
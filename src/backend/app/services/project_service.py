@@ -12,10 +12,11 @@ Human Tasks:
 # External imports - versions specified as per requirements
 from typing import Dict, List, Optional  # version: 3.9+
 from uuid import UUID  # version: 3.9+
+from pydantic import ValidationError as PydanticValidationError  # version: 2.0+
 
 # Internal imports
 from ..models.project import Project
-from ..schemas.project import ProjectSchema, ProjectCreateSchema, ProjectUpdateSchema
+from ..schemas.project import ProjectCreateModel, dump_project, dump_projects, project_update_schema
 from ..database.operations import (
     create_record,
     get_record,
@@ -23,12 +24,13 @@ from ..database.operations import (
     delete_record,
     list_records
 )
-from .cache_service import CacheService
+from .cache_service import CacheService, CACHED_MISS
 from ..utils.exceptions import (
     ResourceNotFoundError,
     AuthorizationError,
     ValidationError
 )
+from ..utils.helpers import pydantic_validation_error
 
 class ProjectService:
     """
@@ -38,6 +40,10 @@ class ProjectService:
     with single-user ownership model and project-level access control
     """
     
+    # Module-level schema singleton shared by every instance; marshmallow
+    # schemas hold no per-call state, so validate is safe across threads
+    _update_schema = project_update_schema
+    
     def __init__(self, cache_service: CacheService) -> None:
         """
         Initialize project service with cache service instance.
@@ -46,9 +52,6 @@ class ProjectService:
             cache_service: Instance of CacheService for caching operations
         """
         self._cache = cache_service
-        self._schema = ProjectSchema()
-        self._create_schema = ProjectCreateSchema()
-        self._update_schema = ProjectUpdateSchema()
 
     def create_project(self, user_id: UUID, project_data: Dict) -> Dict:
         """
@@ -69,9 +72,10 @@ class ProjectService:
             DatabaseError: If database operation fails
         """
         # Validate project data
-        errors = self._create_schema.validate(project_data)
-        if errors:
-            raise ValidationError('PRJ001', errors)
+        try:
+            project_data = ProjectCreateModel.model_validate(project_data).model_dump()
+        except PydanticValidationError as e:
+            raise pydantic_validation_error('PRJ001', e) from e
         
         # Add user_id to project data
         project_data['user_id'] = user_id
@@ -80,10 +84,10 @@ class ProjectService:
         project = create_record(Project, project_data)
         
         # Serialize project data
-        project_dict = self._schema.dump(project)
+        project_dict = dump_project(project)
         
         # Cache project data
-        self._cache.set_project(str(project.id), project_dict)
+        self._cache.set_project_async(str(project.id), project_dict)
         
         return project_dict
 
@@ -106,17 +110,30 @@ class ProjectService:
             AuthorizationError: If user is not the project owner
             DatabaseError: If database operation fails
         """
+        # Format the IDs once for every cache key and comparison below
+        pid = str(project_id)
+        uid = str(user_id)
+        
+        # Owner key and payload share one round-trip; foreign projects are
+        # rejected from the owner key before the payload is used
+        owner_id, cached_project = self._cache.get_project_with_owner(pid)
+        if owner_id is not None and owner_id != uid:
+            raise AuthorizationError('PRJ002')
+        
         # Try to get from cache first
-        cached_project = self._cache.get_project(str(project_id))
+        if cached_project is CACHED_MISS:
+            raise ResourceNotFoundError('PRJ001')
         if cached_project:
             # Validate ownership even for cached data
-            if cached_project['user_id'] != str(user_id):
+            if cached_project['user_id'] != uid:
                 raise AuthorizationError('PRJ002')
             return cached_project
         
         # Get from database if not in cache
         project = get_record(Project, project_id)
         if not project:
+            # Remember the miss briefly so repeated lookups skip the database
+            self._cache.set_project_miss(pid)
             raise ResourceNotFoundError('PRJ001')
         
         # Validate project ownership
@@ -124,10 +141,10 @@ class ProjectService:
             raise AuthorizationError('PRJ002')
         
         # Serialize project data
-        project_dict = self._schema.dump(project)
+        project_dict = dump_project(project)
         
         # Cache project data
-        self._cache.set_project(str(project_id), project_dict)
+        self._cache.set_project(pid, project_dict)
         
         return project_dict
 
@@ -152,28 +169,33 @@ class ProjectService:
             ValidationError: If update data validation fails
             DatabaseError: If database operation fails
         """
+        pid = str(project_id)
+        
+        # Reject foreign projects from the cached copy before touching the database
+        self._check_cached_ownership(pid, str(user_id))
+        
+        # Validate update data
+        errors = self._update_schema.validate(project_data)
+        if errors:
+            raise ValidationError('PRJ001', errors)
+        
         # Get project from database
         project = get_record(Project, project_id)
         if not project:
             raise ResourceNotFoundError('PRJ001')
         
-        # Validate project ownership
+        # Validate project ownership authoritatively
         if not project.validate_ownership(user_id):
             raise AuthorizationError('PRJ002')
         
-        # Validate update data
-        errors = self._update_schema.validate(project_data)
-        if errors:
-            raise ValidationError('PRJ001', errors)
-        
         # Update project record
         updated_project = update_record(project, project_data)
         
         # Serialize updated project data
-        project_dict = self._schema.dump(updated_project)
+        project_dict = dump_project(updated_project)
         
         # Update cache
-        self._cache.set_project(str(project_id), project_dict)
+        self._cache.set_project_async(pid, project_dict)
         
         return project_dict
 
@@ -193,12 +215,17 @@ class ProjectService:
             AuthorizationError: If user is not the project owner
             DatabaseError: If database operation fails
         """
+        pid = str(project_id)
+        
+        # Reject foreign projects from the cached copy before touching the database
+        self._check_cached_ownership(pid, str(user_id))
+        
         # Get project from database
         project = get_record(Project, project_id)
         if not project:
             raise ResourceNotFoundError('PRJ001')
         
-        # Validate project ownership
+        # Validate project ownership authoritatively
         if not project.validate_ownership(user_id):
             raise AuthorizationError('PRJ002')
         
@@ -206,7 +233,24 @@ class ProjectService:
         delete_record(project)
         
         # Remove from cache
-        self._cache.set_project(str(project_id), None)
+        self._cache.delete_project(pid)
+
+    def _check_cached_ownership(self, project_id: str, user_id: str) -> None:
+        """
+        Fail fast when the cached project belongs to another user.
+        
+        Requirement: 1.2 Scope/2. Project Organization - Project-level access control
+        
+        Args:
+            project_id: Project ID formatted as a string
+            user_id: Requesting user ID formatted as a string
+            
+        Raises:
+            AuthorizationError: If the cached project has a different owner
+        """
+        owner_id = self._cache.get_project_owner(project_id)
+        if owner_id is not None and owner_id != user_id:
+            raise AuthorizationError('PRJ002')
 
     def list_user_projects(self, user_id: UUID) -> List[Dict]:
         """
@@ -228,4 +272,9 @@ class ProjectService:
         projects = list_records(Project, {'user_id': user_id})
         
         # Serialize project list
-        return self._schema.dump(projects, many=True)
\ No newline at end of file
+        projects_dict = dump_projects(projects)
+        
+        # Warm the per-project cache entries in one round-trip
+        self._cache.set_projects_bulk({project['id']: project for project in projects_dict})
+        
+        return projects_dict
\ No newline at end of file
@@ -12,16 +12,19 @@ Human Tasks:
 # External imports - versions specified as per requirements
 from typing import Dict, List, Optional  # version: 3.9+
 from uuid import UUID  # version: 3.9+
+from pydantic import ValidationError as PydanticValidationError  # version: 2.0+
 
 # Internal imports
 from ..models.specification import Specification
 from ..schemas.specification import (
-    SpecificationSchema,
-    SpecificationCreateSchema,
-    SpecificationUpdateSchema
+    SpecificationCreateModel,
+    SpecificationUpdateModel,
+    dump_specification,
+    dump_specifications
 )
 from ..database.operations import (
     create_record,
+    create_records,
     get_record,
     update_record,
     delete_record,
@@ -30,9 +33,9 @@ from ..database.operations import (
 from .cache_service import CacheService
 from ..utils.exceptions import (
     ResourceNotFoundError,
-    ValidationError,
     DatabaseError
 )
+from ..utils.helpers import pydantic_validation_error
 
 class SpecificationService:
     """
@@ -44,15 +47,12 @@ class SpecificationService:
     
     def __init__(self, cache_service: CacheService) -> None:
         """
-        Initialize specification service with cache service and schemas.
+        Initialize specification service with cache service.
         
         Args:
             cache_service: Instance of CacheService for caching operations
         """
         self._cache_service = cache_service
-        self._schema = SpecificationSchema()
-        self._create_schema = SpecificationCreateSchema()
-        self._update_schema = SpecificationUpdateSchema()
 
     def create_specification(self, project_id: UUID, spec_data: Dict) -> Dict:
         """
@@ -74,22 +74,67 @@ class SpecificationService:
         try:
             # Validate specification data
             spec_data['project_id'] = project_id
-            validated_data = self._create_schema.load(spec_data)
+            validated_data = SpecificationCreateModel.model_validate(spec_data).model_dump()
             
             # Create specification record
             specification = create_record(Specification, validated_data)
             
-            # Cache the new specification
-            spec_dict = self._schema.dump(specification)
-            self._cache_service.set_specification(
+            # Cache the new specification and drop the project's stale list
+            spec_dict = dump_specification(specification)
+            self._cache_service.set_specification_async(
                 str(specification.id),
                 spec_dict
             )
+            self._cache_service.delete_project_specifications(str(project_id))
             
             return spec_dict
             
-        except ValidationError as e:
-            raise ValidationError('SPEC001', e.messages)
+        except PydanticValidationError as e:
+            raise pydantic_validation_error('SPEC001', e) from e
+        except Exception as e:
+            raise DatabaseError() from e
+
+    def create_specifications_bulk(self, project_id: UUID, specs_data: List[Dict]) -> List[Dict]:
+        """
+        Create several specifications within a project in one batch.
+        
+        All items are validated before anything is written; the rows are
+        inserted with one batched INSERT and cached with one pipelined flush.
+        
+        Requirement: 1.2 Scope/4. Data Management - CRUD operations with validation
+        
+        Args:
+            project_id: UUID of the project
+            specs_data: Dictionaries containing specification data
+            
+        Returns:
+            List[Dict]: Created specification data
+            
+        Raises:
+            ValidationError: If any specification data is invalid
+            DatabaseError: If database operation fails
+        """
+        try:
+            # Validate every specification before writing
+            validated_list = [
+                SpecificationCreateModel.model_validate({**spec_data, 'project_id': project_id}).model_dump()
+                for spec_data in specs_data
+            ]
+            
+            # Insert all specification records in one batch
+            specifications = create_records(Specification, validated_list)
+            
+            # Cache the new specifications and drop the project's stale list
+            specs_dict = dump_specifications(specifications)
+            self._cache_service.set_new_specifications(
+                str(project_id),
+                {spec['spec_id']: spec for spec in specs_dict}
+            )
+            
+            return specs_dict
+            
+        except PydanticValidationError as e:
+            raise pydantic_validation_error('SPEC001', e) from e
         except Exception as e:
             raise DatabaseError() from e
 
@@ -111,7 +156,8 @@ class SpecificationService:
         """
         try:
             # Check cache first
-            cached_spec = self._cache_service.get_specification(str(spec_id))
+            sid = str(spec_id)
+            cached_spec = self._cache_service.get_specification(sid)
             if cached_spec:
                 return cached_spec
             
@@ -121,11 +167,8 @@ class SpecificationService:
                 raise ResourceNotFoundError('SPEC001')
             
             # Cache and return specification
-            spec_dict = self._schema.dump(specification)
-            self._cache_service.set_specification(
-                str(spec_id),
-                spec_dict
-            )
+            spec_dict = dump_specification(specification)
+            self._cache_service.set_specification(sid, spec_dict)
             
             return spec_dict
             
@@ -159,22 +202,23 @@ class SpecificationService:
                 raise ResourceNotFoundError('SPEC001')
             
             # Validate update data
-            validated_data = self._update_schema.load(spec_data)
+            validated_data = SpecificationUpdateModel.model_validate(spec_data).model_dump()
             
             # Update specification
             updated_spec = update_record(specification, validated_data)
             
-            # Update cache and return
-            spec_dict = self._schema.dump(updated_spec)
-            self._cache_service.set_specification(
+            # Update cache, drop the project's stale list and return
+            spec_dict = dump_specification(updated_spec)
+            self._cache_service.set_specification_async(
                 str(spec_id),
                 spec_dict
             )
+            self._cache_service.delete_project_specifications(str(updated_spec.project_id))
             
             return spec_dict
             
-        except ValidationError as e:
-            raise ValidationError('SPEC001', e.messages)
+        except PydanticValidationError as e:
+            raise pydantic_validation_error('SPEC001', e) from e
         except ResourceNotFoundError:
             raise
         except Exception as e:
@@ -202,8 +246,11 @@ class SpecificationService:
             # Delete specification
             delete_record(specification)
             
-            # Remove from cache
-            self._cache_service.clear_cache()
+            # Remove this specification and its project's list in one DEL
+            self._cache_service.delete_specification(
+                str(spec_id),
+                str(specification.project_id)
+            )
             
         except ResourceNotFoundError:
             raise
@@ -226,6 +273,11 @@ class SpecificationService:
             DatabaseError: If database operation fails
         """
         try:
+            # Serve the cached list when present
+            cached_specs = self._cache_service.get_project_specifications(str(project_id))
+            if cached_specs is not None:
+                return cached_specs
+            
             # List specifications with project filter
             specifications = list_records(
                 Specification,
@@ -233,14 +285,16 @@ class SpecificationService:
             )
             
             # Serialize specifications
-            specs_dict = self._schema.dump(specifications, many=True)
+            specs_dict = dump_specifications(specifications)
             
-            # Cache results with project key
-            self._cache_service.set_project(
-                str(project_id),
-                {'specifications': specs_dict}
+            # Warm the per-specification cache entries in one round-trip
+            self._cache_service.set_specifications_bulk(
+                {spec['spec_id']: spec for spec in specs_dict}
             )
             
+            # Cache the list under its own key, never the project key
+            self._cache_service.set_project_specifications(str(project_id), specs_dict)
+            
             return specs_dict
             
         except Exception as e:
@@ -264,13 +318,13 @@ class SpecificationService:
             DatabaseError: If database operation fails
         """
         try:
-            # Get specification
-            specification = get_record(Specification, spec_id)
-            if not specification:
+            # Load only the owning project ID
+            rows = list_records(Specification, {'id': spec_id}, columns=('project_id',))
+            if not rows:
                 raise ResourceNotFoundError('SPEC001')
             
             # Compare project IDs
-            return specification.validate_project_access(project_id)
+            return rows[0].project_id == project_id
             
         except ResourceNotFoundError:
             raise
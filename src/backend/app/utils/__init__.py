@@ -11,6 +11,7 @@ Human Tasks:
 """
 
 # External imports
+from importlib import import_module  # version: 3.9+
 from typing import Dict, List, Any  # version: 3.9+
 
 # Constants imports
@@ -39,34 +40,57 @@ from .exceptions import (
     DatabaseError
 )
 
-# Validation function imports
+# Validation, security and helper functions are imported on first access so
+# importing the package does not load the JWT and crypto dependencies
 # Requirement: 1.2 Scope/4. Data Management - Expose validation utilities
-from .validators import (
-    validate_project_title,
-    validate_specification_content,
-    validate_bullet_item,
-    validate_bullet_items_count,
-    validate_email
-)
-
-# Security function imports
 # Requirement: 10.3.2 Security Headers - Expose security constants and utility functions
-from .security import (
-    generate_jwt_token,
-    validate_jwt_token,
-    encrypt_sensitive_data,
-    decrypt_sensitive_data,
-    get_security_headers
-)
+_LAZY: Dict[str, str] = {
+    # Validation functions
+    'validate_project_title': '.validators',
+    'validate_specification_content': '.validators',
+    'validate_bullet_item': '.validators',
+    'validate_bullet_items_count': '.validators',
+    'validate_email': '.validators',
+    
+    # Security functions
+    'generate_jwt_token': '.security',
+    'validate_jwt_token': '.security',
+    'encrypt_sensitive_data': '.security',
+    'decrypt_sensitive_data': '.security',
+    'get_security_headers': '.security',
+    'get_security_headers_items': '.security',
+    
+    # Helper functions
+    'validate_uuid': '.helpers',
+    'sanitize_string': '.helpers',
+    'format_timestamp': '.helpers',
+    'generate_error_response': '.helpers',
+    'pydantic_validation_error': '.helpers'
+}
 
-# Helper function imports
-# Requirement: 1.2 Scope/4. Data Management - Expose helper utilities
-from .helpers import (
-    validate_uuid,
-    sanitize_string,
-    format_timestamp,
-    generate_error_response
-)
+def __getattr__(name: str) -> Any:
+    """
+    Resolve a lazily exported function and cache it on the package (PEP 562).
+    
+    Args:
+        name: Attribute being accessed
+        
+    Returns:
+        Any: The exported function
+        
+    Raises:
+        AttributeError: If the name is not exported by the package
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List eager and lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     # Constants
@@ -95,10 +119,12 @@ __all__ = [
     'encrypt_sensitive_data',
     'decrypt_sensitive_data',
     'get_security_headers',
+    'get_security_headers_items',
     
     # Helper functions
     'validate_uuid',
     'sanitize_string',
     'format_timestamp',
-    'generate_error_response'
+    'generate_error_response',
+    'pydantic_validation_error'
 ]
\ No newline at end of file
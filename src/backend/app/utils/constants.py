@@ -10,11 +10,12 @@ Human Tasks:
 """
 
 # External imports
-from typing import Dict  # version: 3.9+
+import sys  # version: 3.9+
+from typing import Dict, Tuple  # version: 3.9+
 
 # Error codes and messages
 # Requirement: A.4 Error Codes and Messages - Definition of standardized error codes
-ERROR_CODES: Dict[str, str] = {
+ERROR_CODES: Dict[str, str] = {sys.intern(code): message for code, message in {
     # Authentication errors
     'AUTH001': 'Invalid token',
     'AUTH002': 'Token expired',
@@ -35,7 +36,7 @@ ERROR_CODES: Dict[str, str] = {
     # System errors
     'SYS001': 'Database error',
     'SYS002': 'Rate limit exceeded'
-}
+}.items()}
 
 # Security header configurations
 # Requirement: 10.3.2 Security Headers - Security header configurations for HTTP responses
@@ -48,6 +49,10 @@ SECURITY_HEADERS: Dict[str, str] = {
     'Referrer-Policy': 'strict-origin-when-cross-origin'
 }
 
+# Security headers frozen into name/value pairs once at import, so responses
+# add them without iterating the dict per request
+SECURITY_HEADERS_ITEMS: Tuple[Tuple[str, str], ...] = tuple(SECURITY_HEADERS.items())
+
 # JWT token expiration times (in seconds)
 # Requirement: 10.1.3 Token Management - JWT token expiration durations
 JWT_ACCESS_TOKEN_EXPIRES: int = 3600  # 1 hour
@@ -57,6 +62,10 @@ JWT_REFRESH_TOKEN_EXPIRES: int = 86400  # 24 hours
 # Requirement: 1.2 Scope/3. Specification Management - Maximum limit of bullet items
 MAX_BULLET_ITEMS: int = 10
 
+# Column width of users.email, which stores the encrypted address
+# Requirement: 10.2.2 Encryption Standards - Encrypted storage of user emails
+EMAIL_COLUMN_LENGTH: int = 255
+
 # Database configuration
 DATABASE_TIMEOUT: int = 30  # Database operation timeout in seconds
 
@@ -8,21 +8,30 @@ Human Tasks:
 """
 
 # External imports
-from typing import Dict, List  # version: 3.9+
+import sys  # version: 3.9+
+from types import MappingProxyType  # version: 3.9+
+from typing import Dict, List, Mapping  # version: 3.9+
 
 # Internal imports
 from ..utils.constants import ERROR_CODES
 
+def _code_messages(*codes: str) -> Mapping[str, str]:
+    """Build a read-only table of the messages for the codes an exception accepts."""
+    return MappingProxyType({code: ERROR_CODES[code] for code in codes})
+
 class BaseAPIException(Exception):
     """
     Base exception class for all API related exceptions.
     
     Requirement: A.4 Error Handling - Base exception class for standardized error handling
     """
+    __slots__ = ('code', 'message', 'status_code', 'errors')
+    
     def __init__(self, code: str, message: str, status_code: int) -> None:
         """Initialize base API exception with code, message and status code."""
         super().__init__(message)
-        self.code = code
+        # Interned so comparisons against ERROR_CODES keys hit the identity fast path
+        self.code = sys.intern(code)
         self.message = message
         self.status_code = status_code
 
@@ -32,9 +41,16 @@ class AuthenticationError(BaseAPIException):
     
     Requirement: 10.1 Authentication and Authorization - Authentication error handling
     """
+    __slots__ = ()
+    
+    # Messages for the only codes valid with this status code
+    _CODES = _code_messages('AUTH001', 'AUTH002', 'AUTH003')
+    
     def __init__(self, code: str) -> None:
         """Initialize authentication error with specific error code."""
-        message = ERROR_CODES[code]
+        message = self._CODES.get(code)
+        if message is None:
+            raise KeyError(f"Error code {code} is not valid for AuthenticationError")
         super().__init__(code=code, message=message, status_code=401)
 
 class AuthorizationError(BaseAPIException):
@@ -43,9 +59,16 @@ class AuthorizationError(BaseAPIException):
     
     Requirement: 10.1 Authentication and Authorization - Authorization error handling
     """
+    __slots__ = ()
+    
+    # Messages for the only codes valid with this status code
+    _CODES = _code_messages('PRJ002')
+    
     def __init__(self, code: str) -> None:
         """Initialize authorization error with specific error code."""
-        message = ERROR_CODES[code]
+        message = self._CODES.get(code)
+        if message is None:
+            raise KeyError(f"Error code {code} is not valid for AuthorizationError")
         super().__init__(code=code, message=message, status_code=403)
 
 class ResourceNotFoundError(BaseAPIException):
@@ -54,9 +77,16 @@ class ResourceNotFoundError(BaseAPIException):
     
     Requirement: A.4 Error Handling - Resource not found error handling
     """
+    __slots__ = ()
+    
+    # Messages for the only codes valid with this status code
+    _CODES = _code_messages('PRJ001', 'SPEC001', 'ITEM001')
+    
     def __init__(self, code: str) -> None:
         """Initialize resource not found error with specific error code."""
-        message = ERROR_CODES[code]
+        message = self._CODES.get(code)
+        if message is None:
+            raise KeyError(f"Error code {code} is not valid for ResourceNotFoundError")
         super().__init__(code=code, message=message, status_code=404)
 
 class ValidationError(BaseAPIException):
@@ -65,6 +95,8 @@ class ValidationError(BaseAPIException):
     
     Requirement: A.4 Error Handling - Validation error handling with detailed error messages
     """
+    __slots__ = ()
+    
     def __init__(self, code: str, errors: Dict[str, List[str]]) -> None:
         """Initialize validation error with specific error code and validation errors."""
         message = ERROR_CODES[code]
@@ -77,6 +109,8 @@ class RateLimitError(BaseAPIException):
     
     Requirement: A.4 Error Handling - Rate limiting error handling
     """
+    __slots__ = ()
+    
     def __init__(self) -> None:
         """Initialize rate limit error."""
         code = 'SYS002'
@@ -89,6 +123,8 @@ class DatabaseError(BaseAPIException):
     
     Requirement: A.4 Error Handling - Database error handling
     """
+    __slots__ = ()
+    
     def __init__(self) -> None:
         """Initialize database error."""
         code = 'SYS001'
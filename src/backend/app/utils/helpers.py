@@ -6,14 +6,23 @@ Human Tasks:
 2. Confirm SQL injection patterns are up to date with latest security recommendations
 3. Review project title validation rules with the product team
 4. Ensure timestamp format matches the frontend requirements
+5. Optionally install google-re2 so input sanitization runs in linear time
 """
 
 # External imports
-from typing import Dict, List, Any  # version: 3.9+
+from typing import Dict, List, Any, Tuple  # version: 3.9+
 from datetime import datetime  # version: 3.9+
+import time  # version: 3.9+
 import uuid  # version: 3.9+
 import re  # version: 3.9+
 
+# Optional linear-time regex engine for sanitization; RE2 never backtracks,
+# so adversarial input cannot trigger catastrophic matching times
+try:
+    import re2 as sanitize_re  # version: 1.0+
+except ImportError:
+    sanitize_re = re
+
 # Internal imports
 from .constants import ERROR_CODES
 from .exceptions import ValidationError
@@ -24,10 +33,39 @@ SCRIPT_TAG_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL)
 SQL_INJECTION_PATTERN = re.compile(r'(\b(SELECT|INSERT|UPDATE|DELETE|DROP|UNION|ALTER)\b)', re.IGNORECASE)
 PROJECT_TITLE_PATTERN = re.compile(r'^[\w\s\-\.]{1,100}$')
 
+# Static part of every error response, built once per error code
+ERROR_TEMPLATES: Dict[str, Dict[str, str]] = {
+    code: {"code": code, "message": message} for code, message in ERROR_CODES.items()
+}
+
+# Last formatted error timestamp as (epoch second, ISO 8601 string); swapped
+# as one tuple so concurrent readers never see a mismatched pair
+_last_timestamp: Tuple[int, str] = (0, "")
+
+# Canonical 8-4-4-4-12 hexadecimal UUID string form
+UUID_PATTERN = re.compile(
+    r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z'
+)
+
+# Script blocks and remaining tags removed in a single pass; the script
+# alternative comes first so its body is dropped along with its tags. Flags
+# are inline so the same patterns compile under re and RE2
+MARKUP_PATTERN = sanitize_re.compile(
+    f'(?s){SCRIPT_TAG_PATTERN.pattern}|{HTML_TAG_PATTERN.pattern}'
+)
+SANITIZE_SQL_PATTERN = sanitize_re.compile(f'(?i){SQL_INJECTION_PATTERN.pattern}')
+
+# Runs of whitespace collapsed to one space; compiled with the stdlib engine,
+# whose Unicode-aware \s matches the same characters as str.split()
+_MULTI_WS_RE = re.compile(r'\s+')
+
 def validate_uuid(uuid_string: str) -> bool:
     """
     Validates if a given string is a valid UUID.
     
+    Strings must use the canonical hyphenated form; matching is a single
+    regex check, so invalid input never raises and catches an exception.
+    
     Requirement: 1.2 Scope/4. Data Management - Data validation for UUID fields
     
     Args:
@@ -36,11 +74,9 @@ def validate_uuid(uuid_string: str) -> bool:
     Returns:
         bool: True if valid UUID, False otherwise
     """
-    try:
-        uuid.UUID(str(uuid_string))
+    if isinstance(uuid_string, uuid.UUID):
         return True
-    except ValueError:
-        return False
+    return isinstance(uuid_string, str) and UUID_PATTERN.match(uuid_string) is not None
 
 def validate_bullet_order(order: int) -> bool:
     """
@@ -71,17 +107,30 @@ def sanitize_string(input_string: str) -> str:
     if not isinstance(input_string, str):
         return ""
     
-    # Remove HTML and script tags
-    sanitized = HTML_TAG_PATTERN.sub('', input_string)
-    sanitized = SCRIPT_TAG_PATTERN.sub('', sanitized)
+    # Remove script blocks and HTML tags
+    sanitized = MARKUP_PATTERN.sub('', input_string)
     
-    # Remove potential SQL injection patterns
-    sanitized = SQL_INJECTION_PATTERN.sub('', sanitized)
+    # Remove potential SQL injection patterns; kept as a separate pass since
+    # removing tags can join keyword fragments such as SEL<b>ECT
+    sanitized = SANITIZE_SQL_PATTERN.sub('', sanitized)
     
     # Strip whitespace and normalize spaces
-    sanitized = ' '.join(sanitized.split())
+    return _collapse_ws(sanitized)
+
+def _collapse_ws(value: str) -> str:
+    """
+    Strips a string and collapses each inner whitespace run to one space.
     
-    return sanitized
+    Equivalent to ' '.join(value.split()) in a single pass, without building
+    an intermediate token list.
+    
+    Args:
+        value: String to normalize
+        
+    Returns:
+        str: Normalized string
+    """
+    return _MULTI_WS_RE.sub(' ', value.strip())
 
 def format_timestamp(timestamp: datetime) -> str:
     """
@@ -100,6 +149,26 @@ def format_timestamp(timestamp: datetime) -> str:
     
     return timestamp.isoformat()
 
+def _current_timestamp() -> str:
+    """
+    Returns the current UTC time as an ISO 8601 string with second precision.
+    
+    The formatted value is memoized for the current second, so error responses
+    within the same second reuse one string.
+    
+    Returns:
+        str: Timestamp such as 2024-01-01T12:00:00
+    """
+    global _last_timestamp
+    second = int(time.time())
+    cached = _last_timestamp
+    if cached[0] == second:
+        return cached[1]
+    
+    formatted = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+    _last_timestamp = (second, formatted)
+    return formatted
+
 def validate_project_title(title: str) -> bool:
     """
     Validates project title against required constraints.
@@ -134,16 +203,33 @@ def generate_error_response(error_code: str, validation_errors: Dict[str, List[s
     Raises:
         KeyError: If error_code is not found in ERROR_CODES
     """
-    if error_code not in ERROR_CODES:
+    template = ERROR_TEMPLATES.get(error_code)
+    if template is None:
         raise KeyError(f"Unknown error code: {error_code}")
     
-    response = {
-        "code": error_code,
-        "message": ERROR_CODES[error_code],
-        "timestamp": format_timestamp(datetime.utcnow())
-    }
+    # Copy the template and attach only the per-call timestamp
+    response: Dict[str, Any] = {**template, "timestamp": _current_timestamp()}
     
     if validation_errors:
         response["errors"] = validation_errors
     
-    return response
\ No newline at end of file
+    return response
+
+def pydantic_validation_error(error_code: str, exc: Any) -> ValidationError:
+    """
+    Converts a pydantic validation error into the application ValidationError.
+    
+    Requirement: A.4 Error Codes and Messages - Standardized error response format
+    
+    Args:
+        error_code: Error code from ERROR_CODES
+        exc: pydantic.ValidationError raised by model validation
+        
+    Returns:
+        ValidationError: Application validation error with field-specific messages
+    """
+    errors: Dict[str, List[str]] = {}
+    for error in exc.errors():
+        field = '.'.join(str(part) for part in error['loc']) or '_schema'
+        errors.setdefault(field, []).append(error['msg'])
+    return ValidationError(error_code, errors)
\ No newline at end of file
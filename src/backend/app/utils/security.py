@@ -12,24 +12,157 @@ Human Tasks:
 
 # External imports
 import jwt  # version: 2.4.0
+import orjson  # version: 3.6+
 from cryptography.fernet import Fernet  # version: 37.0.0
 from cryptography.hazmat.primitives import hashes  # version: 37.0.0
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC  # version: 37.0.0
 from cryptography.hazmat.primitives import padding  # version: 37.0.0
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes  # version: 37.0.0
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # version: 37.0.0
 import base64
-from datetime import datetime, timedelta
-from typing import Dict, Any  # version: 3.9+
+import hashlib  # version: 3.9+
+import hmac  # version: 3.9+
+import threading  # version: 3.9+
+import time  # version: 3.9+
+from collections import OrderedDict  # version: 3.9+
+from typing import Dict, Any, Iterable, List, Optional, Tuple  # version: 3.9+
 import os
 
 # Internal imports
 from ..utils.constants import (
     SECURITY_HEADERS,
+    SECURITY_HEADERS_ITEMS,
     JWT_ACCESS_TOKEN_EXPIRES,
     JWT_REFRESH_TOKEN_EXPIRES
 )
 from ..utils.exceptions import AuthenticationError
 
+# Signing algorithms accepted for application tokens
+_JWT_ALGORITHMS = ('HS256',)
+
+# Shared pyjwt instance for decoding whose options are set once; tokens
+# without an exp claim are rejected as invalid
+_jwt_codec = jwt.PyJWT(options={'require': ['exp']})
+
+# JWT_SECRET_KEY encoded once on first use instead of read from the
+# environment per call
+_jwt_secret: Optional[bytes] = None
+
+# base64url of a fixed {"alg":"HS256","typ":"JWT"} header; pyjwt emits the
+# keys in the other order, so tokens differ bytewise but verify the same
+_JWT_HEADER_B64 = b'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9'
+
+# HMAC-SHA256 keyed with the signing secret on first use; copies share the
+# precomputed inner and outer key pads
+_jwt_hmac: Optional['hmac.HMAC'] = None
+
+# AES-256 algorithm bound to the decoded AES_KEY, built once on first use;
+# only needed to decrypt legacy CBC values
+_aes_algorithm: Optional[algorithms.AES] = None
+
+# AES-256-GCM cipher bound to the same key, built once on first use
+_aesgcm: Optional[AESGCM] = None
+
+# Marks AES-GCM values; ':' is outside the base64 alphabet, so legacy CBC
+# values can never start with it
+GCM_PREFIX = 'g1:'
+
+# Recommended nonce length for AES-GCM in bytes
+GCM_NONCE_SIZE = 12
+
+# Authentication tag length AESGCM appends to the ciphertext in bytes
+GCM_TAG_SIZE = 16
+
+# Upper bound on validated token payloads kept in memory
+JWT_CACHE_MAX_ENTRIES = 10000
+
+# Decoded payloads keyed by a 16-byte BLAKE2b digest of the token, least
+# recently used first; the raw token is never stored
+_jwt_cache: 'OrderedDict[bytes, Dict[str, Any]]' = OrderedDict()
+_jwt_cache_lock = threading.Lock()
+
+def _get_jwt_secret() -> bytes:
+    """
+    Return the JWT signing key, reading JWT_SECRET_KEY on first use.
+    
+    Returns:
+        bytes: UTF-8 encoded signing key
+        
+    Raises:
+        KeyError: If JWT_SECRET_KEY is not set
+    """
+    global _jwt_secret
+    if _jwt_secret is None:
+        _jwt_secret = os.environ['JWT_SECRET_KEY'].encode('utf-8')
+    return _jwt_secret
+
+def _get_jwt_hmac() -> 'hmac.HMAC':
+    """
+    Return the keyed HMAC-SHA256 template for signing, creating it on first use.
+    
+    Returns:
+        hmac.HMAC: Template to copy per signature; never updated directly
+        
+    Raises:
+        KeyError: If JWT_SECRET_KEY is not set
+    """
+    global _jwt_hmac
+    if _jwt_hmac is None:
+        _jwt_hmac = hmac.new(_get_jwt_secret(), digestmod=hashlib.sha256)
+    return _jwt_hmac
+
+def _b64url(data: bytes) -> bytes:
+    """Encode bytes as unpadded base64url, as used by JWS compact serialization."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+def _encode_hs256(payload: Dict[str, Any]) -> str:
+    """
+    Encode and sign a payload as an HS256 JWT.
+    
+    Produces a compact token that pyjwt verifies and decodes, reusing the
+    fixed header bytes and the keyed HMAC template.
+    
+    Args:
+        payload (Dict[str, Any]): Claims to encode
+    
+    Returns:
+        str: The encoded JWT token
+    """
+    signing_input = _JWT_HEADER_B64 + b'.' + _b64url(orjson.dumps(payload))
+    mac = _get_jwt_hmac().copy()
+    mac.update(signing_input)
+    return (signing_input + b'.' + _b64url(mac.digest())).decode('ascii')
+
+def _get_aes_algorithm() -> algorithms.AES:
+    """
+    Return the AES-256 algorithm for AES_KEY, decoding the key on first use.
+    
+    Returns:
+        algorithms.AES: Algorithm instance reused by every cipher
+        
+    Raises:
+        KeyError: If AES_KEY is not set
+    """
+    global _aes_algorithm
+    if _aes_algorithm is None:
+        _aes_algorithm = algorithms.AES(base64.b64decode(os.environ['AES_KEY']))
+    return _aes_algorithm
+
+def _get_aesgcm() -> AESGCM:
+    """
+    Return the AES-256-GCM cipher for AES_KEY, creating it on first use.
+    
+    Returns:
+        AESGCM: Cipher reused by every encryption and decryption
+        
+    Raises:
+        KeyError: If AES_KEY is not set
+    """
+    global _aesgcm
+    if _aesgcm is None:
+        _aesgcm = AESGCM(_get_aes_algorithm().key)
+    return _aesgcm
+
 def generate_jwt_token(payload: Dict[str, Any], is_refresh_token: bool = False) -> str:
     """
     Generate a new JWT token for authenticated users.
@@ -47,19 +180,17 @@ def generate_jwt_token(payload: Dict[str, Any], is_refresh_token: bool = False)
         AuthenticationError: If token generation fails
     """
     try:
-        # Add issued at timestamp
-        payload['iat'] = datetime.utcnow()
+        # Add issued at timestamp as integer epoch seconds, which pyjwt
+        # encodes without normalizing datetimes
+        now = int(time.time())
+        payload['iat'] = now
         
         # Calculate expiration based on token type
         expiration = JWT_REFRESH_TOKEN_EXPIRES if is_refresh_token else JWT_ACCESS_TOKEN_EXPIRES
-        payload['exp'] = datetime.utcnow() + timedelta(seconds=expiration)
+        payload['exp'] = now + expiration
         
         # Encode and sign token
-        return jwt.encode(
-            payload,
-            os.environ['JWT_SECRET_KEY'],
-            algorithm='HS256'
-        )
+        return _encode_hs256(payload)
     except Exception as e:
         raise AuthenticationError('AUTH001')
 
@@ -78,26 +209,45 @@ def validate_jwt_token(token: str) -> Dict[str, Any]:
     Raises:
         AuthenticationError: If token is invalid or expired
     """
+    # Serve previously verified tokens while their exp claim has not passed
+    key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(key)
+        if cached is not None:
+            _jwt_cache.move_to_end(key)
+    if cached is not None:
+        if cached['exp'] > time.time():
+            return dict(cached)
+        with _jwt_cache_lock:
+            _jwt_cache.pop(key, None)
+        raise AuthenticationError('AUTH002')
+    
     try:
-        payload = jwt.decode(
+        payload = _jwt_codec.decode(
             token,
-            os.environ['JWT_SECRET_KEY'],
-            algorithms=['HS256']
+            _get_jwt_secret(),
+            algorithms=_JWT_ALGORITHMS
         )
         
-        # Verify expiration
-        if datetime.fromtimestamp(payload['exp']) < datetime.utcnow():
+        # Verify expiration against epoch seconds, both in UTC
+        if payload['exp'] < int(time.time()):
             raise AuthenticationError('AUTH002')
-            
-        return payload
     except jwt.ExpiredSignatureError:
         raise AuthenticationError('AUTH002')
     except jwt.InvalidTokenError:
         raise AuthenticationError('AUTH001')
+    
+    # Only successfully verified tokens are cached; callers get copies so the
+    # cached payload cannot be mutated
+    with _jwt_cache_lock:
+        _jwt_cache[key] = payload
+        if len(_jwt_cache) > JWT_CACHE_MAX_ENTRIES:
+            _jwt_cache.popitem(last=False)
+    return dict(payload)
 
 def encrypt_sensitive_data(data: str) -> str:
     """
-    Encrypt sensitive data using AES-256.
+    Encrypt sensitive data using AES-256-GCM.
     
     Requirement: 10.2.2 Encryption Standards - AES-256 encryption implementation
     
@@ -105,28 +255,62 @@ def encrypt_sensitive_data(data: str) -> str:
         data (str): The data to encrypt
     
     Returns:
-        str: Base64 encoded encrypted data
+        str: GCM_PREFIX followed by the base64 encoded nonce and ciphertext
     """
     try:
-        # Generate a random 16-byte IV
-        iv = os.urandom(16)
-        
-        # Create cipher with AES-256
-        cipher = Cipher(
-            algorithms.AES(base64.b64decode(os.environ['AES_KEY'])),
-            modes.CBC(iv)
-        )
-        encryptor = cipher.encryptor()
+        # Generate a random 12-byte nonce
+        nonce = os.urandom(GCM_NONCE_SIZE)
         
-        # Add padding
-        padder = padding.PKCS7(algorithms.AES.block_size).padder()
-        padded_data = padder.update(data.encode()) + padder.finalize()
+        # Encrypt and authenticate in one call; no padding is needed
+        encrypted_data = _get_aesgcm().encrypt(nonce, data.encode(), None)
         
-        # Encrypt data
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+        # Combine nonce and ciphertext with tag and encode as base64
+        return GCM_PREFIX + base64.b64encode(nonce + encrypted_data).decode('utf-8')
+    except Exception as e:
+        raise RuntimeError(f"Encryption failed: {str(e)}")
+
+def max_encryptable_length(column_length: int) -> int:
+    """
+    Longest UTF-8 plaintext whose encrypt_sensitive_data output fits a column.
+    
+    The stored value is GCM_PREFIX followed by base64 of nonce, ciphertext
+    and tag, so every plaintext byte costs 4/3 characters plus fixed overhead.
+    
+    Requirement: 10.2.2 Encryption Standards - AES-256 encryption implementation
+    
+    Args:
+        column_length (int): Character capacity of the destination column
+    
+    Returns:
+        int: Maximum plaintext length in bytes
+    """
+    raw_capacity = (column_length - len(GCM_PREFIX)) // 4 * 3
+    return raw_capacity - GCM_NONCE_SIZE - GCM_TAG_SIZE
+
+def encrypt_sensitive_data_batch(values: Iterable[str]) -> List[str]:
+    """
+    Encrypt many values using AES-256-GCM with a single key setup.
+    
+    Requirement: 10.2.2 Encryption Standards - AES-256 encryption implementation
+    
+    Args:
+        values (Iterable[str]): The values to encrypt
+    
+    Returns:
+        List[str]: Encrypted values, in input order, in the same format as
+            encrypt_sensitive_data
+    """
+    try:
+        # Look up the shared cipher once for the whole batch
+        aesgcm = _get_aesgcm()
         
-        # Combine IV and encrypted data and encode as base64
-        return base64.b64encode(iv + encrypted_data).decode('utf-8')
+        results = []
+        for data in values:
+            # Each value still gets its own random nonce
+            nonce = os.urandom(GCM_NONCE_SIZE)
+            encrypted_data = aesgcm.encrypt(nonce, data.encode(), None)
+            results.append(GCM_PREFIX + base64.b64encode(nonce + encrypted_data).decode('utf-8'))
+        return results
     except Exception as e:
         raise RuntimeError(f"Encryption failed: {str(e)}")
 
@@ -134,27 +318,35 @@ def decrypt_sensitive_data(encrypted_data: str) -> str:
     """
     Decrypt AES-256 encrypted data.
     
+    Values carrying GCM_PREFIX are decrypted and authenticated with AES-GCM;
+    values written before the switch are decrypted as AES-CBC with PKCS7.
+    
     Requirement: 10.2.2 Encryption Standards - AES-256 decryption implementation
     
     Args:
-        encrypted_data (str): Base64 encoded encrypted data
+        encrypted_data (str): Encrypted data as produced by encrypt_sensitive_data
     
     Returns:
         str: Decrypted data string
     """
     try:
-        # Decode base64 data
-        raw_data = base64.b64decode(encrypted_data.encode('utf-8'))
+        if encrypted_data.startswith(GCM_PREFIX):
+            # Decode base64 data and split off the nonce; AESGCM.decrypt only
+            # accepts bytes, so both parts are sliced as bytes
+            raw_data = base64.b64decode(encrypted_data[len(GCM_PREFIX):].encode('utf-8'))
+            nonce = raw_data[:GCM_NONCE_SIZE]
+            return _get_aesgcm().decrypt(nonce, raw_data[GCM_NONCE_SIZE:], None).decode('utf-8')
+        
+        # Legacy CBC value: decode base64 data; the cipher context accepts any
+        # buffer, so the ciphertext is passed as a zero-copy view
+        raw_data = memoryview(base64.b64decode(encrypted_data.encode('utf-8')))
         
-        # Extract IV (first 16 bytes) and encrypted data
-        iv = raw_data[:16]
+        # Extract IV (first 16 bytes) and a zero-copy view of the encrypted data
+        iv = bytes(raw_data[:16])
         encrypted_content = raw_data[16:]
         
         # Create cipher for decryption
-        cipher = Cipher(
-            algorithms.AES(base64.b64decode(os.environ['AES_KEY'])),
-            modes.CBC(iv)
-        )
+        cipher = Cipher(_get_aes_algorithm(), modes.CBC(iv))
         decryptor = cipher.decryptor()
         
         # Decrypt data
@@ -177,4 +369,15 @@ def get_security_headers() -> Dict[str, str]:
     Returns:
         Dict[str, str]: Dictionary of security headers
     """
-    return SECURITY_HEADERS
\ No newline at end of file
+    return SECURITY_HEADERS
+
+def get_security_headers_items() -> Tuple[Tuple[str, str], ...]:
+    """
+    Get security headers as precomputed name/value pairs.
+    
+    Requirement: 10.3.2 Security Headers - Security header management
+    
+    Returns:
+        Tuple[Tuple[str, str], ...]: Immutable header pairs built at import time
+    """
+    return SECURITY_HEADERS_ITEMS
@@ -5,21 +5,63 @@ Human Tasks:
 1. Review email regex pattern with security team for compliance
 2. Verify maximum content length limits with product team
 3. Confirm character restrictions for project titles with UX team
+4. Optionally install google-re2 so email validation runs in linear time
 """
 
 # External imports
 import re  # version: 3.9+
 from typing import Dict, List  # version: 3.9+
 
+# Optional linear-time regex engine for email validation; RE2 never
+# backtracks, so adversarial addresses cannot trigger slow matching
+try:
+    import re2 as validation_re  # version: 1.0+
+except ImportError:
+    validation_re = re
+
 # Internal imports
 from .exceptions import ValidationError
-from .constants import MAX_BULLET_ITEMS
+from .constants import MAX_BULLET_ITEMS, EMAIL_COLUMN_LENGTH
+from .security import max_encryptable_length
 
 # Constants for validation
 MAX_TITLE_LENGTH: int = 100
 MAX_CONTENT_LENGTH: int = 5000
 TITLE_PATTERN: str = r'^[a-zA-Z0-9\s\-_\.]+$'
 EMAIL_PATTERN: str = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+# RFC 5321 forward path limit, capped by what users.email holds once encrypted
+MAX_EMAIL_LENGTH: int = min(254, max_encryptable_length(EMAIL_COLUMN_LENGTH))
+
+# Patterns compiled once at import rather than looked up per call
+TITLE_REGEX = re.compile(TITLE_PATTERN)
+EMAIL_REGEX = validation_re.compile(EMAIL_PATTERN)
+
+def _validate_content_text(content: str, error_code: str) -> None:
+    """
+    Shared presence, blankness and length checks for content fields.
+    
+    The length limit is tested on the raw string first, so content within the
+    limit is never copied by strip(); blank input is detected with isspace(),
+    which scans without allocating.
+    
+    Args:
+        content: The content to validate
+        error_code: Error code raised on failure
+        
+    Raises:
+        ValidationError: If content is missing, blank or too long
+    """
+    if not content or not isinstance(content, str):
+        raise ValidationError(error_code, {'content': ['Content is required']})
+    
+    # Only oversize input needs stripping to know its effective length
+    if len(content) > MAX_CONTENT_LENGTH and len(content.strip()) > MAX_CONTENT_LENGTH:
+        raise ValidationError(error_code, {
+            'content': [f'Content exceeds maximum length of {MAX_CONTENT_LENGTH} characters']
+        })
+    
+    if content.isspace():
+        raise ValidationError(error_code, {'content': ['Content cannot be empty']})
 
 def validate_project_title(title: str) -> bool:
     """
@@ -45,7 +87,7 @@ def validate_project_title(title: str) -> bool:
             'title': [f'Title must be between 1 and {MAX_TITLE_LENGTH} characters']
         })
     
-    if not re.match(TITLE_PATTERN, title):
+    if not TITLE_REGEX.match(title):
         raise ValidationError('PRJ001', {
             'title': ['Title contains invalid characters']
         })
@@ -67,18 +109,7 @@ def validate_specification_content(content: str) -> bool:
     Raises:
         ValidationError: If content is invalid with appropriate error code
     """
-    if not content or not isinstance(content, str):
-        raise ValidationError('SPEC001', {'content': ['Content is required']})
-    
-    content = content.strip()
-    if len(content) == 0:
-        raise ValidationError('SPEC001', {'content': ['Content cannot be empty']})
-    
-    if len(content) > MAX_CONTENT_LENGTH:
-        raise ValidationError('SPEC001', {
-            'content': [f'Content exceeds maximum length of {MAX_CONTENT_LENGTH} characters']
-        })
-    
+    _validate_content_text(content, 'SPEC001')
     return True
 
 def validate_bullet_item(content: str, order: int) -> bool:
@@ -97,17 +128,7 @@ def validate_bullet_item(content: str, order: int) -> bool:
     Raises:
         ValidationError: If content or order is invalid with appropriate error code
     """
-    if not content or not isinstance(content, str):
-        raise ValidationError('ITEM002', {'content': ['Content is required']})
-    
-    content = content.strip()
-    if len(content) == 0:
-        raise ValidationError('ITEM002', {'content': ['Content cannot be empty']})
-    
-    if len(content) > MAX_CONTENT_LENGTH:
-        raise ValidationError('ITEM002', {
-            'content': [f'Content exceeds maximum length of {MAX_CONTENT_LENGTH} characters']
-        })
+    _validate_content_text(content, 'ITEM002')
     
     if not isinstance(order, int):
         raise ValidationError('ITEM002', {'order': ['Order must be an integer']})
@@ -166,7 +187,8 @@ def validate_email(email: str) -> bool:
     if len(email) == 0:
         raise ValidationError('AUTH003', {'email': ['Email cannot be empty']})
     
-    if not re.match(EMAIL_PATTERN, email):
+    # Bound the input before matching so backtracking stays cheap without RE2
+    if len(email) > MAX_EMAIL_LENGTH or not EMAIL_REGEX.match(email):
         raise ValidationError('AUTH003', {'email': ['Invalid email format']})
     
     return True
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Gunicorn server settings and hooks, loaded automatically from the working directory.
+
+Human Tasks:
+1. Keep PROMETHEUS_MULTIPROC_DIR on a local filesystem writable by the app user
+2. Keep preloading disabled wherever workers are started with --reload
+"""
+
+# External imports
+import os  # version: 3.9+
+
+# Internal imports
+from app.database.session import engine
+from app.monitoring.metrics import mark_worker_dead
+
+# Load the application once in the master so workers share its memory
+# copy-on-write; disabled outside production, where --reload needs workers
+# to import the code themselves
+preload_app = os.getenv('FLASK_ENV', 'production') == 'production'
+
+def post_fork(server, worker) -> None:
+    """
+    Drop database connections inherited from the master after a preload.
+    
+    Requirement: 11.1 Environment Architecture - Production deployment performance
+    
+    Args:
+        server: Gunicorn arbiter
+        worker: Newly forked worker
+    """
+    engine.dispose()
+
+def child_exit(server, worker) -> None:
+    """
+    Drop the exited worker's live gauge samples from multiprocess metrics.
+    
+    Requirement: 11.5.2 Pipeline Stages - Performance metrics collection
+    
+    Args:
+        server: Gunicorn arbiter
+        worker: Worker that exited
+    """
+    mark_worker_dead(worker.pid)
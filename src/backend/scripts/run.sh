@@ -89,6 +89,10 @@ start_application() {
     case "$FLASK_ENV" in
         production)
             echo "Starting production server with Gunicorn..."
+            # Shared directory for Prometheus multiprocess metrics, reset on start
+            export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus_multiproc}
+            rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+            mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
             exec gunicorn \
                 --bind 0.0.0.0:8000 \
                 --workers $GUNICORN_WORKERS \
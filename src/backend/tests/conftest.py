@@ -0,0 +1,17 @@
+"""
+Shared pytest configuration for the backend unit tests.
+"""
+
+# External imports
+import sys
+from importlib.machinery import ModuleSpec
+from importlib.util import module_from_spec
+from pathlib import Path
+
+# Register the app package without executing app/__init__, which builds the
+# whole Flask application and its extensions; unit tests of standalone modules
+# such as app.utils.security only need the package path
+if 'app' not in sys.modules:
+    _app_package = module_from_spec(ModuleSpec('app', None, is_package=True))
+    _app_package.__path__ = [str(Path(__file__).resolve().parent.parent / 'app')]
+    sys.modules['app'] = _app_package
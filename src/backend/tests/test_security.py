@@ -0,0 +1,58 @@
+"""
+Unit tests for the encryption helpers in app.utils.security.
+"""
+
+# External imports
+import base64
+import os
+
+import pytest  # version: 6.0+
+from cryptography.hazmat.primitives import padding  # version: 37.0.0
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes  # version: 37.0.0
+
+# Internal imports
+from app.utils import security
+
+
+@pytest.fixture(autouse=True)
+def aes_key(monkeypatch):
+    """Provide a fresh AES_KEY and drop the ciphers cached from earlier tests."""
+    monkeypatch.setenv('AES_KEY', base64.b64encode(os.urandom(32)).decode('utf-8'))
+    monkeypatch.setattr(security, '_aes_algorithm', None)
+    monkeypatch.setattr(security, '_aesgcm', None)
+
+
+def test_encrypt_decrypt_round_trip():
+    """Values encrypted with AES-GCM decrypt back to the original string."""
+    encrypted = security.encrypt_sensitive_data('user@example.com')
+    
+    assert encrypted.startswith(security.GCM_PREFIX)
+    assert security.decrypt_sensitive_data(encrypted) == 'user@example.com'
+
+
+def test_encrypt_batch_round_trip():
+    """Batch-encrypted values decrypt individually in input order."""
+    values = ['first@example.com', 'second@example.com']
+    
+    encrypted = security.encrypt_sensitive_data_batch(values)
+    
+    assert [security.decrypt_sensitive_data(value) for value in encrypted] == values
+
+
+def test_decrypt_legacy_cbc_value():
+    """Unprefixed values written with AES-CBC and PKCS7 still decrypt."""
+    iv = os.urandom(16)
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    padded = padder.update(b'legacy@example.com') + padder.finalize()
+    encryptor = Cipher(security._get_aes_algorithm(), modes.CBC(iv)).encryptor()
+    legacy = base64.b64encode(iv + encryptor.update(padded) + encryptor.finalize()).decode('utf-8')
+    
+    assert security.decrypt_sensitive_data(legacy) == 'legacy@example.com'
+
+
+def test_max_encryptable_length_fits_column():
+    """The longest allowed plaintext fits the column and one more byte does not."""
+    limit = security.max_encryptable_length(255)
+    
+    assert len(security.encrypt_sensitive_data('a' * limit)) <= 255
+    assert len(security.encrypt_sensitive_data('a' * (limit + 1))) > 255
@@ -14,6 +14,10 @@ import os  # version: 3.9+
 
 # Internal imports
 from app import create_app
+# app.utils loads these lazily; importing them here compiles their patterns
+# before a preloading server forks
+from app.utils import helpers, security, validators  # noqa: F401
+from app.utils.exceptions import AuthenticationError
 from config import config_by_name
 
 # Get environment configuration - defaults to 'production' for safety
@@ -22,7 +26,26 @@ env = os.getenv('FLASK_ENV', 'production')
 # Create Flask application instance using environment-specific configuration
 # Requirement: 1.1 System Overview - Implements the Flask web server handling REST API requests
 # Requirement: 11.1 Environment Architecture - Provides WSGI application entry point for production deployment
-app = create_app(config_by_name[env]())
+app = create_app(config_by_name[env].from_env())
+
+def warmup() -> None:
+    """
+    Materialize lazily built module state before Gunicorn forks workers.
+    
+    With preload_app enabled this runs once in the master, so the compiled
+    validation patterns and the cached JWT signing key are shared with every
+    worker through copy-on-write pages instead of being rebuilt per worker.
+    
+    Requirement: 11.1 Environment Architecture - Production deployment performance
+    """
+    # Round-trip a dummy token so the signing key and pyjwt state are built;
+    # skipped when JWT_SECRET_KEY is not configured
+    try:
+        security.validate_jwt_token(security.generate_jwt_token({'type': 'warmup'}))
+    except AuthenticationError:
+        pass
+
+warmup()
 
 if __name__ == '__main__':
     # This section is only used for development